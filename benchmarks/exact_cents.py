@@ -0,0 +1,97 @@
+"""
+Modo exato em cêntimos (finance_core/cents.py) vs o cálculo em float.
+
+Mede, por chamada, os mesmos cálculos feitos nas aulas:
+- poupança linear de 2 cenários × 360 meses ("com e sem inflação");
+- poupança linear de 1000 cenários × 360 meses (um lote grande);
+- repartição 50/30/20 de um valor, como na aula (repartir_euros, de euros a
+  euros numa só passagem em inteiros).
+Para cada caso mostra a razão exato/float (o objetivo é ficar abaixo de 2×) e
+em quantos meses o total em float, arredondado ao cêntimo, difere da soma dos
+depósitos ao cêntimo.
+
+Uso:
+    python -m benchmarks.exact_cents            # tabela legível
+    python -m benchmarks.exact_cents --json     # resultados para comparar ramos
+"""
+import json
+import random
+import sys
+import timeit
+
+from finance_core.cents import (
+    acumulacao_linear_centimos, acumulacao_linear_exata, para_centimos, para_euros, repartir_euros,
+)
+from finance_core.kernels import acumulacao_linear
+
+MESES = 360
+LIMITE_RAZAO = 2.0
+
+
+def valores_mensais(quantos, semente=0):
+    """Poupanças mensais como as das aulas: objetivo / número de meses."""
+    aleatorio = random.Random(semente)
+    return [aleatorio.randrange(1000, 100001, 100) / aleatorio.randint(12, MESES) for _ in range(quantos)]
+
+
+def medir(funcao, repeticoes=7, numero=200):
+    """Melhor tempo médio por chamada (µs)."""
+    return min(timeit.repeat(funcao, number=numero, repeat=repeticoes)) / numero * 1e6
+
+
+def meses_com_desvio(valores):
+    """Meses em que o total em float, arredondado ao cêntimo, não é a soma dos depósitos ao cêntimo.
+
+    As duas versões acumulam os mesmos depósitos já arredondados ao cêntimo:
+    a diferença é só o desvio dos floats, não o arredondamento dos depósitos.
+    """
+    depositos = para_euros(para_centimos(valores))
+    flutuante = para_centimos(acumulacao_linear(depositos, MESES))
+    exato = acumulacao_linear_centimos(valores, MESES)
+    return int((flutuante != exato).sum()), flutuante.size
+
+
+def repartir_float(total, percentagens):
+    """A repartição antiga da aula 50/30/20, em float."""
+    return [total * p / 100 for p in percentagens]
+
+
+def main():
+    dois, lote = valores_mensais(2), valores_mensais(1000)
+    desvio, total_meses = meses_com_desvio(lote)
+    casos = {
+        "linear_2x360": (
+            lambda: acumulacao_linear(dois, MESES),
+            lambda: acumulacao_linear_exata(dois, MESES),
+        ),
+        "linear_1000x360": (
+            lambda: acumulacao_linear(lote, MESES),
+            lambda: acumulacao_linear_exata(lote, MESES),
+        ),
+        "repartir_1_valor": (
+            lambda: repartir_float(1234.57, [50, 30, 20]),
+            lambda: repartir_euros(1234.57, [50, 30, 20]),
+        ),
+    }
+
+    resultados = {}
+    for nome, (flutuante, exato) in casos.items():
+        float_us, exato_us = medir(flutuante), medir(exato)
+        resultados[nome] = {"float_us": float_us, "exato_us": exato_us, "razao": exato_us / float_us}
+    resultados["desvio"] = {"meses_com_desvio": desvio, "meses": total_meses}
+
+    if "--json" in sys.argv:
+        print(json.dumps(resultados, indent=2))
+        return
+
+    print(f"{'Caso':<20}{'float':>12}{'exato':>12}{'razão':>8}")
+    for nome, r in resultados.items():
+        if nome == "desvio":
+            continue
+        aviso = "" if r["razao"] <= LIMITE_RAZAO else f"  (acima de {LIMITE_RAZAO:.0f}×)"
+        print(f"{nome:<20}{r['float_us']:>10.2f}µs{r['exato_us']:>10.2f}µs{r['razao']:>7.2f}×{aviso}")
+    print(f"\nMeses em que o float se afasta do cêntimo depositado: {desvio} de {total_meses}")
+
+
+if __name__ == "__main__":
+    main()
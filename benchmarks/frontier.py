@@ -0,0 +1,77 @@
+"""
+Fronteira eficiente (finance_core/frontier.py): cálculo e redesenho por número de ativos.
+
+Para os 5 ativos da aula de risco e para conjuntos sintéticos de 20 e 50
+ativos (retornos a crescer com a volatilidade, correlações de um modelo de
+3 fatores), mede:
+- o cálculo a frio: a fronteira e a nuvem, feito uma vez por conjunto de ativos;
+- o redesenho: a fronteira já memorizada, o gráfico e a sua serialização em
+  JSON (o que o Streamlit envia ao browser). Objetivo: menos de 100 ms.
+
+Uso:
+    python -m benchmarks.frontier            # tabela legível
+    python -m benchmarks.frontier --json     # resultados para comparar ramos
+"""
+import json
+import sys
+import timeit
+
+import numpy as np
+
+from cap3.app2.app import universo
+from finance_core.frontier import fronteira
+from help_core.charts import grafico_fronteira
+
+ATIVOS = (20, 50)
+OBJETIVO_MS = 100
+
+
+def universo_sintetico(ativos, semente=1):
+    """Retornos, volatilidades e correlações (tuplos) de um conjunto de ativos inventado."""
+    rng = np.random.default_rng(semente)
+    volatilidades = rng.uniform(0.02, 0.30, ativos)
+    retornos = 0.01 + 0.25 * volatilidades + rng.normal(0, 0.01, ativos)
+    fatores = rng.normal(size=(ativos, 3))
+    covariancia = fatores @ fatores.T + np.diag(rng.uniform(0.5, 2.0, ativos))
+    desvios = np.sqrt(np.diag(covariancia))
+    correlacao = covariancia / np.outer(desvios, desvios)
+    return tuple(retornos), tuple(volatilidades), tuple(map(tuple, correlacao))
+
+
+def redesenhar(retornos, volatilidades, correlacao):
+    """Fronteira (memorizada), gráfico e JSON, como num rerun da aula."""
+    carteiras = fronteira(retornos, volatilidades, correlacao)
+    fig = grafico_fronteira(
+        (carteiras["nuvem"]["risco"] * 100, carteiras["nuvem"]["retorno"] * 100),
+        (carteiras["fronteira"]["risco"] * 100, carteiras["fronteira"]["retorno"] * 100),
+        {f"Ativo {i + 1}": (v * 100, r * 100) for i, (r, v) in enumerate(zip(retornos, volatilidades))},
+        titulo="Fronteira eficiente", eixo_x="Risco (%)", eixo_y="Retorno (%)",
+    )
+    return fig.to_json()
+
+
+def medir(universo_ativos, repeticoes=5):
+    """Tempo (ms) do cálculo a frio e melhor tempo de um redesenho."""
+    frio = min(timeit.repeat(lambda: fronteira.funcao(*universo_ativos), number=1, repeat=3)) * 1000
+    redesenhar(*universo_ativos)
+    redesenho = min(timeit.repeat(lambda: redesenhar(*universo_ativos), number=1, repeat=repeticoes)) * 1000
+    return {"frio_ms": frio, "redesenho_ms": redesenho,
+            "pontos_fronteira": len(fronteira(*universo_ativos)["fronteira"]["risco"])}
+
+
+def main():
+    resultados = {"aula_5": medir(universo())}
+    resultados.update({f"sintetico_{n}": medir(universo_sintetico(n)) for n in ATIVOS})
+
+    if "--json" in sys.argv:
+        print(json.dumps(resultados, indent=2))
+        return
+
+    print(f"{'Ativos':<16}{'a frio (ms)':>14}{'redesenho (ms)':>17}{'pontos':>9}")
+    for nome, r in resultados.items():
+        aviso = "" if r["redesenho_ms"] <= OBJETIVO_MS else f"  (acima de {OBJETIVO_MS} ms)"
+        print(f"{nome:<16}{r['frio_ms']:>14.1f}{r['redesenho_ms']:>17.1f}{r['pontos_fronteira']:>9}{aviso}")
+
+
+if __name__ == "__main__":
+    main()
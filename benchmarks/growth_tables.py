@@ -0,0 +1,71 @@
+"""
+Consulta às tabelas de fatores vs recalcular.
+
+Sorteia pontos da grelha dos sliders (taxa 0–15% em passos de 0,1%, prazo até
+70 anos) e mede, por chamada:
+- o valor final (`valor_futuro_tabelado` vs `summary.valor_futuro`);
+- a série completa (`serie_tabelada` vs `kernels.crescimento_com_aportes`);
+além do tempo e da memória para construir cada tabela.
+
+Uso:
+    python -m benchmarks.growth_tables            # tabela legível
+    python -m benchmarks.growth_tables --json     # resultados para comparar ramos
+"""
+import json
+import random
+import sys
+import timeit
+
+from finance_core import tables
+from finance_core.kernels import taxa_periodica, crescimento_com_aportes
+from finance_core.summary import valor_futuro
+
+PONTOS = 200
+NOMES = {1: "anual", 12: "mensal", 52: "semanal"}
+
+
+def pontos_da_grelha(periodos_ano, quantos=PONTOS, semente=0):
+    """Combinações (taxa anual, n) que os sliders podem produzir."""
+    aleatorio = random.Random(semente)
+    return [
+        (aleatorio.randint(0, 150) / 1000, aleatorio.randint(1, 70) * periodos_ano)
+        for _ in range(quantos)
+    ]
+
+
+def medir(funcao, pontos, repeticoes=5):
+    """Melhor tempo médio por chamada (µs) ao percorrer todos os pontos."""
+    tempos = timeit.repeat(lambda: [funcao(taxa, n) for taxa, n in pontos], number=1, repeat=repeticoes)
+    return min(tempos) / len(pontos) * 1e6
+
+
+def main():
+    resultados = {}
+    for periodos_ano in tables.PERIODICIDADES:
+        construir_ms = min(timeit.repeat(lambda: tables.construir_tabela(periodos_ano), number=1, repeat=3)) * 1000
+        tabela = tables.tabela(periodos_ano)
+        pontos = pontos_da_grelha(periodos_ano)
+        resultados[NOMES[periodos_ano]] = {
+            "construir_ms": construir_ms,
+            "memoria_mb": sum(a.nbytes for a in tabela.values()) / 1e6,
+            "final_tabela_us": medir(lambda taxa, n: tables.valor_futuro_tabelado(1000.0, 100.0, taxa, periodos_ano, n), pontos),
+            "final_calculo_us": medir(lambda taxa, n: valor_futuro(1000.0, 100.0, taxa_periodica(taxa, periodos_ano), n), pontos),
+            "serie_tabela_us": medir(lambda taxa, n: tables.serie_tabelada(1000.0, 100.0, taxa, periodos_ano, n), pontos),
+            "serie_calculo_us": medir(lambda taxa, n: crescimento_com_aportes(1000.0, 100.0, taxa_periodica(taxa, periodos_ano), n), pontos),
+        }
+
+    if "--json" in sys.argv:
+        print(json.dumps(resultados, indent=2))
+        return
+
+    print(f"{'Periodicidade':<14}{'construir':>10}{'memória':>10}{'final: tabela':>16}{'recalcular':>12}{'série: tabela':>16}{'recalcular':>12}")
+    for nome, r in resultados.items():
+        print(
+            f"{nome:<14}{r['construir_ms']:>8.1f}ms{r['memoria_mb']:>8.1f}MB"
+            f"{r['final_tabela_us']:>14.2f}µs{r['final_calculo_us']:>10.2f}µs"
+            f"{r['serie_tabela_us']:>14.2f}µs{r['serie_calculo_us']:>10.2f}µs"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Relatório do custo de importação de cada aula.
+
+Cada aula é importada num processo Python limpo, para que os tempos não
+dependam da ordem. Mede-se:
+- o tempo de `import capN.appM.app` (o que paga quem só abre a aula);
+- o tempo de carregar as bibliotecas pesadas (pandas, plotly) quando a aula
+  desenha o primeiro gráfico ou tabela, incluindo as que ficam nos módulos de
+  apoio que a aula importa (ex.: o plotly.graph_objects do help_core.charts).
+  As bibliotecas preguiçosas que outro módulo (ex.: o próprio streamlit) já
+  tinha importado aparecem como "já importado", sem tempo.
+
+Uso:
+    python -m benchmarks.import_times            # tabela legível
+    python -m benchmarks.import_times --json     # resultados para comparar ramos
+"""
+import json
+import subprocess
+import sys
+
+from help_core.lesson_registry import RAIZ, carregar_registo
+
+CODIGO_MEDICAO = """
+import json, sys, time
+antes = set(sys.modules)
+inicio = time.perf_counter()
+modulo = __import__({modulo!r}, fromlist=["run"])
+import_ms = (time.perf_counter() - inicio) * 1000
+from help_core.lazy_imports import LazyModule, relatorio_importacoes
+# A aula e todos os módulos que ela trouxe (help_core.charts, finance_core.result...)
+novos = [sys.modules[nome] for nome in set(sys.modules) - antes] + [modulo]
+preguicosos = [v for mod in novos for v in list(vars(mod).values()) if isinstance(v, LazyModule)]
+ja_carregadas = {{v._nome for v in preguicosos if v._nome in sys.modules}}
+for valor in preguicosos:
+    valor._carregar()
+print(json.dumps({{"import_ms": import_ms, "lazy_ms": dict(relatorio_importacoes()),
+                  "ja_carregadas": sorted(ja_carregadas)}}))
+"""
+
+
+def medir_aula(modulo):
+    """Importa uma aula num subprocesso e devolve os tempos medidos."""
+    saida = subprocess.run(
+        [sys.executable, "-c", CODIGO_MEDICAO.format(modulo=modulo)],
+        cwd=RAIZ, capture_output=True, text=True, check=True
+    )
+    return json.loads(saida.stdout.strip().splitlines()[-1])
+
+
+def main():
+    resultados = {}
+    for capitulo in carregar_registo()["chapters"]:
+        for sim in capitulo["simulations"]:
+            resultados[sim["module"]] = medir_aula(sim["module"])
+
+    if "--json" in sys.argv:
+        print(json.dumps(resultados, indent=2))
+        return
+
+    print(f"{'Aula':<18}{'import (ms)':>12}  bibliotecas preguiçosas (ms)")
+    for modulo, r in resultados.items():
+        libs = [f"{nome} {ms:.0f}" for nome, ms in r["lazy_ms"].items()]
+        libs += [f"{nome} (já importado)" for nome in r["ja_carregadas"]]
+        libs = ", ".join(libs) or "-"
+        print(f"{modulo:<18}{r['import_ms']:>12.1f}  {libs}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""
+Simulação de Monte Carlo (finance_core/montecarlo.py): tempo, memória e precisão.
+
+- Tempo de `leque` para 40 anos (480 meses) com 10 000 e 100 000 caminhos,
+  com passos mensais e anuais (um sorteio por ano, com a distribuição da soma
+  dos 12 meses, como na aula de risco), sempre num só processo. Objetivo:
+  menos de 200 ms num núcleo com passos anuais.
+- Pico de memória (tracemalloc) com 10 000 e 100 000 caminhos mensais durante
+  70 anos: com os blocos e os histogramas não deve depender dos caminhos (a
+  matriz completa de 100 000 caminhos teria cerca de 670 MB).
+- Precisão dos percentis dos histogramas face aos percentis exatos dos mesmos
+  caminhos (`leque_exato`), com o erro amostral do próprio Monte Carlo no P5
+  como referência.
+- Processos: tempo de 100 000 caminhos mensais com 1 processo e com os do
+  pool (`APP_MC_WORKERS`, por omissão um por núcleo), e confirmação de que os
+  percentis são os mesmos, bit a bit, com qualquer número de processos.
+
+Uso:
+    python -m benchmarks.monte_carlo            # tabela legível
+    python -m benchmarks.monte_carlo --json     # resultados para comparar ramos
+"""
+import json
+import sys
+import timeit
+import tracemalloc
+
+import numpy as np
+
+from finance_core.montecarlo import PERCENTIS, leque, leque_exato
+from finance_core.pool import PROCESSOS
+
+MESES = 480
+CAMINHOS = (10_000, 100_000)
+PASSOS = {"anual": 12, "mensal": 1}
+OBJETIVO_MS = 200
+ACOES = (1000.0, 0.06, 0.18)   # valor inicial, retorno e volatilidade anuais
+
+
+def medir(caminhos, meses_por_passo, repeticoes=3, processos=None):
+    """Melhor tempo (ms) de uma simulação completa."""
+    tempos = timeit.repeat(lambda: leque(*ACOES, MESES, caminhos, meses_por_passo, processos=processos),
+                           number=1, repeat=repeticoes)
+    return min(tempos) * 1000
+
+
+def identicos(caminhos, meses_por_passo, processos=(1, 2, 3, 8)):
+    """True se os percentis e a probabilidade de perda forem iguais, bit a bit, para cada número de processos."""
+    resultados = [leque(*ACOES, MESES, caminhos, meses_por_passo, processos=n) for n in processos]
+    base = resultados[0]
+    return all(
+        r["prob_perda"] == base["prob_perda"]
+        and all(np.array_equal(r["percentis"][p], base["percentis"][p]) for p in PERCENTIS)
+        for r in resultados[1:]
+    )
+
+
+def pico_memoria(funcao, *args):
+    """Pico de memória alocada (MB) durante uma chamada."""
+    tracemalloc.start()
+    funcao(*args)
+    pico = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return pico / 1e6
+
+
+def precisao(caminhos, meses_por_passo):
+    """Erro relativo (%) dos percentis em fluxo face aos exatos, nos mesmos caminhos."""
+    aproximado = leque(*ACOES, MESES, caminhos, meses_por_passo)["percentis"]
+    exato = leque_exato(*ACOES, MESES, caminhos, meses_por_passo)["percentis"]
+    erros = np.array([np.abs(aproximado[p][1:] / exato[p][1:] - 1) for p in PERCENTIS]) * 100
+    # Erro amostral do P5 no fim do prazo, em % do valor: sqrt(p(1−p)/N) / densidade, com o log normal
+    desvio = ACOES[2] * np.sqrt(MESES / 12)
+    erro_amostral = np.sqrt(0.05 * 0.95 / caminhos) / 0.1031 * desvio * 100
+    return {"erro_max_pct": float(erros.max()), "erro_medio_pct": float(erros.mean()),
+            "erro_amostral_p5_pct": float(erro_amostral)}
+
+
+def main():
+    resultados = {
+        "tempo_ms": {
+            f"{nome}_{caminhos}": medir(caminhos, passo, processos=1)
+            for nome, passo in PASSOS.items() for caminhos in CAMINHOS
+        },
+        "memoria_mb": {
+            f"mensal_70anos_{caminhos}": pico_memoria(leque, *ACOES, 840, caminhos, 1) for caminhos in CAMINHOS
+        },
+        "precisao": {
+            "anual_100000": precisao(100_000, 12),
+            "mensal_20000": precisao(20_000, 1),
+        },
+        "processos": {
+            "pool": PROCESSOS,
+            "mensal_100000_1_ms": medir(100_000, 1, processos=1),
+            "mensal_100000_pool_ms": medir(100_000, 1),
+            "identicos": identicos(100_000, 1),
+        },
+    }
+
+    if "--json" in sys.argv:
+        print(json.dumps(resultados, indent=2))
+        return
+
+    print(f"{'Tempo (1 processo)':<24}{'ms':>10}")
+    for nome, ms in resultados["tempo_ms"].items():
+        aviso = "" if ms <= OBJETIVO_MS or not nome.startswith("anual") else f"  (acima de {OBJETIVO_MS} ms)"
+        print(f"{nome:<24}{ms:>10.1f}{aviso}")
+    print(f"\n{'Pico de memória':<24}{'MB':>10}")
+    for nome, mb in resultados["memoria_mb"].items():
+        print(f"{nome:<24}{mb:>10.1f}")
+    print(f"\n{'Precisão (vs exato)':<24}{'erro máx.':>10}{'médio':>10}{'amostral P5':>14}")
+    for nome, r in resultados["precisao"].items():
+        print(f"{nome:<24}{r['erro_max_pct']:>9.3f}%{r['erro_medio_pct']:>9.3f}%{r['erro_amostral_p5_pct']:>13.2f}%")
+    r = resultados["processos"]
+    print(f"\n{'Processos (mensal 100k)':<24}{'ms':>10}")
+    print(f"{'1 processo':<24}{r['mensal_100000_1_ms']:>10.1f}")
+    pool = f"pool ({r['pool']} processos)"
+    print(f"{pool:<24}{r['mensal_100000_pool_ms']:>10.1f}")
+    print(f"Resultados idênticos com 1, 2, 3 e 8 processos: {'sim' if r['identicos'] else 'NÃO'}")
+
+
+if __name__ == "__main__":
+    main()
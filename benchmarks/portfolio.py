@@ -0,0 +1,56 @@
+"""
+Carteira com retornos correlacionados (finance_core/portfolio.py): tempo por simulação.
+
+Mede `leque_carteira` com os cinco ativos da aula de risco, os pesos e as
+correlações por omissão, durante 40 anos, para cada rebalanceamento do painel
+(nunca, anual, semestral e trimestral) e 10 000 e 50 000 caminhos. O passo é
+o da aula: o maior divisor comum entre o rebalanceamento e 12 meses.
+
+Uso:
+    python -m benchmarks.portfolio            # tabela legível
+    python -m benchmarks.portfolio --json     # resultados para comparar ramos
+"""
+import json
+import math
+import sys
+import timeit
+
+import numpy as np
+
+from cap3.app2.app import CORRELACOES, INVESTIMENTOS, REBALANCEAMENTO, VALORES_INICIAIS
+from finance_core.portfolio import leque_carteira
+
+MESES = 480
+CAMINHOS = (10_000, 50_000)
+RETORNOS = np.array(INVESTIMENTOS["Rendimento médio anual (%)"]) / 100
+VOLATILIDADES = np.array(INVESTIMENTOS["Volatilidade anual (%)"]) / 100
+
+
+def medir(rebalancear, caminhos, repeticoes=3):
+    """Melhor tempo (ms) de uma simulação completa da carteira por omissão."""
+    meses_por_passo = math.gcd(rebalancear, 12) if rebalancear else 12
+    tempos = timeit.repeat(
+        lambda: leque_carteira(1000.0, VALORES_INICIAIS["pesos"], RETORNOS, VOLATILIDADES, CORRELACOES,
+                               MESES, caminhos, meses_por_passo, rebalancear),
+        number=1, repeat=repeticoes,
+    )
+    return min(tempos) * 1000
+
+
+def main():
+    resultados = {
+        f"{REBALANCEAMENTO[meses]}_{caminhos}": medir(meses, caminhos)
+        for meses in REBALANCEAMENTO for caminhos in CAMINHOS
+    }
+
+    if "--json" in sys.argv:
+        print(json.dumps(resultados, indent=2))
+        return
+
+    print(f"{'Rebalanceamento / caminhos':<32}{'ms':>10}")
+    for nome, ms in resultados.items():
+        print(f"{nome:<32}{ms:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+"""
+Benchmark de latência ponta-a-ponta do main.py, em modo headless.
+
+Usa o harness de testes do Streamlit (streamlit.testing.v1.AppTest) para:
+- medir o arranque a frio do main.py (página inicial);
+- abrir cada capítulo (?pagina=capN);
+- abrir cada simulação (?pagina=capN/appM) e mover os seus widgets principais
+  (sliders, number inputs, selectboxes e radios) ao longo da sua gama.
+
+Por aula reporta o tempo de abertura, a latência p50/p95 de cada rerun e o
+pico de memória Python (tracemalloc) ao abrir a aula.
+
+As medições das aulas vão para uma base de dados temporária (APP_METRICS_DB),
+não para o metrics.sqlite3 do servidor. Depois do arranque a frio, espera que
+o pré-aquecimento termine antes de medir o resto, para que a thread de fundo
+não pese nas latências.
+
+Uso:
+    python -m benchmarks.rerun_latency                    # tabela legível
+    python -m benchmarks.rerun_latency --json out.json    # resultados para comparar ramos
+    python -m benchmarks.rerun_latency --pontos 8         # valores por widget (omissão: 5)
+"""
+import argparse
+import json
+import os
+import tempfile
+import threading
+import time
+import tracemalloc
+
+import numpy as np
+from streamlit.testing.v1 import AppTest
+
+from help_core.lesson_registry import RAIZ, carregar_registo
+
+MAIN = os.path.join(RAIZ, "main.py")
+TIMEOUT = 120
+
+
+def abrir(pagina=None):
+    """Cria um AppTest do main.py na página indicada e corre-o uma vez (devolve app e ms)."""
+    at = AppTest.from_file(MAIN, default_timeout=TIMEOUT)
+    if pagina:
+        at.query_params["pagina"] = pagina
+    inicio = time.perf_counter()
+    at.run()
+    return at, (time.perf_counter() - inicio) * 1000
+
+
+def valores_slider(w, pontos):
+    """Valores igualmente espaçados entre min e max, alinhados ao step do slider."""
+    if isinstance(w.value, (tuple, list)) or not isinstance(w.min, (int, float)):
+        return []
+    valores = np.linspace(w.min, w.max, pontos)
+    if w.step:
+        valores = w.min + np.round((valores - w.min) / w.step) * w.step
+    tipo = int if isinstance(w.value, int) else float
+    return [tipo(v) for v in dict.fromkeys(valores.tolist())]
+
+
+def valores_number_input(w, pontos):
+    """Múltiplos do valor inicial, respeitando min/max quando existem."""
+    base = w.value or w.step or 1
+    valores = [base * f for f in np.linspace(0.5, 3, pontos)]
+    if w.min is not None:
+        valores = [max(v, w.min) for v in valores]
+    if w.max is not None:
+        valores = [min(v, w.max) for v in valores]
+    tipo = int if isinstance(w.value, int) else float
+    return [tipo(v) for v in dict.fromkeys(valores)]
+
+
+def varrer_widgets(at, pontos):
+    """Move cada widget principal e devolve a latência (ms) de cada rerun."""
+    alvos = []
+    for w in at.slider:
+        alvos += [("slider", w.id, v) for v in valores_slider(w, pontos)]
+    for w in at.number_input:
+        alvos += [("number_input", w.id, v) for v in valores_number_input(w, pontos)]
+    for tipo in ("selectbox", "radio"):
+        for w in getattr(at, tipo):
+            alvos += [(tipo, w.id, v) for v in w.options]
+
+    latencias = []
+    for tipo, wid, valor in alvos:
+        # A árvore muda a cada rerun: voltar a procurar o widget pelo id
+        widget = next((w for w in getattr(at, tipo) if w.id == wid), None)
+        if widget is None or (tipo in ("selectbox", "radio") and valor not in widget.options):
+            continue
+        widget.set_value(valor)
+        inicio = time.perf_counter()
+        at.run()
+        latencias.append((time.perf_counter() - inicio) * 1000)
+        if at.exception:
+            break
+    return latencias
+
+
+def medir_aula(sim, pontos):
+    """Abre uma simulação, mede o pico de memória e a latência dos reruns."""
+    tracemalloc.start()
+    at, abrir_ms = abrir(sim["path"])
+    pico_kb = tracemalloc.get_traced_memory()[1] / 1024
+    tracemalloc.stop()
+
+    resultado = {"open_ms": abrir_ms, "peak_mem_kb": pico_kb}
+    if at.exception:
+        resultado["error"] = at.exception[0].message
+        return resultado
+
+    latencias = varrer_widgets(at, pontos)
+    resultado["reruns"] = len(latencias)
+    if latencias:
+        resultado["p50_ms"] = float(np.percentile(latencias, 50))
+        resultado["p95_ms"] = float(np.percentile(latencias, 95))
+    if at.exception:
+        resultado["error"] = at.exception[0].message
+    return resultado
+
+
+def esperar_aquecimento():
+    """Espera que a thread de pré-aquecimento (help_core/prewarm.py) termine."""
+    for thread in threading.enumerate():
+        if thread.name == "prewarm":
+            thread.join()
+
+
+def correr(pontos=5):
+    registo = carregar_registo()
+    resultados = {"cold_start_ms": abrir()[1]}
+    esperar_aquecimento()
+    resultados.update({"home_ms": abrir()[1], "chapters": {}, "lessons": {}})
+    for capitulo in registo["chapters"]:
+        resultados["chapters"][capitulo["path"]] = abrir(capitulo["path"])[1]
+        for sim in capitulo["simulations"]:
+            resultados["lessons"][sim["path"]] = medir_aula(sim, pontos)
+    return resultados
+
+
+def imprimir(resultados):
+    print(f"Arranque a frio: {resultados['cold_start_ms']:.0f} ms | página inicial: {resultados['home_ms']:.0f} ms")
+    print("Capítulos: " + ", ".join(f"{c} {ms:.0f} ms" for c, ms in resultados["chapters"].items()))
+    print(f"{'Aula':<12}{'abrir':>9}{'reruns':>8}{'p50':>9}{'p95':>9}{'memória':>12}")
+    for aula, r in resultados["lessons"].items():
+        p50 = f"{r['p50_ms']:>7.0f}ms" if "p50_ms" in r else f"{'-':>9}"
+        p95 = f"{r['p95_ms']:>7.0f}ms" if "p95_ms" in r else f"{'-':>9}"
+        print(
+            f"{aula:<12}{r['open_ms']:>7.0f}ms{r.get('reruns', 0):>8}{p50}{p95}"
+            f"{r['peak_mem_kb'] / 1024:>9.1f} MB"
+            + (f"  ⚠️ {r['error']}" if "error" in r else "")
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--json", metavar="FICHEIRO", help="escreve os resultados em JSON")
+    parser.add_argument("--pontos", type=int, default=5, help="valores testados por slider/number input")
+    args = parser.parse_args()
+
+    # Medições numa base de dados descartável (lida quando o main.py importa a instrumentação)
+    os.environ["APP_METRICS_DB"] = os.path.join(tempfile.mkdtemp(prefix="rerun_latency_"), "metrics.sqlite3")
+    resultados = correr(args.pontos)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(resultados, f, indent=2)
+    imprimir(resultados)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,4 @@
 import streamlit as st
-import pandas as pd
-import plotly.express as px
 
 # --- Informação da aplicação ---
 APP_INFO = {
@@ -1,8 +1,9 @@
 import streamlit as st
-import pandas as pd
-import plotly.express as px
 import random
-from help_clean.clean_question import clean_session_questions
+from help_core.lazy_imports import lazy_import
+from help_core.session_memory import estado_aula
+
+pd = lazy_import("pandas")
 
 # --- Informação da aplicação ---
 APP_INFO = {
@@ -67,8 +68,7 @@ PERGUNTAS0 = {
 
 def run():
     st.set_page_config(page_title="Será que és influenciado?", page_icon="🧠")
-
-    clean_session_questions()
+    estado = estado_aula(__name__)
 
     st.title(APP_INFO["title"])
     st.video(APP_INFO["video"])
@@ -76,23 +76,23 @@ def run():
 
 
     # Inicializar estado
-    if "index" not in st.session_state:
-        st.session_state.index = 0
-        st.session_state.respostas = []
+    if "index" not in estado:
+        estado.index = 0
+        estado.respostas = []
 
         # Selecionar 2 perguntas aleatórias por tema
         perguntas_selecionadas = []
         for tema, lista in PERGUNTAS0.items():
             perguntas_selecionadas.extend(random.sample(lista, 2))
         random.shuffle(perguntas_selecionadas)
-        st.session_state.perguntas = perguntas_selecionadas
+        estado.perguntas = perguntas_selecionadas
 
-    total = len(st.session_state.perguntas)
-    atual = st.session_state.index
+    total = len(estado.perguntas)
+    atual = estado.index
 
     # --- Mostrar perguntas ---
     if atual < total:
-        pergunta = st.session_state.perguntas[atual]
+        pergunta = estado.perguntas[atual]
 
         st.markdown(f"### Pergunta {atual + 1} de {total}")
         st.write(pergunta)
@@ -105,23 +105,23 @@ def run():
 
         # Botão "Próxima" para avançar
         if st.button("👉 Próxima"):
-            st.session_state.respostas.append(escolha)
-            st.session_state.index += 1
+            estado.respostas.append(escolha)
+            estado.index += 1
             st.rerun()
 
     # --- Resultados finais ---
     else:
         st.success("🎯 Terminaste o quiz!")
         df = pd.DataFrame({
-            "Pergunta": st.session_state.perguntas,
-            "Resposta": st.session_state.respostas
+            "Pergunta": estado.perguntas,
+            "Resposta": estado.respostas
         })
 
         st.markdown("### 🧾 As tuas respostas")
         st.dataframe(df, hide_index=True)
 
         # Contar respostas influenciadas
-        influenciadas = sum(resp in ["Sim", "Depende"] for resp in st.session_state.respostas)
+        influenciadas = sum(resp in ["Sim", "Depende"] for resp in estado.respostas)
 
         # Aviso ou elogio
         if influenciadas >= 5:
@@ -151,14 +151,14 @@ def run():
 
         # Botão para reiniciar o quiz
         if st.button("🔁 Recomeçar"):
-            st.session_state.index = 0
-            st.session_state.respostas = []
+            estado.index = 0
+            estado.respostas = []
             # Selecionar novas perguntas aleatórias
             perguntas_selecionadas = []
             for tema, lista in PERGUNTAS0.items():
                 perguntas_selecionadas.extend(random.sample(lista, 2))
             random.shuffle(perguntas_selecionadas)
-            st.session_state.perguntas = perguntas_selecionadas
+            estado.perguntas = perguntas_selecionadas
             st.rerun()
 
     st.caption("Projeto *Todos Contam* — Aprender a Gerir o Meu Dinheiro 🪙")
@@ -1,6 +1,8 @@
 import streamlit as st
-import pandas as pd
-import plotly.express as px
+from help_core.lazy_imports import lazy_import
+from help_core.session_memory import estado_aula
+
+pd = lazy_import("pandas")
 
 # --- Informação da aplicação ---
 APP_INFO = {
@@ -56,6 +58,7 @@ PRODUTOS = [
 
 def run():
     st.set_page_config(page_title="O que a sociedade nos impõe", page_icon="🧠")
+    estado = estado_aula(__name__)
 
     st.title(APP_INFO["title"])
     st.video(APP_INFO["video"])
@@ -64,12 +67,12 @@ def run():
 
 
     # Inicializar estado
-    if "index" not in st.session_state:
-        st.session_state.index = 0
-        st.session_state.respostas = []
+    if "index" not in estado:
+        estado.index = 0
+        estado.respostas = []
 
     total = len(PRODUTOS)
-    atual = st.session_state.index
+    atual = estado.index
 
     if atual < total:
         produto = PRODUTOS[atual]["nome"]
@@ -86,18 +89,18 @@ def run():
 
         if st.button("👉 Próximo"):
             resposta_limpa = "Necessidade" if "Necessidade" in escolha else "Desejo"
-            st.session_state.respostas.append({
+            estado.respostas.append({
                 "Produto": produto,
                 "Escolha": resposta_limpa,
                 "Correto": resposta_limpa == tipo_correto
             })
-            st.session_state.index += 1
+            estado.index += 1
             st.rerun()
 
     else:
         st.success("🎯 Terminaste o quiz! Vamos ver os teus resultados:")
 
-        df = pd.DataFrame(st.session_state.respostas)
+        df = pd.DataFrame(estado.respostas)
 
         st.markdown("### 🧾 Resultados")
         st.dataframe(df, hide_index=True)
@@ -116,8 +119,8 @@ def run():
         st.info("💡 Lembra-te: perceber o que é necessidade e o que é desejo é o primeiro passo para gerir melhor o teu dinheiro.")
         st.markdown("---")
         if st.button("🔁 Recomeçar"):
-            st.session_state.index = 0
-            st.session_state.respostas = []
+            estado.index = 0
+            estado.respostas = []
             st.rerun()
 
     st.caption("Projeto *Todos Contam* — Aprender a Gerir o Meu Dinheiro 🪙")
@@ -1,7 +1,9 @@
 import streamlit as st
-import pandas as pd
 import random
-from help_clean.clean_question import clean_session_questions
+from help_core.lazy_imports import lazy_import
+from help_core.session_memory import estado_aula
+
+pd = lazy_import("pandas")
 
 # --- Informação da aplicação ---
 APP_INFO = {
@@ -125,33 +127,30 @@ PERGUNTAS2 = {
 
 def run():
     st.set_page_config(page_title="Quiz da Mentalidade Financeira", page_icon="💭")
-
-
-    clean_session_questions()
-
+    estado = estado_aula(__name__)
 
     st.title(APP_INFO["title"])
     st.video(APP_INFO["video"])
     st.info(APP_INFO["description"])
 
     # Inicializar estado
-    if "index" not in st.session_state:
-        st.session_state.index = 0
-        st.session_state.respostas = []
+    if "index" not in estado:
+        estado.index = 0
+        estado.respostas = []
 
         # Selecionar 1 pergunta aleatória por tema (para tornar mais curto e dinâmico)
         perguntas_selecionadas = []
         for tema, lista in PERGUNTAS2.items():
             perguntas_selecionadas.append(random.choice(lista))
         random.shuffle(perguntas_selecionadas)
-        st.session_state.perguntas = perguntas_selecionadas
+        estado.perguntas = perguntas_selecionadas
 
-    total = len(st.session_state.perguntas)
-    atual = st.session_state.index
+    total = len(estado.perguntas)
+    atual = estado.index
 
     # --- Mostrar perguntas ---
     if atual < total:
-        pergunta = st.session_state.perguntas[atual]
+        pergunta = estado.perguntas[atual]
 
         st.markdown(f"### Pergunta {atual + 1} de {total}")
         st.write(pergunta["texto"])
@@ -164,16 +163,16 @@ def run():
 
         # Botão "Próxima" para avançar
         if st.button("👉 Próxima"):
-            st.session_state.respostas.append(escolha)
-            st.session_state.index += 1
+            estado.respostas.append(escolha)
+            estado.index += 1
             st.rerun()
 
     # --- Resultados finais ---
     else:
         st.success("🎯 Terminaste o quiz!")
         df = pd.DataFrame({
-            "Pergunta": [p["texto"] for p in st.session_state.perguntas],
-            "Resposta": st.session_state.respostas
+            "Pergunta": [p["texto"] for p in estado.perguntas],
+            "Resposta": estado.respostas
         })
 
         st.markdown("### 🧾 As tuas respostas")
@@ -183,16 +182,16 @@ def run():
         total_pontos = sum(
             PERGUNTAS2[tema][0]["opcoes"].get(resp, 0)
             if isinstance(PERGUNTAS2[tema][0], dict) else 0
-            for tema, resp in zip(PERGUNTAS2.keys(), st.session_state.respostas)
+            for tema, resp in zip(PERGUNTAS2.keys(), estado.respostas)
         )
 
         # Como as perguntas são randomizadas, precisamos mapear o score dinamicamente:
         pontuacao = 0
-        for i, resposta in enumerate(st.session_state.respostas):
-            opcoes = st.session_state.perguntas[i]["opcoes"]
+        for i, resposta in enumerate(estado.respostas):
+            opcoes = estado.perguntas[i]["opcoes"]
             pontuacao += opcoes[resposta]
 
-        total_max = len(st.session_state.perguntas) * 2
+        total_max = len(estado.perguntas) * 2
         st.metric("Pontuação total", f"{pontuacao} / {total_max}")
         st.divider()
 
@@ -221,13 +220,13 @@ def run():
 
         # Botão para reiniciar o quiz
         if st.button("🔁 Recomeçar"):
-            st.session_state.index = 0
-            st.session_state.respostas = []
+            estado.index = 0
+            estado.respostas = []
             perguntas_selecionadas = []
             for tema, lista in PERGUNTAS2.items():
                 perguntas_selecionadas.append(random.choice(lista))
             random.shuffle(perguntas_selecionadas)
-            st.session_state.perguntas = perguntas_selecionadas
+            estado.perguntas = perguntas_selecionadas
             st.rerun()
 
     st.caption("Projeto *Todos Contam* — Aprender a Gerir o Meu Dinheiro 🪙")
@@ -1,6 +1,10 @@
 import streamlit as st
-import pandas as pd
-import plotly.express as px
+from help_core.instrumentation import medidor
+from help_core.lazy_imports import lazy_import
+
+px = lazy_import("plotly.express")
+
+fase = medidor(__name__)
 
 # --- Informação da aplicação ---
 APP_INFO = {
@@ -28,11 +32,60 @@ APP_INFO = {
 }
 
 # --- Dados de reflexão (para gráfico) ---
-dados_reflexao = pd.DataFrame({
+dados_reflexao = {
     "Perfil": ["Ganha muito, gasta muito", "Ganha médio, poupa bem", "Ganha pouco, mas é constante"],
     "Poupança Média Mensal (€)": [50, 300, 150],
     "Estabilidade (0-10)": [3, 8, 7]
-})
+}
+
+@st.cache_data(show_spinner=False)
+def grafico_reflexao():
+    """Gráfico dos três perfis (os dados são fixos, por isso é igual para todos)."""
+    with fase("grafico"):
+        fig = px.scatter(
+            dados_reflexao,
+            x="Poupança Média Mensal (€)",
+            y="Estabilidade (0-10)",
+            text="Perfil",
+            size="Poupança Média Mensal (€)",
+            color="Estabilidade (0-10)",
+            color_continuous_scale="Greens",
+            template="plotly_white",
+        )
+        fig.update_traces(textposition="top center")
+        return fig
+
+
+def aquecer():
+    """Pré-calcula o gráfico dos perfis (chamado no arranque do servidor)."""
+    grafico_reflexao()
+
+
+@st.fragment
+def simulacao():
+    """Simulador de poupança mensal."""
+    # --- Simulador de poupança ---
+    st.divider()
+    st.markdown("### 🧮 E tu, quanto consegues poupar?")
+    col1, col2 = st.columns(2)
+    with col1:
+        rendimento = st.number_input("💵 Rendimento mensal (€)", min_value=0.0, value=1500.0, step=50.0)
+    with col2:
+        despesas = st.number_input("🧾 Despesas mensais (€)", min_value=0.0, value=1200.0, step=50.0)
+
+    poupanca = rendimento - despesas
+    percentagem = (poupanca / rendimento * 100) if rendimento > 0 else 0
+
+    if poupanca < 0:
+        st.error("⚠️ Estás a gastar mais do que ganhas — é hora de rever o teu orçamento.")
+    elif poupanca == 0:
+        st.warning("💸 Estás a equilibrar as contas, mas ainda não estás a poupar.")
+    else:
+        st.success(f"🎯 Consegues poupar **{poupanca:.2f} € por mês** ({percentagem:.1f}% do teu rendimento).")
+
+    st.progress(min(max(percentagem / 50, 0.0), 1.0))  # barra visual de progresso (50% como referência saudável)
+    st.caption("💡 Uma taxa de poupança acima de 20% é considerada excelente!")
+
 
 def run():
     st.set_page_config(page_title="O que é ser rico?", page_icon="💭")
@@ -60,42 +113,11 @@ def run():
 
     # --- Visual comparativo ---
     st.markdown("### 📊 Hábitos e estabilidade")
-    fig = px.scatter(
-        dados_reflexao,
-        x="Poupança Média Mensal (€)",
-        y="Estabilidade (0-10)",
-        text="Perfil",
-        size="Poupança Média Mensal (€)",
-        color="Estabilidade (0-10)",
-        color_continuous_scale="Greens",
-        template="plotly_white",
-    )
-    fig.update_traces(textposition="top center")
-    st.plotly_chart(fig, use_container_width=True)
+    st.plotly_chart(grafico_reflexao(), use_container_width=True)
 
     st.caption("💡 Quanto mais consistente fores a poupar, maior tende a ser a tua estabilidade financeira.")
 
-    # --- Simulador de poupança ---
-    st.divider()
-    st.markdown("### 🧮 E tu, quanto consegues poupar?")
-    col1, col2 = st.columns(2)
-    with col1:
-        rendimento = st.number_input("💵 Rendimento mensal (€)", min_value=0.0, value=1500.0, step=50.0)
-    with col2:
-        despesas = st.number_input("🧾 Despesas mensais (€)", min_value=0.0, value=1200.0, step=50.0)
-
-    poupanca = rendimento - despesas
-    percentagem = (poupanca / rendimento * 100) if rendimento > 0 else 0
-
-    if poupanca < 0:
-        st.error("⚠️ Estás a gastar mais do que ganhas — é hora de rever o teu orçamento.")
-    elif poupanca == 0:
-        st.warning("💸 Estás a equilibrar as contas, mas ainda não estás a poupar.")
-    else:
-        st.success(f"🎯 Consegues poupar **{poupanca:.2f} € por mês** ({percentagem:.1f}% do teu rendimento).")
-
-    st.progress(min(percentagem / 50, 1.0))  # barra visual de progresso (50% como referência saudável)
-    st.caption("💡 Uma taxa de poupança acima de 20% é considerada excelente!")
+    simulacao()
 
     # --- Conclusão ---
     st.divider()
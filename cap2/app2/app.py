@@ -1,7 +1,4 @@
 import streamlit as st
-import pandas as pd
-import plotly.express as px
-import numpy as np
 import math
 
 # --- Informação da aplicação ---
@@ -54,25 +51,9 @@ def formatar_tempo(anos_float):
         return f"{anos} anos e {meses} meses"
 
 
-def gerar_crescimento(poupanca_mensal, anos):
-    """Gera tabela de crescimento simples, sem juros."""
-    meses = int(anos * 12)
-    valores = [poupanca_mensal * i for i in range(1, meses + 1)]
-    df = pd.DataFrame({
-        "Mês": np.arange(1, meses + 1),
-        "Valor acumulado (€)": valores
-    })
-    return df
-
-
-# --- Aplicação principal ---
-def run():
-    st.set_page_config(page_title="Quanto preciso de poupar?", page_icon="🎯")
-
-    st.title(APP_INFO["title"])
-    st.video(APP_INFO["video"])
-    st.info(APP_INFO["description"])
-
+@st.fragment
+def simulacao():
+    """Objetivo, modo de cálculo e resultado."""
     # --- Escolher objetivo ---
     st.subheader("💡 Escolhe o teu objetivo")
     objetivo_tipo = st.selectbox(
@@ -100,7 +81,6 @@ def run():
     if modo == "Quanto preciso de poupar por mês":
         anos = st.slider("Prazo (anos)", min_value=1, max_value=30, value=5)
         poupanca_mensal = calcular_poupanca_mensal(preco, anos)
-        df = gerar_crescimento(poupanca_mensal, anos)
 
         st.success(
             f"""
@@ -120,7 +100,6 @@ def run():
         )
         anos = calcular_tempo(preco, poupanca_mensal)
         tempo_formatado = formatar_tempo(anos)
-        df = gerar_crescimento(poupanca_mensal, anos)
 
         st.success(
             f"""
@@ -129,6 +108,17 @@ def run():
             """
         )
 
+
+# --- Aplicação principal ---
+def run():
+    st.set_page_config(page_title="Quanto preciso de poupar?", page_icon="🎯")
+
+    st.title(APP_INFO["title"])
+    st.video(APP_INFO["video"])
+    st.info(APP_INFO["description"])
+
+    simulacao()
+
     st.info(
         "💡 Mesmo sem juros, a consistência é o segredo. Poupar todos os meses cria hábitos e resultados!"
     )
@@ -1,7 +1,12 @@
 import streamlit as st
-import pandas as pd
-import plotly.express as px
 import numpy as np
+from help_core.instrumentation import medidor
+from help_core.charts import grafico_linhas
+from finance_core.cents import acumulacao_linear_exata, para_centimos
+from finance_core.memo import memorizar
+from finance_core.result import Resultado
+
+fase = medidor(__name__)
 
 # --- Informação da aplicação ---
 APP_INFO = {
@@ -57,35 +62,49 @@ def formatar_tempo(meses_float):
         return f"{anos} anos e {meses} meses"
 
 
+@memorizar(casas={"meta": 2, "poupanca_mensal": 2})
 def gerar_progresso(meta, poupanca_mensal):
-    """Gera um DataFrame com o progresso mensal até atingir o fundo."""
-    meses = int(np.ceil(meta / poupanca_mensal))
-    valores = [min(poupanca_mensal * i, meta) for i in range(1, meses + 1)]
-    df = pd.DataFrame({
-        "Mês": np.arange(1, meses + 1),
-        "Fundo acumulado (€)": valores
-    })
-    return df
+    """Progresso mensal até atingir o fundo, em cêntimos exatos (um depósito igual por mês)."""
+    meses = -(-para_centimos(meta) // para_centimos(poupanca_mensal))
+    valores = acumulacao_linear_exata(poupanca_mensal, meses, limite=meta)
+    return Resultado("Mês", np.arange(1, meses + 1), {"Fundo acumulado (€)": valores})
 
 
-# --- Aplicação principal ---
-def run():
-    st.set_page_config(page_title="Fundo de Emergência", page_icon="🛟")
+# --- Valores iniciais dos widgets (usados também no pré-aquecimento do servidor) ---
+VALORES_INICIAIS = {"despesas_mensais": 1000.0, "meses_recomendados": 6, "poupanca_mensal": 200.0}
+
+
+@st.cache_data(max_entries=256, show_spinner=False)
+def grafico_progresso(meta, poupanca_mensal):
+    """Gráfico do progresso mensal até atingir o fundo."""
+    with fase("calculo"):
+        progresso = gerar_progresso(meta, poupanca_mensal)
+    with fase("grafico"):
+        return grafico_linhas({"Fundo acumulado (€)": progresso["Fundo acumulado (€)"]},
+                              titulo="Progresso até ao Fundo de Emergência",
+                              eixo_x="Mês", eixo_y="Fundo acumulado (€)",
+                              x=progresso["Mês"], marcadores=True)
+
+
+def aquecer():
+    """Pré-calcula o gráfico por omissão (chamado no arranque do servidor)."""
+    meta = calcular_fundo_emergencia(VALORES_INICIAIS["despesas_mensais"], VALORES_INICIAIS["meses_recomendados"])
+    grafico_progresso(meta, VALORES_INICIAIS["poupanca_mensal"])
 
-    st.title(APP_INFO["title"])
-    st.video(APP_INFO["video"])
-    st.info(APP_INFO["description"])
 
+@st.fragment
+def simulacao():
+    """Cálculo do fundo e gráfico do progresso."""
     st.subheader("💰 As tuas despesas e segurança")
 
     despesas_mensais = st.number_input(
         "Quanto gastas por mês em despesas essenciais (€)?",
-        min_value=0.0, step=50.0, value=1000.0
+        min_value=0.0, step=50.0, value=VALORES_INICIAIS["despesas_mensais"]
     )
 
     meses_recomendados = st.slider(
         "Quantos meses queres cobrir com o teu fundo?",
-        min_value=3, max_value=12, value=6,
+        min_value=3, max_value=12, value=VALORES_INICIAIS["meses_recomendados"],
         help="Regra geral: 3 a 6 meses é o ideal. Mais meses = mais segurança."
     )
 
@@ -102,23 +121,31 @@ def run():
 
     poupanca_mensal = st.number_input(
         "Quanto consegues poupar por mês (€)?",
-        min_value=10.0, step=10.0, value=200.0
+        min_value=10.0, step=10.0, value=VALORES_INICIAIS["poupanca_mensal"]
     )
 
     meses_necessarios = calcular_tempo_para_fundo(fundo_total, poupanca_mensal)
     tempo_formatado = formatar_tempo(meses_necessarios)
 
-    df = gerar_progresso(fundo_total, poupanca_mensal)
-
     st.success(
         f"⏳ A poupar **{poupanca_mensal:,.0f} € por mês**, "
         f"atingirás o teu fundo de emergência de **{fundo_total:,.0f} €** em cerca de **{tempo_formatado}**."
     )
 
-    fig = px.line(df, x="Mês", y="Fundo acumulado (€)",
-                  title="Progresso até ao Fundo de Emergência",
-                  markers=True)
-    st.plotly_chart(fig, use_container_width=True)
+    fig = grafico_progresso(fundo_total, poupanca_mensal)
+    with fase("render"):
+        st.plotly_chart(fig, use_container_width=True)
+
+
+# --- Aplicação principal ---
+def run():
+    st.set_page_config(page_title="Fundo de Emergência", page_icon="🛟")
+
+    st.title(APP_INFO["title"])
+    st.video(APP_INFO["video"])
+    st.info(APP_INFO["description"])
+
+    simulacao()
 
     st.info(
         """
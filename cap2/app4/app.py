@@ -1,7 +1,11 @@
 import streamlit as st
-import pandas as pd
-import plotly.express as px
-import numpy as np
+from help_core.instrumentation import medidor
+from help_core.charts import grafico_linhas
+from finance_core.cents import acumulacao_linear_exata
+from finance_core.memo import memorizar
+from finance_core.deflator import fator_precos
+
+fase = medidor(__name__)
 
 # --- Informação da aplicação ---
 APP_INFO = {
@@ -29,9 +33,10 @@ APP_INFO = {
 }
 
 # --- Funções auxiliares ---
+@memorizar(casas={"valor_atual": 2, "taxa_inflacao": 1})
 def valor_futuro_inflacao(valor_atual, taxa_inflacao, anos):
     """Calcula o valor futuro ajustado pela inflação."""
-    return valor_atual * ((1 + taxa_inflacao / 100) ** anos)
+    return valor_atual * fator_precos(taxa_inflacao / 100, 1, anos)
 
 
 def calcular_poupanca_mensal_sem_inflacao(objetivo, anos):
@@ -47,25 +52,42 @@ def calcular_poupanca_mensal_com_inflacao(objetivo, anos, taxa_inflacao):
     return objetivo_futuro / meses, objetivo_futuro
 
 
-def gerar_crescimento(poupanca_mensal, anos):
-    """Gera evolução da poupança (sem rendimentos)."""
-    meses = int(anos * 12)
-    valores = [poupanca_mensal * i for i in range(1, meses + 1)]
-    df = pd.DataFrame({
-        "Mês": np.arange(1, meses + 1),
-        "Valor acumulado (€)": valores
-    })
-    return df
+# --- Valores iniciais dos widgets (usados também no pré-aquecimento do servidor) ---
+VALORES_INICIAIS = {"preco": 10000.0, "anos": 5, "inflacao": 2.0}
 
 
-# --- Aplicação principal ---
-def run():
-    st.set_page_config(page_title="A inflação está a comer as tuas poupanças?", page_icon="💸")
+@st.cache_data(max_entries=256, show_spinner=False)
+def calcular_comparacao(preco, anos, inflacao):
+    """Poupança mensal com e sem inflação e gráfico comparativo."""
+    with fase("calculo"):
+        poupanca_sem = calcular_poupanca_mensal_sem_inflacao(preco, anos)
+        poupanca_com, objetivo_futuro = calcular_poupanca_mensal_com_inflacao(preco, anos, inflacao)
+
+        # Os dois cenários numa só passagem: uma linha por poupança mensal,
+        # depositada ao cêntimo como num banco
+        sem, com = acumulacao_linear_exata([poupanca_sem, poupanca_com], anos * 12)
+
+    with fase("grafico"):
+        fig = grafico_linhas(
+            {"Sem inflação": sem, "Com inflação": com},
+            titulo="Evolução da poupança: com e sem inflação",
+            eixo_x="Meses", eixo_y="Total acumulado (€)",
+        )
+
+        # Adicionar linha do preço ajustado
+        fig.add_hline(y=preco, line_dash="dot", annotation_text="Preço atual", annotation_position="bottom right")
+        fig.add_hline(y=objetivo_futuro, line_dash="dot", annotation_text="Preço futuro (com inflação)", annotation_position="top right")
+    return poupanca_sem, poupanca_com, objetivo_futuro, fig
+
+
+def aquecer():
+    """Pré-calcula o objetivo por omissão (Carro) no arranque do servidor."""
+    calcular_comparacao(**VALORES_INICIAIS)
 
-    st.title(APP_INFO["title"])
-    st.video(APP_INFO["video"])
-    st.info(APP_INFO["description"])
 
+@st.fragment
+def simulacao():
+    """Objetivo, inflação e gráfico comparativo."""
     # --- Escolher objetivo ---
     st.subheader("🎯 Define o teu objetivo")
     objetivo_tipo = st.selectbox(
@@ -77,31 +99,22 @@ def run():
         f"Preço atual do teu {objetivo_tipo.lower()} (€)",
         min_value=0.0,
         step=100.0,
-        value=10000.0 if objetivo_tipo == "Carro" else 2000.0
+        value=VALORES_INICIAIS["preco"] if objetivo_tipo == "Carro" else 2000.0
     )
 
-    anos = st.slider("Prazo para o objetivo (anos)", min_value=1, max_value=30, value=5)
+    anos = st.slider("Prazo para o objetivo (anos)", min_value=1, max_value=30, value=VALORES_INICIAIS["anos"])
 
     st.divider()
 
     # --- Taxa de inflação ---
     st.subheader("📈 Taxa de inflação")
-    inflacao = st.slider("Taxa média de inflação anual (%)", min_value=0.0, max_value=10.0, value=2.0, step=0.1)
+    inflacao = st.slider("Taxa média de inflação anual (%)", min_value=0.0, max_value=10.0, value=VALORES_INICIAIS["inflacao"], step=0.1)
     st.caption("ℹ️ Nota: A inflação média em Portugal nas últimas décadas tem rondado **~2% ao ano** (dados do INE).")
 
     st.divider()
 
     # --- Cálculos principais ---
-    poupanca_sem = calcular_poupanca_mensal_sem_inflacao(preco, anos)
-    poupanca_com, objetivo_futuro = calcular_poupanca_mensal_com_inflacao(preco, anos, inflacao)
-
-    df_sem = gerar_crescimento(poupanca_sem, anos)
-    df_sem["Cenário"] = "Sem inflação"
-
-    df_com = gerar_crescimento(poupanca_com, anos)
-    df_com["Cenário"] = "Com inflação"
-
-    df_total = pd.concat([df_sem, df_com])
+    poupanca_sem, poupanca_com, objetivo_futuro, fig = calcular_comparacao(preco, anos, inflacao)
 
     # --- Resultados ---
     st.success(
@@ -116,20 +129,19 @@ def run():
     )
 
     # --- Gráfico comparativo ---
-    fig = px.line(
-        df_total,
-        x="Mês",
-        y="Valor acumulado (€)",
-        color="Cenário",
-        title="Evolução da poupança: com e sem inflação",
-        labels={"Mês": "Meses", "Valor acumulado (€)": "Total acumulado (€)"},
-    )
+    with fase("render"):
+        st.plotly_chart(fig, use_container_width=True)
+
+
+# --- Aplicação principal ---
+def run():
+    st.set_page_config(page_title="A inflação está a comer as tuas poupanças?", page_icon="💸")
 
-    # Adicionar linha do preço ajustado
-    fig.add_hline(y=preco, line_dash="dot", annotation_text="Preço atual", annotation_position="bottom right")
-    fig.add_hline(y=objetivo_futuro, line_dash="dot", annotation_text="Preço futuro (com inflação)", annotation_position="top right")
+    st.title(APP_INFO["title"])
+    st.video(APP_INFO["video"])
+    st.info(APP_INFO["description"])
 
-    st.plotly_chart(fig, use_container_width=True)
+    simulacao()
 
     st.warning(
         "💡 A inflação **diminui o poder de compra** das tuas poupanças. "
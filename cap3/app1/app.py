@@ -1,7 +1,15 @@
 import streamlit as st
-import pandas as pd
-import plotly.express as px
 import numpy as np
+from help_core.instrumentation import medidor
+from help_core.charts import grafico_linhas
+from finance_core.kernels import taxa_periodica
+from finance_core.summary import valor_futuro
+from finance_core.tables import fatores_tabelados
+from finance_core.deflator import deflacionar_series, fator_precos
+from finance_core.memo import memorizar
+from finance_core.result import Resultado
+
+fase = medidor(__name__)
 
 # --- Informação da aplicação ---
 APP_INFO = {
@@ -29,98 +37,111 @@ APP_INFO = {
 }
 
 
+@memorizar(casas={"valor_inicial": 2, "rendimento_anual": 1, "inflacao_anual": 1})
 def simular_investimento(valor_inicial, anos, rendimento_anual, inflacao_anual):
     """Simula crescimento de dinheiro guardado vs investido ao longo dos anos."""
     meses = anos * 12
-    taxa_rendimento_mensal = (1 + rendimento_anual / 100) ** (1 / 12) - 1
-    taxa_inflacao_mensal = (1 + inflacao_anual / 100) ** (1 / 12) - 1
-
-    valores_investidos = []
-    valores_guardados = []
-    poder_compra_investimento = []
-    poder_compra_poupanca = []
-
-    valor_investido = valor_inicial
-    valor_guardado = valor_inicial
-
-    for mes in range(1, meses + 1):
-        valor_investido *= (1 + taxa_rendimento_mensal)
-        # valor guardado não rende
-        valor_guardado = valor_guardado
-        # ajusta ao poder de compra
-        valor_real_invest = valor_investido / ((1 + taxa_inflacao_mensal) ** mes)
-        valor_real_guard = valor_guardado / ((1 + taxa_inflacao_mensal) ** mes)
-
-        valores_investidos.append(valor_investido)
-        valores_guardados.append(valor_guardado)
-        poder_compra_investimento.append(valor_real_invest)
-        poder_compra_poupanca.append(valor_real_guard)
-
-    df = pd.DataFrame({
-        "Mês": np.arange(1, meses + 1),
+    valores_investidos = valor_inicial * fatores_tabelados(rendimento_anual / 100, 12, meses)
+    # valor guardado não rende
+    valores_guardados = np.full(meses, float(valor_inicial))
+    # ajusta ao poder de compra (as duas séries numa só divisão pelo índice de preços)
+    poder_compra_investimento, poder_compra_poupanca = deflacionar_series(
+        [valores_investidos, valores_guardados], inflacao_anual / 100, 12
+    )
+
+    return Resultado("Mês", np.arange(1, meses + 1), {
         "Investimento (€)": valores_investidos,
         "Guardar Dinheiro (€)": valores_guardados,
         "Investimento (valor real €)": poder_compra_investimento,
         "Guardar Dinheiro (valor real €)": poder_compra_poupanca
     })
-    return df
 
 
-def run():
-    st.set_page_config(page_title="Investir: a arma secreta contra a inflação", page_icon="📈")
-    st.title(APP_INFO["title"])
-    st.video(APP_INFO["video"])
-    st.info(APP_INFO["description"])
+# --- Valores iniciais dos widgets (usados também no pré-aquecimento do servidor) ---
+VALORES_INICIAIS = {"valor_inicial": 10000.0, "anos": 20, "rendimento": 7.0, "inflacao": 2.5}
+
+
+def valores_finais(valor_inicial, anos, rendimento, inflacao):
+    """Valores nominais e reais ao fim do prazo, sem construir a série mensal."""
+    meses = anos * 12
+    precos = fator_precos(inflacao / 100, 12, meses)
+    final_invest = valor_futuro(valor_inicial, 0.0, taxa_periodica(rendimento / 100, 12), meses)
+    return {
+        "final_invest": final_invest,
+        "final_poup": valor_inicial,
+        "real_invest": final_invest / precos,
+        "real_poup": valor_inicial / precos,
+    }
+
+
+@st.cache_data(max_entries=256, show_spinner=False)
+def calcular_cenario(valor_inicial, anos, rendimento, inflacao, real):
+    """Simula guardar vs investir e constrói o gráfico nominal ou o ajustado à inflação."""
+    with fase("calculo"):
+        resultado = simular_investimento(valor_inicial, anos, rendimento, inflacao)
+
+    with fase("grafico"):
+        if real:
+            colunas = ["Investimento (valor real €)", "Guardar Dinheiro (valor real €)"]
+            titulo, eixo_y = "Evolução do poder de compra (ajustado à inflação)", "Valor Real (€)"
+        else:
+            colunas = ["Investimento (€)", "Guardar Dinheiro (€)"]
+            titulo, eixo_y = "Evolução do valor ao longo do tempo (sem ajustar à inflação)", "Valor (€)"
+        return grafico_linhas(
+            {c: resultado[c] for c in colunas},
+            titulo=titulo, eixo_x="Mês", eixo_y=eixo_y, x=resultado["Mês"],
+        )
+
 
+def aquecer():
+    """Pré-calcula os dois gráficos do cenário por omissão (chamado no arranque do servidor)."""
+    calcular_cenario(**VALORES_INICIAIS, real=False)
+    calcular_cenario(**VALORES_INICIAIS, real=True)
+
+
+@st.fragment
+def simulacao():
+    """Cenário guardar vs investir e respetivos gráficos."""
     # --- Entradas ---
     st.subheader("💡 Define o teu cenário")
 
-    valor_inicial = st.number_input("Quanto tens atualmente (€)", min_value=100.0, value=10000.0, step=100.0)
-    anos = st.slider("Horizonte temporal (anos)", 1, 40, 20)
-    rendimento = st.slider("Rendimento médio anual do investimento (%)", 0.0, 15.0, 7.0, step=0.1)
-    inflacao = st.slider("Taxa de inflação média anual (%)", 0.0, 10.0, 2.5, step=0.1)
+    valor_inicial = st.number_input("Quanto tens atualmente (€)", min_value=100.0, value=VALORES_INICIAIS["valor_inicial"], step=100.0)
+    anos = st.slider("Horizonte temporal (anos)", 1, 40, VALORES_INICIAIS["anos"])
+    rendimento = st.slider("Rendimento médio anual do investimento (%)", 0.0, 15.0, VALORES_INICIAIS["rendimento"], step=0.1)
+    inflacao = st.slider("Taxa de inflação média anual (%)", 0.0, 10.0, VALORES_INICIAIS["inflacao"], step=0.1)
 
     st.caption("ℹ️ A inflação média em Portugal entre 2000 e 2023 foi de cerca de **2.1%** ao ano (INE).")
 
-    # --- Simulação ---
-    df = simular_investimento(valor_inicial, anos, rendimento, inflacao)
-
-    final_invest = df["Investimento (€)"].iloc[-1]
-    final_poup = df["Guardar Dinheiro (€)"].iloc[-1]
-    real_invest = df["Investimento (valor real €)"].iloc[-1]
-    real_poup = df["Guardar Dinheiro (valor real €)"].iloc[-1]
+    # --- Resultados (fórmula fechada) ---
+    finais = valores_finais(valor_inicial, anos, rendimento, inflacao)
 
     # --- Resultados ---
     st.success(
         f"""
         📊 Após **{anos} anos**:
-        - Se **guardares o dinheiro**, continuas com **{final_poup:,.0f} €**,  
-          mas o poder de compra real será de apenas **{real_poup:,.0f} €**.
-        - Se **investires**, terás **{final_invest:,.0f} €**,  
-          o que equivale a **{real_invest:,.0f} € em valor atual**.
+        - Se **guardares o dinheiro**, continuas com **{finais["final_poup"]:,.0f} €**,  
+          mas o poder de compra real será de apenas **{finais["real_poup"]:,.0f} €**.
+        - Se **investires**, terás **{finais["final_invest"]:,.0f} €**,  
+          o que equivale a **{finais["real_invest"]:,.0f} € em valor atual**.
         """
     )
 
-    # --- Gráficos ---
-    tabs = st.tabs(["💰 Valor Nominal", "📉 Valor Real (ajustado à inflação)"])
+    # --- Gráficos (só o do separador aberto é calculado) ---
+    tabs = st.tabs(["💰 Valor Nominal", "📉 Valor Real (ajustado à inflação)"], key="graficos_inflacao", on_change="rerun")
 
-    with tabs[0]:
-        fig1 = px.line(
-            df, x="Mês",
-            y=["Investimento (€)", "Guardar Dinheiro (€)"],
-            labels={"value": "Valor (€)", "variable": "Cenário"},
-            title="Evolução do valor ao longo do tempo (sem ajustar à inflação)"
-        )
-        st.plotly_chart(fig1, use_container_width=True)
-
-    with tabs[1]:
-        fig2 = px.line(
-            df, x="Mês",
-            y=["Investimento (valor real €)", "Guardar Dinheiro (valor real €)"],
-            labels={"value": "Valor Real (€)", "variable": "Cenário"},
-            title="Evolução do poder de compra (ajustado à inflação)"
-        )
-        st.plotly_chart(fig2, use_container_width=True)
+    for real, tab in enumerate(tabs):
+        if tab.open:
+            fig = calcular_cenario(valor_inicial, anos, rendimento, inflacao, bool(real))
+            with tab, fase("render"):
+                st.plotly_chart(fig, use_container_width=True)
+
+def run():
+    st.set_page_config(page_title="Investir: a arma secreta contra a inflação", page_icon="📈")
+    st.title(APP_INFO["title"])
+    st.video(APP_INFO["video"])
+    st.info(APP_INFO["description"])
+
+    simulacao()
 
     st.info(
         "💬 **Conclusão:** Guardar dinheiro parece seguro, mas com o tempo perdes poder de compra. "
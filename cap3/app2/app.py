@@ -1,6 +1,17 @@
+import math
 import streamlit as st
-import pandas as pd
-import plotly.express as px
+import numpy as np
+from help_core.instrumentation import medidor
+from help_core.charts import grafico_fronteira, grafico_leque
+from finance_core.frontier import fronteira
+from finance_core.kernels import taxa_periodica
+from finance_core.montecarlo import leque
+from finance_core.portfolio import leque_carteira, preparar_correlacao, volatilidade_carteira
+from finance_core.summary import valor_futuro
+from finance_core.memo import memorizar
+from finance_core.result import Resultado
+
+fase = medidor(__name__)
 
 # --- Informação da aplicação ---
 APP_INFO = {
@@ -29,22 +40,276 @@ APP_INFO = {
 }
 
 # --- Dados de exemplo sobre investimentos ---
-INVESTIMENTOS = pd.DataFrame({
+INVESTIMENTOS = {
     "Ativo": ["Poupança", "Obrigações", "Fundos Mistos", "Ações", "Imobiliário"],
     "Rendimento médio anual (%)": [1.5, 2.5, 4.0, 6.0, 5.0],
-    "Risco": ["Muito baixo", "Baixo", "Médio", "Alto", "Médio"]
-})
-
-# --- Simulação simples de crescimento ao longo de 10 anos ---
-def simular_crescimento(valor_inicial, anos, rendimento_anual):
-    """Simula crescimento de um investimento sem reinvestimentos adicionais."""
-    meses = anos * 12
-    crescimento = [valor_inicial * ((1 + rendimento_anual / 100) ** (meses / 12)) for _ in range(meses)]
-    df = pd.DataFrame({
-        "Mês": range(1, meses + 1),
-        "Valor (€)": crescimento
-    })
-    return df
+    "Risco": ["Muito baixo", "Baixo", "Médio", "Alto", "Médio"],
+    "Volatilidade anual (%)": [0.0, 4.0, 9.0, 18.0, 12.0]
+}
+
+# --- Correlação entre os ativos (1 = sobem e descem juntos, 0 = independentes) ---
+CORRELACOES = [
+    [1.0, 0.0, 0.0, 0.0, 0.0],
+    [0.0, 1.0, 0.5, 0.1, 0.2],
+    [0.0, 0.5, 1.0, 0.8, 0.5],
+    [0.0, 0.1, 0.8, 1.0, 0.5],
+    [0.0, 0.2, 0.5, 0.5, 1.0],
+]
+
+# --- Número de caminhos que o aluno pode simular ---
+CAMINHOS = [10_000, 25_000, 50_000, 100_000]
+CAMINHOS_CARTEIRA = [10_000, 25_000, 50_000]
+
+# --- De quantos em quantos meses a carteira volta aos pesos escolhidos ---
+REBALANCEAMENTO = {0: "Nunca", 12: "Todos os anos", 6: "A cada 6 meses", 3: "A cada 3 meses"}
+
+# --- Simulação com risco: muitos futuros possíveis para o mesmo ativo ---
+@memorizar(casas={"valor_inicial": 2, "rendimento_anual": 1, "volatilidade_anual": 1})
+def simular_risco(valor_inicial, anos, rendimento_anual, volatilidade_anual, caminhos):
+    """Percentis do valor no fim de cada ano e probabilidade de acabar com menos do que se investiu."""
+    simulacao = leque(valor_inicial, rendimento_anual / 100, volatilidade_anual / 100,
+                      anos * 12, caminhos, meses_por_passo=12)
+    percentis = Resultado("Ano", np.arange(anos + 1), {f"P{p}": v for p, v in simulacao["percentis"].items()})
+    return percentis, simulacao["prob_perda"]
+
+
+# --- Carteira: vários ativos com retornos correlacionados ---
+@memorizar(casas={"valor_inicial": 2})
+def simular_carteira(valor_inicial, anos, pesos, correlacao, rebalancear, caminhos):
+    """Percentis do valor da carteira no fim de cada ano e probabilidade de acabar a perder dinheiro."""
+    # Passos do tamanho do maior divisor comum entre o rebalanceamento e o ano: exatos e o menos possível
+    meses_por_passo = math.gcd(rebalancear, 12) if rebalancear else 12
+    simulacao = leque_carteira(
+        valor_inicial, pesos,
+        np.array(INVESTIMENTOS["Rendimento médio anual (%)"]) / 100,
+        np.array(INVESTIMENTOS["Volatilidade anual (%)"]) / 100,
+        correlacao, anos * 12, caminhos, meses_por_passo, rebalancear,
+    )
+    por_ano = 12 // meses_por_passo
+    percentis = Resultado("Ano", np.arange(anos + 1), {f"P{p}": v[::por_ano] for p, v in simulacao["percentis"].items()})
+    return percentis, simulacao["prob_perda"]
+
+
+# --- Valores iniciais dos widgets (usados também no pré-aquecimento do servidor) ---
+VALORES_INICIAIS = {"ativo": "Poupança", "valor_inicial": 1000.0, "anos": 10,
+                    "pesos": [10, 30, 20, 30, 10], "rebalancear": 0}
+
+
+def calcular_valor_final(valor_inicial, anos, rendimento):
+    """Valor final do investimento no ativo escolhido (fórmula fechada, sem série)."""
+    with fase("calculo"):
+        return valor_futuro(valor_inicial, 0.0, taxa_periodica(rendimento / 100, 12), anos * 12)
+
+
+def grafico_risco(percentis, valor_inicial, caminhos):
+    """Gráfico em leque dos percentis, com uma linha no valor investido."""
+    fig = grafico_leque(
+        percentis["Ano"], {p: percentis[f"P{p}"] for p in (5, 25, 50, 75, 95)},
+        titulo=f"Valores possíveis em {caminhos:,} simulações",
+        eixo_x="Ano", eixo_y="Valor (€)",
+    )
+    fig.add_hline(y=valor_inicial, line_dash="dot", annotation_text="Valor investido", annotation_position="bottom right")
+    return fig
+
+
+@st.cache_data(max_entries=256, show_spinner=False)
+def calcular_risco(valor_inicial, anos, rendimento, volatilidade, caminhos):
+    """Simulação de Monte Carlo do ativo e gráfico em leque dos valores possíveis."""
+    with fase("calculo"):
+        percentis, prob_perda = simular_risco(valor_inicial, anos, rendimento, volatilidade, caminhos)
+
+    with fase("grafico"):
+        fig = grafico_risco(percentis, valor_inicial, caminhos)
+    finais = {p: percentis[f"P{p}"][-1] for p in (5, 50, 95)}
+    return fig, prob_perda, finais
+
+
+@st.cache_data(max_entries=256, show_spinner=False)
+def calcular_carteira(valor_inicial, anos, pesos, correlacao, rebalancear, caminhos):
+    """Simulação da carteira, gráfico em leque e volatilidade anual da carteira."""
+    with fase("calculo"):
+        percentis, prob_perda = simular_carteira(valor_inicial, anos, pesos, correlacao, rebalancear, caminhos)
+        volatilidade = volatilidade_carteira(np.array(pesos) / sum(pesos), INVESTIMENTOS["Volatilidade anual (%)"], correlacao)
+
+    with fase("grafico"):
+        fig = grafico_risco(percentis, valor_inicial, caminhos)
+    finais = {p: percentis[f"P{p}"][-1] for p in (5, 50, 95)}
+    return fig, prob_perda, finais, volatilidade
+
+
+def universo():
+    """Retornos, volatilidades e correlações da tabela, em taxas decimais e tuplos (a chave da fronteira)."""
+    return (tuple(r / 100 for r in INVESTIMENTOS["Rendimento médio anual (%)"]),
+            tuple(v / 100 for v in INVESTIMENTOS["Volatilidade anual (%)"]),
+            tuple(map(tuple, CORRELACOES)))
+
+
+@st.cache_data(max_entries=256, show_spinner=False)
+def calcular_fronteira(retornos, volatilidades, correlacao):
+    """Fronteira eficiente do conjunto de ativos, desenhada sobre a nuvem de carteiras possíveis."""
+    with fase("calculo"):
+        carteiras = fronteira(retornos, volatilidades, correlacao)
+
+    with fase("grafico"):
+        fig = grafico_fronteira(
+            (carteiras["nuvem"]["risco"] * 100, carteiras["nuvem"]["retorno"] * 100),
+            (carteiras["fronteira"]["risco"] * 100, carteiras["fronteira"]["retorno"] * 100),
+            {a: (v * 100, r * 100) for a, r, v in zip(INVESTIMENTOS["Ativo"], retornos, volatilidades)},
+            titulo="O maior retorno possível para cada nível de risco",
+            eixo_x="Risco (volatilidade anual, %)", eixo_y="Rendimento médio anual (%)",
+        )
+    return fig
+
+
+def carteira_clicada(pontos, retornos, volatilidades, correlacao):
+    """Nome, pesos, retorno e risco do último ponto clicado.
+
+    Sem clique, mostra a carteira da fronteira com mais rendimento extra (acima da
+    de menor risco) por cada ponto de risco.
+    """
+    carteiras = fronteira(retornos, volatilidades, correlacao)
+    if pontos:
+        curva, i = pontos[-1]["curve_number"], pontos[-1]["point_index"]
+    else:
+        f = carteiras["fronteira"]
+        extra = np.divide(f["retorno"] - f["retorno"][0], f["risco"], out=np.zeros(len(f["risco"])), where=f["risco"] > 0)
+        curva, i = 1, int(np.argmax(extra))
+    if curva == 2:
+        return f"Só {INVESTIMENTOS['Ativo'][i]}", np.eye(len(retornos))[i], retornos[i], volatilidades[i]
+    if curva == 0:
+        grupo, nome = carteiras["nuvem"], "Carteira ao acaso"
+    else:
+        grupo, nome = carteiras["fronteira"], "Carteira da fronteira" if pontos else "Carteira com mais rendimento por risco"
+    return nome, grupo["pesos"][i], grupo["retorno"][i], grupo["risco"][i]
+
+
+def aquecer():
+    """Pré-calcula a simulação com risco por omissão (chamado no arranque do servidor)."""
+    i = INVESTIMENTOS["Ativo"].index(VALORES_INICIAIS["ativo"])
+    calcular_risco(VALORES_INICIAIS["valor_inicial"], VALORES_INICIAIS["anos"],
+                   INVESTIMENTOS["Rendimento médio anual (%)"][i], INVESTIMENTOS["Volatilidade anual (%)"][i], CAMINHOS[0])
+
+
+def carteira(valor_inicial, anos):
+    """Construtor de carteira: pesos, correlações e rebalanceamento."""
+    ativos = INVESTIMENTOS["Ativo"]
+    st.markdown(
+        "Em vez de pôr tudo num só ativo, divide o dinheiro por vários. Como os ativos não sobem e descem "
+        "todos ao mesmo tempo, o risco da carteira pode ser menor do que o de cada ativo."
+    )
+    colunas = st.columns(len(ativos))
+    pesos = tuple(
+        coluna.number_input(f"{ativo} (%)", min_value=0, max_value=100, value=VALORES_INICIAIS["pesos"][i],
+                            step=5, key=f"peso_carteira_{i}")
+        for i, (coluna, ativo) in enumerate(zip(colunas, ativos))
+    )
+    if not sum(pesos):
+        st.warning("Escolhe pelo menos um ativo com peso maior do que 0%.")
+        return
+    if sum(pesos) != 100:
+        st.caption(f"Os pesos somam {sum(pesos)}%: a simulação usa-os na mesma proporção.")
+
+    st.markdown("**Correlações entre os ativos** (podes editá-las: 1 = sobem e descem juntos, 0 = independentes, −1 = opostos)")
+    editadas = st.data_editor(
+        {"Ativo": ativos, **{a: [linha[j] for linha in CORRELACOES] for j, a in enumerate(ativos)}},
+        disabled=["Ativo"], hide_index=True, key="correlacoes_carteira",
+        column_config={a: st.column_config.NumberColumn(min_value=-1.0, max_value=1.0, step=0.05, format="%.2f") for a in ativos},
+    )
+    st.caption("Cada correlação vale nos dois sentidos: mudar a de A com B muda também a de B com A.")
+    correlacao, ajustada = preparar_correlacao(CORRELACOES, [[editadas[a][i] for a in ativos] for i in range(len(ativos))])
+    if ajustada:
+        st.warning("Estas correlações não são possíveis ao mesmo tempo (ou a diagonal não é 1): usamos a matriz válida mais próxima.")
+
+    col1, col2 = st.columns(2)
+    rebalancear = col1.select_slider("Rebalancear a carteira", options=list(REBALANCEAMENTO),
+                                     value=VALORES_INICIAIS["rebalancear"], format_func=REBALANCEAMENTO.get)
+    caminhos = col2.select_slider("Número de simulações da carteira", options=CAMINHOS_CARTEIRA,
+                                  value=CAMINHOS_CARTEIRA[0], format_func=lambda n: f"{n:,}")
+    fig, prob_perda, finais, volatilidade = calcular_carteira(valor_inicial, anos, pesos, correlacao, rebalancear, caminhos)
+
+    col1, col2, col3 = st.columns(3)
+    col1.metric("Probabilidade de perder dinheiro", f"{prob_perda:.1%}")
+    col2.metric("Cenário típico (mediana)", f"{finais[50]:,.0f} €")
+    col3.metric("Volatilidade da carteira", f"{volatilidade:.1f}%")
+    st.caption(f"90% dos casos acabam entre {finais[5]:,.0f} € e {finais[95]:,.0f} €.")
+    with fase("render"):
+        st.plotly_chart(fig, width="stretch")
+
+
+@st.fragment
+def simulacao():
+    """Simulação do ativo escolhido."""
+    # --- Selecionar investimento para simulação ---
+    st.subheader("💰 Simula o crescimento de um investimento")
+    ativo = st.selectbox("Escolhe um ativo", INVESTIMENTOS["Ativo"], index=INVESTIMENTOS["Ativo"].index(VALORES_INICIAIS["ativo"]))
+    valor_inicial = st.number_input("Quanto queres investir (€)", min_value=100.0, value=VALORES_INICIAIS["valor_inicial"], step=100.0)
+    anos = st.slider("Horizonte temporal (anos)", min_value=1, max_value=40, value=VALORES_INICIAIS["anos"])
+    
+    i = INVESTIMENTOS["Ativo"].index(ativo)
+    rendimento = INVESTIMENTOS["Rendimento médio anual (%)"][i]
+    volatilidade = INVESTIMENTOS["Volatilidade anual (%)"][i]
+
+    final_valor = calcular_valor_final(valor_inicial, anos, rendimento)
+
+    st.success(
+        f"Se investires **{valor_inicial:,.0f} €** em **{ativo}** durante **{anos} anos**, com rendimento médio anual de **{rendimento:.1f}%**, terás aproximadamente **{final_valor:,.0f} €**."
+    )
+
+    # --- Monte Carlo (só calculado com o painel aberto) ---
+    painel = st.expander("🎲 E se o rendimento variar? Simulação com risco", expanded=True, key="risco_monte_carlo", on_change="rerun")
+    if painel.open:
+        with painel:
+            if volatilidade:
+                st.markdown(
+                    f"O rendimento de **{ativo}** não é igual todos os anos: varia, em média, "
+                    f"**{volatilidade:.0f}%** para cima ou para baixo. Simulamos milhares de futuros possíveis."
+                )
+            else:
+                st.markdown(f"O rendimento de **{ativo}** é praticamente garantido: todos os futuros simulados são iguais.")
+            caminhos = st.select_slider("Número de simulações", options=CAMINHOS, value=CAMINHOS[0],
+                                        format_func=lambda n: f"{n:,}")
+            fig, prob_perda, finais = calcular_risco(valor_inicial, anos, rendimento, volatilidade, caminhos)
+
+            col1, col2, col3 = st.columns(3)
+            col1.metric("Probabilidade de perder dinheiro", f"{prob_perda:.1%}")
+            col2.metric("Cenário típico (mediana)", f"{finais[50]:,.0f} €")
+            col3.metric("90% dos casos entre", f"{finais[5]:,.0f} – {finais[95]:,.0f} €")
+            with fase("render"):
+                st.plotly_chart(fig, width="stretch")
+
+    # --- Carteira com vários ativos (só calculada com o painel aberto) ---
+    painel = st.expander("🧺 E se dividires o dinheiro por vários ativos? Carteira", expanded=False,
+                         key="carteira_monte_carlo", on_change="rerun")
+    if painel.open:
+        with painel:
+            carteira(valor_inicial, anos)
+
+
+@st.fragment
+def fronteira_eficiente():
+    """Explorador da fronteira eficiente: clicar num ponto mostra a carteira."""
+    painel = st.expander("🎯 Fronteira eficiente: a melhor carteira para cada nível de risco", expanded=False,
+                         key="fronteira_eficiente", on_change="rerun")
+    if not painel.open:
+        return
+    with painel:
+        st.markdown(
+            "Cada ponto cinzento é uma forma de dividir o dinheiro pelos ativos da tabela. A linha azul junta as "
+            "carteiras **eficientes**: nenhuma outra dá mais rendimento com o mesmo risco. "
+            "Clica num ponto para ver como está dividida."
+        )
+        retornos, volatilidades, correlacao = universo()
+        fig = calcular_fronteira(retornos, volatilidades, correlacao)
+        with fase("render"):
+            evento = st.plotly_chart(fig, width="stretch", on_select="rerun", selection_mode="points",
+                                     key="grafico_fronteira")
+
+        nome, pesos, retorno, risco = carteira_clicada(evento.selection.points, retornos, volatilidades, correlacao)
+        st.markdown(f"**{nome}**: rendimento médio de **{retorno:.2%}** por ano, com volatilidade de **{risco:.1%}**.")
+        usados = np.flatnonzero(pesos >= 0.0005)
+        st.dataframe({"Ativo": [INVESTIMENTOS["Ativo"][i] for i in usados],
+                      "Peso (%)": np.round(pesos[usados] * 100, 1)}, hide_index=True)
+
 
 def run():
     st.set_page_config(page_title="Risco e investimentos", page_icon="💡")
@@ -60,20 +325,8 @@ def run():
         "💡 Dica: geralmente, quanto maior o risco, maior o retorno potencial — mas cuidado com perdas possíveis."
     )
 
-    # --- Selecionar investimento para simulação ---
-    st.subheader("💰 Simula o crescimento de um investimento")
-    ativo = st.selectbox("Escolhe um ativo", INVESTIMENTOS["Ativo"])
-    valor_inicial = st.number_input("Quanto queres investir (€)", min_value=100.0, value=1000.0, step=100.0)
-    anos = st.slider("Horizonte temporal (anos)", min_value=1, max_value=40, value=10)
-    
-    rendimento = INVESTIMENTOS.loc[INVESTIMENTOS["Ativo"] == ativo, "Rendimento médio anual (%)"].values[0]
-
-    df_crescimento = simular_crescimento(valor_inicial, anos, rendimento)
-    final_valor = df_crescimento["Valor (€)"].iloc[-1]
-
-    st.success(
-        f"Se investires **{valor_inicial:,.0f} €** em **{ativo}** durante **{anos} anos**, com rendimento médio anual de **{rendimento:.1f}%**, terás aproximadamente **{final_valor:,.0f} €**."
-    )
+    simulacao()
+    fronteira_eficiente()
 
     st.info(
         "💬 **Conclusão:** Cada investimento tem um nível de risco diferente. Conhecer esta relação ajuda a tomar decisões conscientes e escolher o ativo que melhor se adapta ao teu perfil."
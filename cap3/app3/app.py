@@ -1,7 +1,13 @@
 import streamlit as st
-import pandas as pd
-import numpy as np
-import plotly.express as px
+from help_core.instrumentation import medidor
+from help_core.charts import grafico_linhas
+from finance_core.kernels import taxa_periodica, agregar_por_ano
+from finance_core.summary import valor_futuro
+from finance_core.tables import series_por_horizonte
+from finance_core.memo import memorizar
+from finance_core.result import Resultado
+
+fase = medidor(__name__)
 
 # --- Informação da aplicação ---
 APP_INFO = {
@@ -29,59 +35,87 @@ APP_INFO = {
     "video": "https://www.youtube.com/watch?v=5rbXGjqHCvk&t=261s"
 }
 
-# --- Função de simulação com poupança mensal ---
-def simular_poupanca(valor_mensal, anos, rendimento_anual):
-    """Simula o crescimento de poupança mensal com rendimento anual."""
-    meses = anos * 12
-    taxa_mensal = (1 + rendimento_anual / 100) ** (1/12) - 1
-    valores = []
-    saldo = 0
-    for mes in range(1, meses + 1):
-        saldo = saldo * (1 + taxa_mensal) + valor_mensal
-        valores.append(saldo)
-    df = pd.DataFrame({"Mês": np.arange(1, meses + 1), "Valor (€)": valores})
-    return df
+# --- Valores iniciais dos widgets (usados também no pré-aquecimento do servidor) ---
+VALORES_INICIAIS = {"valor_mensal": 100.0, "anos": 20, "rendimento": 6.0}
 
-def run():
-    st.set_page_config(page_title="Tempo é dinheiro", page_icon="⏳")
-    st.title(APP_INFO["title"])
-    st.video(APP_INFO["video"])
-    st.info(APP_INFO["description"])
 
-    st.subheader("💰 Simulação de poupança mensal")
+def valores_finais(valor_mensal, anos, rendimento):
+    """Valor acumulado a começar agora e 5 anos mais cedo (fórmula fechada)."""
+    taxa_mensal = taxa_periodica(rendimento / 100, 12)
+    return (
+        valor_futuro(0.0, valor_mensal, taxa_mensal, anos * 12),
+        valor_futuro(0.0, valor_mensal, taxa_mensal, (anos + 5) * 12),
+    )
+
+
+@memorizar(casas={"valor_mensal": 2, "rendimento_anual": 1})
+def simular_cenarios(valor_mensal, anos, rendimento_anual):
+    """Saldos mês a mês a começar agora e 5 anos mais cedo (vistas de uma só série)."""
+    return series_por_horizonte(0.0, valor_mensal, rendimento_anual / 100, 12, [anos * 12, (anos + 5) * 12])
+
+
+@st.cache_data(max_entries=256, show_spinner=False)
+def calcular_cenarios(valor_mensal, anos, rendimento):
+    """Tabela dos juros ganhos em cada ano do cenário atual (partilhada entre sessões)."""
+    with fase("calculo"):
+        atual, _ = simular_cenarios(valor_mensal, anos, rendimento)
+        por_ano = agregar_por_ano(atual, 0.0, valor_mensal, 12)
+    return Resultado("Ano", por_ano["ano"], {"Juros ganhos (€)": por_ano["juros"]})
+
+
+@st.cache_data(max_entries=256, show_spinner=False)
+def grafico_cenarios(valor_mensal, anos, rendimento):
+    """Gráfico comparativo dos dois cenários, mês a mês.
+
+    Os dois cenários partem de zero com o mesmo aporte: "começar agora" é o
+    início da série de quem começou 5 anos mais cedo, por isso basta calculá-la.
+    """
+    with fase("calculo"):
+        atual, mais_cedo = simular_cenarios(valor_mensal, anos, rendimento)
 
-    valor_mensal = st.number_input("Quanto vais poupar por mês (€)", min_value=10.0, value=100.0, step=10.0)
-    rendimento = st.slider("Rendimento médio anual (%)", min_value=0.0, max_value=15.0, value=6.0, step=0.1)
-    anos = st.slider("Horizonte temporal (anos)", min_value=1, max_value=40, value=20)
+    with fase("grafico"):
+        return grafico_linhas(
+            {
+                f"Começou agora ({anos} anos)": atual,
+                f"Começou 5 anos mais cedo ({anos + 5} anos)": mais_cedo,
+            },
+            titulo="Comparação: Começar agora vs 5 anos mais cedo",
+            eixo_x="Meses", eixo_y="Valor acumulado (€)",
+        )
 
-    # Cenário atual
-    df_atual = simular_poupanca(valor_mensal, anos, rendimento)
-    final_atual = df_atual["Valor (€)"].iloc[-1]
 
-    # Cenário 5 anos mais cedo
-    df_mais_cedo = simular_poupanca(valor_mensal, anos + 5, rendimento)
-    final_mais_cedo = df_mais_cedo["Valor (€)"].iloc[-1]
+def aquecer():
+    """Pré-calcula o cenário por omissão (chamado no arranque do servidor)."""
+    calcular_cenarios(**VALORES_INICIAIS)
+    grafico_cenarios(**VALORES_INICIAIS)
+
+
+@st.fragment
+def simulacao():
+    """Simulação de poupança mensal (isolada: um slider só volta a correr esta parte)."""
+    st.subheader("💰 Simulação de poupança mensal")
+
+    valor_mensal = st.number_input("Quanto vais poupar por mês (€)", min_value=10.0, value=VALORES_INICIAIS["valor_mensal"], step=10.0)
+    rendimento = st.slider("Rendimento médio anual (%)", min_value=0.0, max_value=15.0, value=VALORES_INICIAIS["rendimento"], step=0.1)
+    anos = st.slider("Horizonte temporal (anos)", min_value=1, max_value=40, value=VALORES_INICIAIS["anos"])
+
+    final_atual, final_mais_cedo = valores_finais(valor_mensal, anos, rendimento)
 
     st.success(
         f"Se poupares **{valor_mensal:,.0f} €/mês** durante **{anos} anos**, com rendimento de **{rendimento:.1f}%/ano**, acumularás aproximadamente **{final_atual:,.0f} €**.\n\n"
         f"Se tivesses começado **5 anos mais cedo**, o valor seria **{final_mais_cedo:,.0f} €**, demonstrando o poder do tempo e dos juros compostos."
     )
 
-    # --- Calcular juros corretos por ano ---
-    df_atual["Juros Mês (€)"] = df_atual["Valor (€)"].diff() - valor_mensal
-    df_atual.loc[0, "Juros Mês (€)"] = df_atual.loc[0, "Valor (€)"] - valor_mensal
-
-    df_atual["Ano"] = (df_atual["Mês"] - 1) // 12 + 1
-    juros_por_ano = df_atual.groupby("Ano")["Juros Mês (€)"].sum().reset_index()
-    juros_por_ano.rename(columns={"Juros Mês (€)": "Juros ganhos (€)"}, inplace=True)
-
     st.subheader("💸 Juros ganhos por ano (aproximado)")
-    st.dataframe(juros_por_ano, hide_index=True)
+    juros_por_ano = calcular_cenarios(valor_mensal, anos, rendimento)
+    with fase("render"):
+        st.dataframe(juros_por_ano.to_frame(), hide_index=True)
 
     # Mensagem didática
-    juros_1 = juros_por_ano.loc[juros_por_ano["Ano"] == 1, "Juros ganhos (€)"].values[0]
-    juros_5 = juros_por_ano.loc[juros_por_ano["Ano"] == 5, "Juros ganhos (€)"].values[0] if anos >= 5 else None
-    juros_ultimo = juros_por_ano.loc[juros_por_ano["Ano"] == max(juros_por_ano["Ano"]), "Juros ganhos (€)"].values[0]
+    juros = juros_por_ano["Juros ganhos (€)"]
+    juros_1 = juros[0]
+    juros_5 = juros[4] if anos >= 5 else None
+    juros_ultimo = juros[-1]
 
     msg = f"Aqui consegues perceber o quão importante é ser consistente:\n\n"
     msg += f"- No primeiro ano, recebes aproximadamente **{juros_1:,.0f} €** de juros.\n"
@@ -91,17 +125,20 @@ def run():
 
     st.info(msg)
 
-    # --- Gráfico comparativo ---
-    df_atual["Cenário"] = f"Começou agora ({anos} anos)"
-    df_mais_cedo["Cenário"] = f"Começou 5 anos mais cedo ({anos + 5} anos)"
-    df_comb = pd.concat([df_atual, df_mais_cedo], ignore_index=True)
+    # --- Gráfico comparativo (só calculado com o painel aberto) ---
+    painel = st.expander("📈 Começar agora vs 5 anos mais cedo", expanded=True, key="grafico_tempo_dinheiro", on_change="rerun")
+    if painel.open:
+        fig = grafico_cenarios(valor_mensal, anos, rendimento)
+        with painel, fase("render"):
+            st.plotly_chart(fig, use_container_width=True)
 
-    fig = px.line(
-        df_comb, x="Mês", y="Valor (€)", color="Cenário",
-        labels={"Valor (€)": "Valor acumulado (€)", "Mês": "Meses"},
-        title="Comparação: Começar agora vs 5 anos mais cedo"
-    )
-    st.plotly_chart(fig, use_container_width=True)
+def run():
+    st.set_page_config(page_title="Tempo é dinheiro", page_icon="⏳")
+    st.title(APP_INFO["title"])
+    st.video(APP_INFO["video"])
+    st.info(APP_INFO["description"])
+
+    simulacao()
 
     st.info(
         "💬 **Conclusão:** Mesmo pequenas poupanças mensais crescem muito com o tempo e juros compostos. Começar cedo é sempre uma vantagem."
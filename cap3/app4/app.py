@@ -1,7 +1,17 @@
 import streamlit as st
-import pandas as pd
 import numpy as np
-import plotly.express as px
+from help_core.lazy_imports import lazy_import
+from help_core.instrumentation import medidor
+from help_core.charts import grafico_linhas
+from finance_core.kernels import taxa_periodica, agregar_por_ano
+from finance_core.summary import valor_futuro
+from finance_core.tables import serie_tabelada
+from finance_core.grid import PERIODICIDADES, grelha_valor_final
+from finance_core.memo import memorizar
+from finance_core.result import Resultado
+
+go = lazy_import("plotly.graph_objects")
+fase = medidor(__name__)
 
 # --- Informação da aplicação ---
 APP_INFO = {
@@ -30,44 +40,101 @@ APP_INFO = {
     "video": "https://www.youtube.com/watch?v=5rbXGjqHCvk&t=261s"
 }
 
+# --- Número de períodos por ano de cada periodicidade ---
+PERIODOS_ANO = {"Semanal": 52, "Mensal": 12, "Anual": 1}
+
+
 # --- Função de simulação ---
+@memorizar(casas={"valor_inicial": 2, "aporte": 2, "rendimento_anual": 1})
 def simular_juros_compostos(valor_inicial, aporte, anos, rendimento_anual, periodo):
     """Simula crescimento de capital com juros compostos, aportes periódicos e valor inicial."""
     # Determinar número de períodos por ano
-    freq_map = {"Semanal": 52, "Mensal": 12, "Anual": 1}
-    n_periodos_ano = freq_map[periodo]
-    
-    taxa_periodo = (1 + rendimento_anual / 100) ** (1/n_periodos_ano) - 1
+    n_periodos_ano = PERIODOS_ANO[periodo]
+
+    taxa_periodo = taxa_periodica(rendimento_anual / 100, n_periodos_ano)
     total_periodos = anos * n_periodos_ano
 
-    valores = []
-    saldo = valor_inicial
-    for i in range(1, total_periodos + 1):
-        saldo = saldo * (1 + taxa_periodo) + aporte
-        valores.append(saldo)
-    
-    df = pd.DataFrame({"Período": np.arange(1, total_periodos + 1), "Valor (€)": valores})
-    df["Ano"] = (df["Período"] - 1) // n_periodos_ano + 1
-    return df, taxa_periodo
+    valores = serie_tabelada(valor_inicial, aporte, rendimento_anual / 100, n_periodos_ano, total_periodos)
+    return Resultado("Período", np.arange(1, total_periodos + 1), {"Valor (€)": valores}), taxa_periodo
+
+# --- Valores iniciais dos widgets (usados também no pré-aquecimento do servidor) ---
+VALORES_INICIAIS = {"valor_inicial": 0.0, "aporte": 100.0, "anos": 20, "rendimento": 6.0, "periodo": "Semanal"}
+PERIODOS = ["Semanal", "Mensal", "Anual"]
+
+
+@st.cache_data(max_entries=256, show_spinner=False)
+def calcular_crescimento(valor_inicial, aporte, anos, rendimento, periodo):
+    """Corre a simulação e prepara a tabela de juros anuais (sem DataFrame nem groupby)."""
+    with fase("calculo"):
+        simulacao, _ = simular_juros_compostos(valor_inicial, aporte, anos, rendimento, periodo)
+        por_ano = agregar_por_ano(simulacao["Valor (€)"], valor_inicial, aporte, PERIODOS_ANO[periodo])
+    return Resultado("Ano", por_ano["ano"], {"Juros ganhos (€)": por_ano["juros"]})
+
+
+@st.cache_data(max_entries=256, show_spinner=False)
+def grafico_crescimento(valor_inicial, aporte, anos, rendimento, periodo):
+    """Gráfico do capital período a período (só construído com o gráfico aberto)."""
+    with fase("calculo"):
+        simulacao, _ = simular_juros_compostos(valor_inicial, aporte, anos, rendimento, periodo)
+    with fase("grafico"):
+        return grafico_linhas({"Valor (€)": simulacao["Valor (€)"]}, titulo=f"Crescimento do Capital ({periodo})",
+                              eixo_x="Período", eixo_y="Valor (€)", x=simulacao["Período"])
+
+
+# --- Grelha de sensibilidade: todas as taxas e prazos dos sliders ---
+TAXAS_GRELHA = np.arange(151) / 10      # 0% a 15% em passos de 0,1%
+ANOS_GRELHA = np.arange(1, 71)
+
+
+@memorizar(casas={"valor_inicial": 2, "aporte": 2})
+def calcular_grelha(valor_inicial, aporte):
+    """Capital final de todas as taxas, prazos e periodicidades; só depende do valor inicial e do aporte."""
+    return grelha_valor_final(valor_inicial, aporte, TAXAS_GRELHA / 100, ANOS_GRELHA)
+
+
+def grafico_sensibilidade(capital, anos, rendimento, periodo):
+    """Mapa de calor do capital final por taxa e prazo, com a simulação atual assinalada."""
+    escala = np.log10(np.maximum(capital, 1))   # cores em escala log: o capital vai de euros a milhões
+    marcas = np.arange(np.floor(escala.min()), np.ceil(escala.max()) + 1)
+    fig = go.Figure(go.Heatmap(
+        x=ANOS_GRELHA, y=TAXAS_GRELHA, z=escala, customdata=capital,
+        colorscale="Viridis",
+        colorbar=dict(title="Capital final (€)", tickvals=marcas, ticktext=[f"{10 ** m:,.0f}" for m in marcas]),
+        hovertemplate="%{y:.1f}% durante %{x} anos<br>%{customdata:,.0f} €<extra></extra>",
+    ))
+    fig.add_trace(go.Scatter(
+        x=[anos], y=[rendimento], mode="markers", showlegend=False,
+        marker=dict(symbol="x", size=12, color="white", line=dict(width=1, color="black")),
+        hovertemplate="A tua simulação<extra></extra>",
+    ))
+    fig.update_layout(
+        title=f"Capital final por taxa e prazo (aporte {periodo.lower()})",
+        xaxis_title="Horizonte temporal (anos)", yaxis_title="Taxa de rendimento anual (%)",
+    )
+    return fig
 
-def run():
-    st.set_page_config(page_title="Juros Compostos", page_icon="💹")
-    st.title(APP_INFO["title"])
-    st.video(APP_INFO["video"])
-    st.info(APP_INFO["description"])
 
+def aquecer():
+    """Pré-calcula a simulação por omissão (chamado no arranque do servidor)."""
+    calcular_crescimento(**VALORES_INICIAIS)
+    grafico_crescimento(**VALORES_INICIAIS)
+    calcular_grelha(VALORES_INICIAIS["valor_inicial"], VALORES_INICIAIS["aporte"])
+
+
+@st.fragment
+def simulacao():
+    """Configuração, fórmulas e gráfico dos juros compostos, re-executados à parte do resto da página."""
     st.subheader("💰 Configura a tua simulação de Juros Compostos")
     
-    valor_inicial = st.number_input("Valor inicial (€)", min_value=0.0, value=0.0, step=100.0)
-    aporte = st.number_input("Aporte periódico (€)", min_value=0.0, value=100.0, step=10.0)
-    rendimento = st.slider("Taxa de rendimento anual (%)", min_value=0.0, max_value=15.0, value=6.0, step=0.1)
-    anos = st.slider("Horizonte temporal (anos)", min_value=1, max_value=70, value=20)
-    periodo = st.selectbox("Periodicidade dos aportes", ["Semanal", "Mensal", "Anual"])
-
-    freq_map = {"Semanal": 52, "Mensal": 12, "Anual": 1}
-    n_periodos_ano = freq_map[periodo]
+    valor_inicial = st.number_input("Valor inicial (€)", min_value=0.0, value=VALORES_INICIAIS["valor_inicial"], step=100.0)
+    aporte = st.number_input("Aporte periódico (€)", min_value=0.0, value=VALORES_INICIAIS["aporte"], step=10.0)
+    rendimento = st.slider("Taxa de rendimento anual (%)", min_value=0.0, max_value=15.0, value=VALORES_INICIAIS["rendimento"], step=0.1)
+    anos = st.slider("Horizonte temporal (anos)", min_value=1, max_value=70, value=VALORES_INICIAIS["anos"])
+    periodo = st.selectbox("Periodicidade dos aportes", PERIODOS, index=PERIODOS.index(VALORES_INICIAIS["periodo"]))
+
+    n_periodos_ano = PERIODOS_ANO[periodo]
     n = anos * n_periodos_ano
-    r_periodo = (1 + rendimento / 100) ** (1/n_periodos_ano) - 1
+    r_periodo = taxa_periodica(rendimento / 100, n_periodos_ano)
 
     st.markdown("### 🧮 Fórmula simples de Juros Compostos (somente valor inicial)")
     st.latex(r"""
@@ -90,27 +157,46 @@ def run():
         f"- **n** = {n} (número total de períodos)"
     )
 
-    # --- Simulação ---
-    df, taxa_periodo = simular_juros_compostos(valor_inicial, aporte, anos, rendimento, periodo)
-    valor_final = df["Valor (€)"].iloc[-1]
+    # --- Resultado (fórmula fechada, sem construir a série) ---
+    valor_final = valor_futuro(valor_inicial, aporte, r_periodo, n)
 
     st.success(
         f"Após {anos} anos, com aporte {periodo.lower()} de {aporte:,.0f} € e valor inicial de {valor_inicial:,.0f} €, "
         f"o teu capital será aproximadamente **{valor_final:,.0f} €**."
     )
 
-    # Juros por ano
-    df["Juros Período (€)"] = df["Valor (€)"].diff() - aporte
-    df.loc[0, "Juros Período (€)"] = df.loc[0, "Valor (€)"] - aporte
-    juros_por_ano = df.groupby("Ano")["Juros Período (€)"].sum().reset_index()
-    juros_por_ano.rename(columns={"Juros Período (€)": "Juros ganhos (€)"}, inplace=True)
-
     st.subheader("💸 Juros ganhos por ano (aproximado)")
-    st.dataframe(juros_por_ano, hide_index=True)
+    juros_por_ano = calcular_crescimento(valor_inicial, aporte, anos, rendimento, periodo)
+    with fase("render"):
+        st.dataframe(juros_por_ano.to_frame(), hide_index=True)
+
+    # Gráfico (a série período a período só é calculada com o painel aberto)
+    painel = st.expander("📈 Crescimento do capital", expanded=True, key="grafico_juros_compostos", on_change="rerun")
+    if painel.open:
+        fig = grafico_crescimento(valor_inicial, aporte, anos, rendimento, periodo)
+        with painel, fase("render"):
+            st.plotly_chart(fig, use_container_width=True)
+
+    # Sensibilidade: a grelha (151 taxas × 70 prazos × 3 periodicidades) só é recalculada quando muda
+    # o valor inicial ou o aporte; mudar a taxa, o prazo ou a periodicidade reutiliza-a
+    painel = st.expander("🗺️ Capital final por taxa e prazo", expanded=True, key="grelha_juros_compostos", on_change="rerun")
+    if painel.open:
+        with fase("calculo"):
+            grelha = calcular_grelha(valor_inicial, aporte)
+        with fase("grafico"):
+            fig = grafico_sensibilidade(grelha[PERIODICIDADES.index(n_periodos_ano)], anos, rendimento, periodo)
+        with painel:
+            st.caption("Cada quadrado é uma combinação de taxa e prazo com o mesmo valor inicial e aporte; o ✕ é a tua simulação.")
+            with fase("render"):
+                st.plotly_chart(fig, use_container_width=True)
+
+def run():
+    st.set_page_config(page_title="Juros Compostos", page_icon="💹")
+    st.title(APP_INFO["title"])
+    st.video(APP_INFO["video"])
+    st.info(APP_INFO["description"])
 
-    # Gráfico
-    fig = px.line(df, x="Período", y="Valor (€)", title=f"Crescimento do Capital ({periodo})")
-    st.plotly_chart(fig, use_container_width=True)
+    simulacao()
 
     st.info(
         "💬 **Conclusão:** Primeiro aprendeste a fórmula básica e depois viste como os aportes periódicos aumentam exponencialmente o capital. "
@@ -1,5 +1,6 @@
 import streamlit as st
 import random
+from help_core.session_memory import estado_aula
 
 # --- Informação da aplicação ---
 APP_INFO = {
@@ -106,6 +107,7 @@ def verificar_resposta(pergunta_num, resposta, correta, explicacao):
             st.error(f"❌ Incorreto. {explicacao}")
 
 def run():
+    estado = estado_aula(__name__)
     st.title(APP_INFO["title"])
     st.video(APP_INFO["video"])
     st.info(APP_INFO["description"])
@@ -114,10 +116,10 @@ def run():
     st.subheader("🧠 Testa os teus conhecimentos")
 
     # --- Seleção de 4 perguntas aleatórias e armazenamento na sessão ---
-    if "perguntas_aleatorias" not in st.session_state:
-        st.session_state.perguntas_aleatorias = random.sample(PERGUNTAS, 4)
+    if "perguntas_aleatorias" not in estado:
+        estado.perguntas_aleatorias = random.sample(PERGUNTAS, 4)
 
-    perguntas_aleatorias = st.session_state.perguntas_aleatorias
+    perguntas_aleatorias = estado.perguntas_aleatorias
 
     # Exibir perguntas
     for i, p in enumerate(perguntas_aleatorias, start=1):
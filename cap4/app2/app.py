@@ -1,5 +1,6 @@
 import streamlit as st
 import random
+from help_core.session_memory import estado_aula
 
 # --- Informação da aplicação ---
 APP_INFO = {
@@ -100,6 +101,7 @@ def verificar_resposta(pergunta_num, resposta, correta, explicacao):
 
 def run():
     st.set_page_config(page_title=APP_INFO["title"], page_icon="📝")
+    estado = estado_aula(__name__)
     st.title(APP_INFO["title"])
     st.video(APP_INFO["video"])
     st.info(APP_INFO["description"])
@@ -108,10 +110,10 @@ def run():
     st.subheader("🧠 Testa os teus conhecimentos")
 
     # --- Seleção de 4 perguntas aleatórias e armazenamento na sessão ---
-    if "perguntas_aleatorias_aula2" not in st.session_state:
-        st.session_state.perguntas_aleatorias_aula2 = random.sample(PERGUNTAS, 4)
+    if "perguntas_aleatorias_aula2" not in estado:
+        estado.perguntas_aleatorias_aula2 = random.sample(PERGUNTAS, 4)
 
-    perguntas_aleatorias = st.session_state.perguntas_aleatorias_aula2
+    perguntas_aleatorias = estado.perguntas_aleatorias_aula2
 
     # Exibir perguntas
     for i, p in enumerate(perguntas_aleatorias, start=1):
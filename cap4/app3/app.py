@@ -1,6 +1,12 @@
 import streamlit as st
-import pandas as pd
-import plotly.express as px
+from help_core.instrumentation import medidor
+from help_core.lazy_imports import lazy_import
+from finance_core.cents import repartir_euros
+
+pd = lazy_import("pandas")
+px = lazy_import("plotly.express")
+
+fase = medidor(__name__)
 
 # --- Informação da aplicação ---
 APP_INFO = {
@@ -29,22 +35,44 @@ APP_INFO = {
     "video": "https://www.youtube.com/watch?v=5rbXGjqHCvk&t=150s"
 }
 
-def run():
-    st.title(APP_INFO["title"])
-    st.video(APP_INFO["video"])
-    st.info(APP_INFO["description"])
-    st.divider()
+# --- Valores iniciais dos widgets (usados também no pré-aquecimento do servidor) ---
+VALORES_INICIAIS = {"valor_total": 20.0, "necessidades_pct": 0, "desejos_pct": 0}
 
+
+@st.cache_data(max_entries=256, show_spinner=False)
+def grafico_distribuicao(valor_total, necessidades_pct, desejos_pct):
+    """Tabela e gráfico circular da distribuição (em cêntimos: as três partes somam sempre o total)."""
+    poupanca_pct = 100 - necessidades_pct - desejos_pct
+    with fase("calculo"):
+        df = pd.DataFrame({
+            "Categoria": ["Necessidades", "Desejos", "Poupança / Investimento"],
+            "Valor (€)": repartir_euros(valor_total, [necessidades_pct, desejos_pct, poupanca_pct]),
+        })
+    with fase("grafico"):
+        fig = px.pie(df, names="Categoria", values="Valor (€)",
+                     title="Distribuição segundo a Regra 50/30/20",
+                     color_discrete_sequence=px.colors.qualitative.Pastel)
+    return df, fig
+
+
+def aquecer():
+    """Pré-calcula a tabela e o gráfico por omissão (chamado no arranque do servidor)."""
+    grafico_distribuicao(**VALORES_INICIAIS)
+
+
+@st.fragment
+def simulacao():
+    """Percentagens do aluno, tabela e gráfico circular."""
     st.subheader("💡 Testa a Regra 50/30/20 com o teu dinheiro")
 
     # --- Inputs do utilizador ---
     valor_total = st.number_input(
-        "Quanto dinheiro tens para gerir neste mês? (€)", min_value=10.0, value=20.0, step=5.0
+        "Quanto dinheiro tens para gerir neste mês? (€)", min_value=10.0, value=VALORES_INICIAIS["valor_total"], step=5.0
     )
 
     st.markdown("### Ajusta os teus percentuais (opcional)")
-    necessidades_pct = st.slider("Necessidades (%)", 0, 100)
-    desejos_pct = st.slider("Desejos (%)", 0, 100)
+    necessidades_pct = st.slider("Necessidades (%)", 0, 100, VALORES_INICIAIS["necessidades_pct"])
+    desejos_pct = st.slider("Desejos (%)", 0, 100, VALORES_INICIAIS["desejos_pct"])
     poupanca_pct = 100 - necessidades_pct - desejos_pct
 
     # --- Mensagem de aviso sobre poupança ---
@@ -62,27 +90,24 @@ def run():
 
     st.info(f"Poupança / Investimento será automaticamente {poupanca_pct}%")
 
-    # --- Cálculo da distribuição ---
-    distribuicao = {
-        "Categoria": ["Necessidades", "Desejos", "Poupança / Investimento"],
-        "Valor (€)": [
-            valor_total * necessidades_pct / 100,
-            valor_total * desejos_pct / 100,
-            valor_total * poupanca_pct / 100
-        ]
-    }
-    df = pd.DataFrame(distribuicao)
+    df, fig = grafico_distribuicao(valor_total, necessidades_pct, desejos_pct)
 
     # --- Mostrar tabela ---
     st.markdown("### 💵 Distribuição do teu dinheiro")
     st.dataframe(df.style.format({"Valor (€)": "€{:.2f}"}))
 
     # --- Gráfico interativo ---
-    fig = px.pie(df, names="Categoria", values="Valor (€)",
-                 title="Distribuição segundo a Regra 50/30/20",
-                 color_discrete_sequence=px.colors.qualitative.Pastel)
     st.plotly_chart(fig, use_container_width=True)
 
+
+def run():
+    st.title(APP_INFO["title"])
+    st.video(APP_INFO["video"])
+    st.info(APP_INFO["description"])
+    st.divider()
+
+    simulacao()
+
     st.markdown("### 📝 Reflexão")
     st.info(
         """
@@ -1,7 +1,14 @@
 import streamlit as st
-import pandas as pd
-import plotly.express as px
 import random
+from help_core.instrumentation import medidor
+from help_core.lazy_imports import lazy_import
+from help_core.session_memory import estado_aula
+from finance_core.cents import para_centimos, para_euros, percentagens_exatas
+
+pd = lazy_import("pandas")
+px = lazy_import("plotly.express")
+
+fase = medidor(__name__)
 
 # --- Informação padrão mínima ---
 APP_INFO = {
@@ -39,47 +46,56 @@ def atualizar_app_info(salario, renda, alimentacao, eletrica_agua, ginasio, jant
     }
 
 def calcular_distribuicao(necessidades_val, desejos_val, poupanca_val):
-    """Calcula a distribuição e percentagens."""
-    valor_total = necessidades_val + desejos_val + poupanca_val
-    necessidades_pct = round(necessidades_val / valor_total * 100, 1)
-    desejos_pct = round(desejos_val / valor_total * 100, 1)
-    poupanca_pct = round(poupanca_val / valor_total * 100, 1)
+    """Calcula a distribuição e percentagens (em cêntimos; as percentagens somam sempre 100%)."""
+    partes = [para_centimos(valor) for valor in (necessidades_val, desejos_val, poupanca_val)]
+    valor_total = sum(partes) / 100
+    percentagens = percentagens_exatas(partes, casas=1)
     df = pd.DataFrame({
         "Categoria": ["Necessidades", "Desejos", "Poupança / Investimento"],
-        "Valor (€)": [necessidades_val, desejos_val, poupanca_val],
-        "Percentual (%)": [necessidades_pct, desejos_pct, poupanca_pct]
+        "Valor (€)": para_euros(partes),
+        "Percentual (%)": percentagens
     })
-    return df, poupanca_pct, valor_total
-
-# --- Main ---
-def run():
-    if "cenario" not in st.session_state:
-        st.session_state["cenario"] = gerar_cenario()
-    salario, renda, alimentacao, eletrica_agua, ginasio, jantar, roupa, eletronica, carro, transporte = st.session_state["cenario"]
-
-    APP_INFO = atualizar_app_info(salario, renda, alimentacao, eletrica_agua, ginasio, jantar, roupa, eletronica, carro, transporte)
-    st.title(APP_INFO["title"])
-    st.info(APP_INFO["description"])
-    st.divider()
-
+    return df, percentagens[-1], valor_total
+
+# --- Valores iniciais da calculadora (usados também no pré-aquecimento do servidor) ---
+# O cenário do João é aleatório, mas a calculadora começa sempre com os mesmos valores.
+VALORES_INICIAIS = {"salario_val": 100.0, "necessidades_val": 100.0, "desejos_val": 100.0}
+
+@st.cache_data(max_entries=256, show_spinner=False)
+def grafico_distribuicao(necessidades_val, desejos_val, poupanca_val):
+    """Distribuição da calculadora e o respetivo gráfico circular."""
+    with fase("calculo"):
+        df, poupanca_pct, valor_total = calcular_distribuicao(necessidades_val, desejos_val, poupanca_val)
+    with fase("grafico"):
+        fig = px.pie(df, names="Categoria", values="Valor (€)",
+                     title="Distribuição do orçamento",
+                     color_discrete_sequence=px.colors.qualitative.Pastel)
+    return df, poupanca_pct, valor_total, fig
+
+def aquecer():
+    """Pré-calcula a distribuição e o gráfico por omissão (chamado no arranque do servidor)."""
+    necessidades_val, desejos_val = VALORES_INICIAIS["necessidades_val"], VALORES_INICIAIS["desejos_val"]
+    poupanca_val = VALORES_INICIAIS["salario_val"] - (necessidades_val + desejos_val)
+    grafico_distribuicao(necessidades_val, desejos_val, poupanca_val)
+
+@st.fragment
+def simulacao(carro, transporte):
+    """Calculadora do aluno e perguntas do desafio."""
     st.subheader("🧮 Calculadora do aluno")
     st.markdown("Preenche os valores que achas que João gasta em cada categoria:")
 
     # Inputs do aluno
-    salario_val = st.number_input("Salário João (€)", min_value=0.0, value=100.0, step=50.0)
-    necessidades_val = st.number_input("Necessidades (€) (renda, alimentação, eletricidade/água)", min_value=0.0, value=100.0, step=5.0)
-    desejos_val = st.number_input("Desejos/Lazer (€) (ginásio, jantar, roupa, eletrónica)", min_value=0.0, value=100.0, step=5.0)
+    salario_val = st.number_input("Salário João (€)", min_value=0.0, value=VALORES_INICIAIS["salario_val"], step=50.0)
+    necessidades_val = st.number_input("Necessidades (€) (renda, alimentação, eletricidade/água)", min_value=0.0, value=VALORES_INICIAIS["necessidades_val"], step=5.0)
+    desejos_val = st.number_input("Desejos/Lazer (€) (ginásio, jantar, roupa, eletrónica)", min_value=0.0, value=VALORES_INICIAIS["desejos_val"], step=5.0)
     poupanca_val = salario_val - (necessidades_val + desejos_val)
 
     # Distribuição
-    df, poupanca_pct, valor_total = calcular_distribuicao(necessidades_val, desejos_val, poupanca_val)
-    st.info(f"ℹ️ Poupança: {poupanca_val}€ ({poupanca_pct}%)")
+    df, poupanca_pct, valor_total, fig = grafico_distribuicao(necessidades_val, desejos_val, poupanca_val)
+    st.info(f"ℹ️ Poupança: {poupanca_val:.2f}€ ({poupanca_pct}%)")
 
     st.markdown("### 💵 Distribuição do orçamento")
     st.dataframe(df.style.format({"Valor (€)": "€{:.2f}", "Percentual (%)": "{:.1f}%"}))
-    fig = px.pie(df, names="Categoria", values="Valor (€)",
-                 title="Distribuição do orçamento",
-                 color_discrete_sequence=px.colors.qualitative.Pastel)
     st.plotly_chart(fig, use_container_width=True)
 
     st.divider()
@@ -133,6 +149,21 @@ def run():
         else:
             st.error(f"❌ Incorreto. A taxa de poupança seria {taxa_com_carro}%.")
 
+
+# --- Main ---
+def run():
+    estado = estado_aula(__name__)
+    if "cenario" not in estado:
+        estado["cenario"] = gerar_cenario()
+    salario, renda, alimentacao, eletrica_agua, ginasio, jantar, roupa, eletronica, carro, transporte = estado["cenario"]
+
+    APP_INFO = atualizar_app_info(salario, renda, alimentacao, eletrica_agua, ginasio, jantar, roupa, eletronica, carro, transporte)
+    st.title(APP_INFO["title"])
+    st.info(APP_INFO["description"])
+    st.divider()
+
+    simulacao(carro, transporte)
+
     st.header("❓ Tens dúvidas? Vê as dicas do vídeo!")
     st.video("https://www.youtube.com/watch?v=5rbXGjqHCvk&t=150s")
 if __name__ == "__main__":
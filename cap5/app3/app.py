@@ -1,6 +1,13 @@
 import streamlit as st
 import numpy as np
-import plotly.graph_objects as go
+from help_core.lazy_imports import lazy_import
+from help_core.instrumentation import medidor
+from finance_core.kernels import desvalorizacao_continua
+from finance_core.tables import fatores_tabelados
+from finance_core.deflator import deflacionar_series
+
+go = lazy_import("plotly.graph_objects")
+fase = medidor(__name__)
 
 # --- Informação da aplicação ---
 APP_INFO = {
@@ -21,75 +28,99 @@ APP_INFO = {
 
 # --- Funções auxiliares ---
 def compound_interest(principal, annual_rate, years):
-    """Cálculo de juros compostos anuais"""
-    return principal * (1 + annual_rate) ** years
+    """Cálculo de juros compostos anuais, do ano 0 ao ano `years`"""
+    return principal * fatores_tabelados(annual_rate, 1, years + 1, inicio=0)
 
-def decreasing_continuously_compounded(principal, annual_inflation, years):
-    """Desvalorização contínua (inflação)"""
-    return principal * np.exp(-annual_inflation * years)
+# --- Valores iniciais dos widgets (usados também no pré-aquecimento do servidor) ---
+DEFAULTS = {"initial": 1000.0, "inflation": 2.5, "investment": 7.0, "years": 20}
 
-# --- Aplicação principal ---
-def run():
-    st.subheader(APP_INFO["title"])
-    st.markdown(APP_INFO["description"])
-    st.divider()
 
+@st.cache_data(max_entries=256, show_spinner=False)
+def build_chart(initial, inflation, investment, years):
+    """Calcula as três séries e constrói o gráfico (partilhado entre sessões)."""
+    # --- Cálculos ---
+    with fase("calculo"):
+        x_years = np.arange(0, years + 1)
+        invest_nominal = compound_interest(initial, investment, years)
+        invest_real = deflacionar_series(invest_nominal, inflation, 1, inicio=0)
+        cash_real = desvalorizacao_continua(initial, inflation, x_years)
+
+    # --- Gráfico ---
+    with fase("grafico"):
+        fig = go.Figure()
+
+        # Dinheiro investido (nominal)
+        fig.add_trace(go.Scatter(
+            x=x_years, y=invest_nominal,
+            mode="lines+markers",
+            name="💹 Investimento (sem inflação)",
+            line=dict(color="green", width=3)
+        ))
+
+        # Investimento ajustado à inflação
+        fig.add_trace(go.Scatter(
+            x=x_years, y=invest_real,
+            mode="lines+markers",
+            name="💰 Investimento Real (ajustado à inflação)",
+            line=dict(color="orange", width=3, dash="dash")
+        ))
+
+        # Dinheiro parado com inflação
+        fig.add_trace(go.Scatter(
+            x=x_years, y=cash_real,
+            mode="lines+markers",
+            name="📉 Dinheiro parado (inflação)",
+            line=dict(color="red", width=3, dash="dot")
+        ))
+
+        fig.update_layout(
+            title="Evolução do Valor do Dinheiro ao Longo dos Anos",
+            xaxis_title="Ano",
+            yaxis_title="Valor (€)",
+            template="plotly_white",
+            legend=dict(yanchor="bottom", y=0.02, xanchor="right", x=0.98)
+        )
+
+    finals = {"invest_nominal": invest_nominal[-1], "invest_real": invest_real[-1], "cash_real": cash_real[-1]}
+    return fig, finals
+
+
+def aquecer():
+    """Pré-calcula o gráfico por omissão (chamado no arranque do servidor)."""
+    build_chart(DEFAULTS["initial"], DEFAULTS["inflation"] / 100, DEFAULTS["investment"] / 100, DEFAULTS["years"])
+
+
+@st.fragment
+def simulacao():
+    """Inputs, cálculos, gráfico e métricas."""
     # --- Inputs ---
     col1, col2 = st.columns(2)
     with col1:
-        initial = st.number_input("💰 Quanto dinheiro tens hoje?", min_value=0.00, value=1000.00, step=100.00)
-        inflation = st.number_input("📉 Inflação anual (%)", min_value=0.00, value=2.50, step=0.10) / 100
+        initial = st.number_input("💰 Quanto dinheiro tens hoje?", min_value=0.00, value=DEFAULTS["initial"], step=100.00)
+        inflation = st.number_input("📉 Inflação anual (%)", min_value=0.00, value=DEFAULTS["inflation"], step=0.10) / 100
     with col2:
-        investment = st.number_input("📈 Taxa de rendimento anual (%)", min_value=0.00, value=7.00, step=0.10) / 100
-        years = st.slider("⏳ Quantos anos queres simular?", 1, 50, 20)
+        investment = st.number_input("📈 Taxa de rendimento anual (%)", min_value=0.00, value=DEFAULTS["investment"], step=0.10) / 100
+        years = st.slider("⏳ Quantos anos queres simular?", 1, 50, DEFAULTS["years"])
 
-    # --- Cálculos ---
-    x_years = np.arange(0, years + 1)
-    invest_nominal = [compound_interest(initial, investment, y) for y in x_years]
-    invest_real = [v / ((1 + inflation) ** y) for v, y in zip(invest_nominal, x_years)]
-    cash_real = [decreasing_continuously_compounded(initial, inflation, y) for y in x_years]
+    # --- Cálculos e gráfico ---
+    fig, finals = build_chart(initial, inflation, investment, years)
 
-    # --- Gráfico ---
-    fig = go.Figure()
-
-    # Dinheiro investido (nominal)
-    fig.add_trace(go.Scatter(
-        x=x_years, y=invest_nominal,
-        mode="lines+markers",
-        name="💹 Investimento (sem inflação)",
-        line=dict(color="green", width=3)
-    ))
-
-    # Investimento ajustado à inflação
-    fig.add_trace(go.Scatter(
-        x=x_years, y=invest_real,
-        mode="lines+markers",
-        name="💰 Investimento Real (ajustado à inflação)",
-        line=dict(color="orange", width=3, dash="dash")
-    ))
-
-    # Dinheiro parado com inflação
-    fig.add_trace(go.Scatter(
-        x=x_years, y=cash_real,
-        mode="lines+markers",
-        name="📉 Dinheiro parado (inflação)",
-        line=dict(color="red", width=3, dash="dot")
-    ))
-
-    fig.update_layout(
-        title="Evolução do Valor do Dinheiro ao Longo dos Anos",
-        xaxis_title="Ano",
-        yaxis_title="Valor (€)",
-        template="plotly_white",
-        legend=dict(yanchor="bottom", y=0.02, xanchor="right", x=0.98)
-    )
-
-    st.plotly_chart(fig, use_container_width=True)
+    with fase("render"):
+        st.plotly_chart(fig, use_container_width=True)
 
     # --- Métricas ---
-    st.metric("💹 Valor investido (nominal)", f"{invest_nominal[-1]:,.2f} €")
-    st.metric("💰 Valor real do investimento", f"{invest_real[-1]:,.2f} €")
-    st.metric("📉 Valor se o dinheiro ficar parado", f"{cash_real[-1]:,.2f} €")
+    st.metric("💹 Valor investido (nominal)", f"{finals['invest_nominal']:,.2f} €")
+    st.metric("💰 Valor real do investimento", f"{finals['invest_real']:,.2f} €")
+    st.metric("📉 Valor se o dinheiro ficar parado", f"{finals['cash_real']:,.2f} €")
+
+
+# --- Aplicação principal ---
+def run():
+    st.subheader(APP_INFO["title"])
+    st.markdown(APP_INFO["description"])
+    st.divider()
+
+    simulacao()
 
     # --- Reflexão final ---
     st.info(
@@ -0,0 +1,97 @@
+"""Modo exato: dinheiro em cêntimos inteiros, como num banco.
+
+Os valores em euros passam a cêntimos com arredondamento bancário (meio para
+o par) e, a partir daí, somas e repartições são feitas em inteiros (int64 nos
+arrays, int do Python nos valores soltos), sem o desvio dos floats binários.
+Cada aporte é arredondado ao cêntimo no fim do seu período, como seria
+depositado. Para mostrar, os euros são o float mais próximo de cada valor exato.
+"""
+import numpy as np
+
+
+# --- Conversões ---
+def para_centimos(euros):
+    """Euros para cêntimos, arredondando meio cêntimo para o par (int para um valor, int64 para arrays)."""
+    if isinstance(euros, (int, float)):
+        return round(euros * 100)
+    return np.rint(np.asarray(euros, dtype=float) * 100).astype(np.int64)
+
+
+def para_euros(centimos):
+    """Cêntimos para euros, para mostrar em tabelas e gráficos (uma lista continua lista)."""
+    if isinstance(centimos, list):
+        return [c / 100 for c in centimos]
+    return np.asarray(centimos) / 100
+
+
+def dividir_bancario(numerador, denominador):
+    """Divisão inteira arredondada meio para o par (denominador positivo), sem passar por floats.
+
+    Funciona com int do Python e com arrays int64.
+    """
+    q, r = divmod(numerador, denominador)
+    dobro = 2 * r
+    return q + ((dobro > denominador) | ((dobro == denominador) & (q % 2 == 1)))
+
+
+# --- Poupança sem juros ---
+def acumulacao_linear_centimos(valor, n, limite=None):
+    """Como kernels.acumulacao_linear, mas em cêntimos int64: o mesmo depósito em cada período.
+
+    Com uma lista de valores devolve uma linha por valor; `limite` (em euros) corta o total.
+    """
+    valores = np.multiply.outer(para_centimos(valor), np.arange(1, n + 1, dtype=np.int64))
+    if limite is not None:
+        np.minimum(valores, para_centimos(limite), out=valores)
+    return valores
+
+
+def acumulacao_linear_exata(valor, n, limite=None):
+    """acumulacao_linear_centimos já em euros, para os gráficos e tabelas das aulas.
+
+    Os cêntimos inteiros são guardados e multiplicados em float64, onde são
+    exatos até 2^53 cêntimos, e divididos por 100 no mesmo array: o resultado é
+    igual a para_euros(acumulacao_linear_centimos(...)) sem a cópia int64 -> float.
+    """
+    centimos = np.rint(np.asarray(valor, dtype=float) * 100)
+    valores = np.multiply.outer(centimos, np.arange(1.0, n + 1))
+    if limite is not None:
+        np.minimum(valores, para_centimos(limite), out=valores)
+    valores /= 100
+    return valores
+
+
+# --- Repartições ---
+def repartir_euros(euros, percentagens):
+    """Divide `euros` pelas percentagens (inteiras) dadas, ao cêntimo; as partes somam sempre o total.
+
+    O valor passa a cêntimos com arredondamento bancário e as partes são
+    calculadas em inteiros, numa só passagem, e só no fim divididas por 100.
+    Cada parte é arredondada meio para o par; o cêntimo que sobrar (ou faltar)
+    vai para a última parte, que é o "resto" (a poupança, na regra 50/30/20).
+    """
+    total = round(euros * 100)
+    partes, resto = [], total
+    for p in percentagens[:-1]:
+        # total·p/100 meio para o par numa só divisão inteira: (n + 50) // 100 arredonda
+        # os empates para cima, e os empates com quociente par (n % 200 == 50) voltam atrás
+        n = total * p
+        parte = (n + 50) // 100 - (n % 200 == 50)
+        partes.append(parte / 100)
+        resto -= parte
+    partes.append(resto / 100)
+    return partes
+
+
+def percentagens_exatas(partes, casas=1):
+    """Percentagem de cada parte (em cêntimos) no total, com `casas` decimais; somam sempre 100.
+
+    Tal como em repartir_euros, o acerto do arredondamento vai para a última parte.
+    """
+    total = sum(partes)
+    if total <= 0:
+        return [0.0] * len(partes)
+    escala = 100 * 10 ** casas
+    unidades = [dividir_bancario(parte * escala, total) for parte in partes[:-1]]
+    unidades.append(escala - sum(unidades))
+    return [u / 10 ** casas for u in unidades]
@@ -0,0 +1,34 @@
+"""Deflator partilhado: o índice de preços de uma taxa de inflação, calculado uma vez.
+
+O índice acumulado (1 + i)^k para uma inflação anual, periodicidade e prazo
+vem das tabelas de fatores (ou é calculado, fora da grelha) e fica memorizado
+no processo, por isso as aulas com a mesma inflação usam o mesmo array. Para
+passar séries nominais a valores reais, empilham-se e dividem-se todas por
+ele de uma só vez.
+"""
+import numpy as np
+
+from finance_core.kernels import taxa_periodica
+from finance_core.memo import memorizar
+from finance_core.tables import fatores_tabelados
+
+
+@memorizar(casas={"taxa_anual": 6})
+def indice_precos(taxa_anual, periodos_ano, n, inicio=1):
+    """Índice de preços (1 + i)^k para k = inicio..inicio+n−1, com i a inflação por período (só de leitura)."""
+    return fatores_tabelados(taxa_anual, periodos_ano, n, inicio)
+
+
+def deflacionar_series(series, taxa_anual, periodos_ano, inicio=1):
+    """Valores reais (poder de compra de hoje) de uma ou mais séries nominais do mesmo prazo.
+
+    `series` é uma série (n,) ou várias empilhadas (k, n); devolve a mesma forma,
+    calculada numa só divisão pelo índice de preços.
+    """
+    nominais = np.asarray(series, dtype=float)
+    return nominais / indice_precos(taxa_anual, periodos_ano, nominais.shape[-1], inicio)
+
+
+def fator_precos(taxa_anual, periodos_ano, n):
+    """Quanto custa daqui a n períodos o que hoje custa 1 € (fórmula fechada, para as mensagens)."""
+    return (1 + taxa_periodica(taxa_anual, periodos_ano)) ** n
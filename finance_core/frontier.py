@@ -0,0 +1,113 @@
+"""Fronteira eficiente de um conjunto de ativos, sem vendas a descoberto.
+
+Cada ponto da fronteira é a carteira (pesos ≥ 0 que somam 1) que maximiza
+μ·p − λ/2 · pᵀ Σ p para uma aversão ao risco λ. As dezenas de valores de λ
+são resolvidas ao mesmo tempo, numa matriz (aversões, ativos), por gradiente
+projetado acelerado (FISTA): cada iteração é uma multiplicação pela
+covariância e uma projeção de todas as linhas no simplex. A fórmula fechada
+de Markowitz não serve aqui, porque dá pesos negativos e precisa de Σ
+invertível (a Poupança não tem volatilidade).
+
+Para dar contexto ao gráfico, sorteiam-se também milhares de carteiras ao
+acaso (a "nuvem"), de uma mistura de distribuições de Dirichlet: umas
+equilibradas, outras quase só de um ou dois ativos. O resultado é memorizado
+por conjunto de ativos (retornos, volatilidades e correlações), por isso só
+o primeiro aluno paga o cálculo.
+"""
+import numpy as np
+
+from finance_core.memo import memorizar
+
+AVERSOES = np.geomspace(1e-3, 1e4, 100)   # relativas à escala do conjunto de ativos (ver `fronteira`)
+ITERACOES = 2000
+TOLERANCIA = 1e-7                        # maior variação de um peso entre iterações para parar
+PONTOS = 40                              # pontos clicáveis, mais ou menos, ao longo da fronteira
+CANDIDATOS = 3000
+CONCENTRACOES = (1.0, 0.3, 0.1)          # parâmetros de Dirichlet: de carteiras equilibradas a quase de um só ativo
+
+
+def projetar_simplex(v):
+    """Projeção de cada linha de `v` no simplex (pesos ≥ 0 que somam 1), pelo método da ordenação."""
+    ordenados = -np.sort(-v, axis=1)
+    acumulados = np.cumsum(ordenados, axis=1) - 1
+    ativos = ((ordenados - acumulados / np.arange(1, v.shape[1] + 1)) > 0).sum(axis=1)
+    limiar = acumulados[np.arange(len(v)), ativos - 1] / ativos
+    return np.maximum(v - limiar[:, None], 0.0)
+
+
+def pesos_eficientes(retornos, covariancia, aversoes):
+    """Carteira ótima (uma linha por aversão ao risco) de max μ·p − λ/2 · pᵀ Σ p, com p no simplex."""
+    lipschitz = max(np.linalg.eigvalsh(covariancia).max(), 1e-12)
+    passo = 1 / (aversoes[:, None] * lipschitz)
+    pesos = np.full((len(aversoes), len(retornos)), 1 / len(retornos))
+    extrapolado, t = pesos.copy(), 1.0
+    for iteracao in range(ITERACOES):
+        novos = projetar_simplex(extrapolado + (retornos - aversoes[:, None] * (extrapolado @ covariancia)) * passo)
+        t_novo = (1 + np.sqrt(1 + 4 * t * t)) / 2
+        extrapolado = novos + (t - 1) / t_novo * (novos - pesos)
+        parar = iteracao % 25 == 0 and np.abs(novos - pesos).max() < TOLERANCIA
+        pesos, t = novos, t_novo
+        if parar:
+            break
+    return pesos
+
+
+def carteiras_candidatas(ativos, candidatos=CANDIDATOS, semente=0):
+    """Pesos (candidatos, ativos) sorteados ao acaso, para a nuvem de carteiras possíveis."""
+    alfas = np.repeat(CONCENTRACOES, -(-candidatos // len(CONCENTRACOES)))[:candidatos]
+    gama = np.random.default_rng(semente).standard_gamma(alfas[:, None], size=(candidatos, ativos))
+    return gama / gama.sum(axis=1, keepdims=True)
+
+
+def retorno_e_risco(pesos, retornos, covariancia):
+    """Retorno esperado e volatilidade anuais de cada carteira (uma por linha de `pesos`)."""
+    variancia = np.einsum("ij,ij->i", pesos @ covariancia, pesos)
+    return pesos @ retornos, np.sqrt(np.maximum(variancia, 0.0))
+
+
+def indices_eficientes(retorno, risco):
+    """Índices das carteiras que nenhuma outra de menor risco bate, do menor para o maior risco."""
+    ordem = np.argsort(risco, kind="stable")
+    ordenados = retorno[ordem]
+    melhor_antes = np.maximum.accumulate(ordenados)
+    return ordem[np.r_[True, ordenados[1:] > melhor_antes[:-1]]]
+
+
+def espacar(retorno, risco, pontos=PONTOS):
+    """Índices de pontos da fronteira (já ordenada) a pelo menos 1/`pontos` da sua extensão uns dos outros.
+
+    A grelha de aversões é geométrica e deixa muitos pontos quase iguais perto
+    do risco mínimo; para clicar, interessa tê-los espalhados ao longo da curva.
+    """
+    extensao = np.array([np.ptp(risco), np.ptp(retorno)])
+    coordenadas = np.column_stack([risco, retorno]) / np.where(extensao > 0, extensao, 1.0)
+    escolhidos = [0]
+    for i in range(1, len(risco)):
+        if np.hypot(*(coordenadas[i] - coordenadas[escolhidos[-1]])) >= 1 / pontos or i == len(risco) - 1:
+            escolhidos.append(i)
+    return np.array(escolhidos)
+
+
+@memorizar()
+def fronteira(retornos, volatilidades, correlacao):
+    """Carteiras da fronteira e da nuvem, cada uma com pesos, retorno e risco anuais (taxas decimais).
+
+    Os argumentos são tuplos (a correlação, um tuplo de linhas), para servirem de chave.
+    """
+    retornos = np.asarray(retornos, dtype=float)
+    desvios = np.asarray(volatilidades, dtype=float)
+    covariancia = np.asarray(correlacao, dtype=float) * np.outer(desvios, desvios)
+    # λ em que o ganho de retorno e o custo do risco têm a mesma ordem de grandeza
+    escala = max(np.ptp(retornos), 1e-4) / max(np.diag(covariancia).mean(), 1e-12)
+
+    pesos = pesos_eficientes(retornos, covariancia, escala * AVERSOES)
+    retorno, risco = retorno_e_risco(pesos, retornos, covariancia)
+    eficientes = indices_eficientes(retorno, risco)
+    eficientes = eficientes[espacar(retorno[eficientes], risco[eficientes])]
+
+    nuvem = carteiras_candidatas(len(retornos))
+    retorno_nuvem, risco_nuvem = retorno_e_risco(nuvem, retornos, covariancia)
+    return {
+        "fronteira": {"pesos": pesos[eficientes], "retorno": retorno[eficientes], "risco": risco[eficientes]},
+        "nuvem": {"pesos": nuvem, "retorno": retorno_nuvem, "risco": risco_nuvem},
+    }
@@ -0,0 +1,25 @@
+"""Avaliação em lote de grelhas de cenários (taxa × prazo × periodicidade).
+
+Em vez de simular um cenário de cada vez, calcula o capital final de todas as
+combinações numa só passagem de NumPy, por broadcasting da fórmula fechada.
+"""
+import numpy as np
+
+from finance_core.kernels import taxa_periodica
+
+PERIODICIDADES = (1, 12, 52)
+
+
+def grelha_valor_final(valor_inicial, aporte, taxas_anuais, anos, periodicidades=PERIODICIDADES):
+    """Capital final de cada combinação, com eixos (periodicidade, taxa, anos).
+
+    O aporte é feito no fim de cada período, como em finance_core.kernels;
+    as taxas anuais são decimais.
+    """
+    p = np.asarray(periodicidades, dtype=float)[:, None, None]
+    taxas = taxa_periodica(np.asarray(taxas_anuais, dtype=float)[None, :, None], p)
+    n = np.asarray(anos, dtype=float)[None, None, :] * p
+    fator = (1 + taxas) ** n
+    # Anuidade ((1+r)^n − 1)/r; com taxa 0 fica o número de aportes
+    anuidade = np.divide(fator - 1, taxas, out=np.broadcast_to(n, fator.shape).copy(), where=taxas != 0)
+    return valor_inicial * fator + aporte * anuidade
@@ -0,0 +1,69 @@
+"""Cálculos financeiros partilhados pelas aulas, em NumPy (sem ciclos em Python).
+
+As taxas são sempre decimais (0.06 = 6%) e as séries devolvidas têm um valor
+por período, do período 1 ao período n (como as tabelas das aulas).
+"""
+import numpy as np
+
+
+# --- Taxas ---
+def taxa_periodica(taxa_anual, periodos_ano):
+    """Converte uma taxa anual efetiva na taxa equivalente por período."""
+    return (1 + taxa_anual) ** (1 / periodos_ano) - 1
+
+
+# --- Fatores de capitalização ---
+def fatores_crescimento(taxa, n, inicio=1):
+    """(1 + taxa)^k para k = inicio, ..., inicio + n - 1, por produto acumulado."""
+    fatores = np.cumprod(np.full(n, 1.0 + taxa))
+    if inicio == 0:
+        return np.concatenate(([1.0], fatores[:-1]))
+    return fatores
+
+
+# --- Séries ---
+def crescimento_composto(valor_inicial, taxa, n):
+    """Saldo de um valor inicial que rende à taxa por período, sem aportes."""
+    return valor_inicial * fatores_crescimento(taxa, n)
+
+
+def crescimento_com_aportes(valor_inicial, aporte, taxa, n):
+    """Saldo com aporte no fim de cada período: V0·(1+r)^k + P·((1+r)^k − 1)/r."""
+    fatores = fatores_crescimento(taxa, n)
+    if taxa == 0:
+        return valor_inicial + aporte * np.arange(1, n + 1, dtype=float)
+    return valor_inicial * fatores + aporte * (fatores - 1) / taxa
+
+
+def acumulacao_linear(valor, n, limite=None):
+    """Soma do mesmo valor em cada período (poupança sem juros), opcionalmente até um limite.
+
+    Com uma lista de valores devolve uma linha por valor, todas calculadas de uma vez.
+    """
+    valores = np.multiply.outer(np.asarray(valor, dtype=float), np.arange(1, n + 1))
+    if limite is not None:
+        np.minimum(valores, limite, out=valores)
+    return valores
+
+
+def agregar_por_ano(saldos, valor_inicial, aporte, periodos_ano):
+    """Totais de cada ano a partir dos saldos período a período.
+
+    Como cada ano tem sempre o mesmo número de períodos, os juros de cada
+    período são arrumados numa matriz (anos, periodos_ano) e somados por linha.
+    Devolve o ano, os juros ganhos, os aportes feitos e o saldo no fim do ano.
+    """
+    saldos = np.asarray(saldos, dtype=float)
+    anos = len(saldos) // periodos_ano
+    juros = np.diff(saldos, prepend=valor_inicial) - aporte
+    return {
+        "ano": np.arange(1, anos + 1),
+        "juros": juros.reshape(anos, periodos_ano).sum(axis=1),
+        "aportes": np.full(anos, aporte * periodos_ano),
+        "saldo": saldos[periodos_ano - 1::periodos_ano],
+    }
+
+
+def desvalorizacao_continua(valor, taxa_inflacao, periodos):
+    """Valor de dinheiro parado com inflação capitalizada continuamente: V·e^(−i·t)."""
+    return valor * np.exp(-taxa_inflacao * np.asarray(periodos, dtype=float))
@@ -0,0 +1,119 @@
+"""Memorização partilhada das funções de simulação (um cache por função, por processo).
+
+Os argumentos são normalizados antes de servirem de chave: as taxas são
+arredondadas ao passo do slider (0,1%) e os valores em euros ao cêntimo, para
+que trinta alunos com os mesmos sliders partilhem um único resultado. Cada
+cache guarda no máximo `max_entradas` resultados (o menos usado sai primeiro),
+esquece-os ao fim de `ttl` segundos e conta acertos e falhas.
+
+Os resultados são devolvidos só de leitura (arrays com write=False, tuplos,
+MappingProxyType): quem os recebe não consegue alterar o que está guardado.
+"""
+import functools
+import inspect
+import threading
+import time
+from collections import OrderedDict
+from types import MappingProxyType
+
+import numpy as np
+
+MAX_ENTRADAS = 256
+TTL = 3600.0          # segundos
+
+# --- Todos os caches criados, por nome da função (para a página de administração) ---
+MEMOS = {}
+
+
+def congelar(valor):
+    """Versão só de leitura de um resultado (arrays, tuplos, listas e dicionários)."""
+    if isinstance(valor, np.ndarray):
+        valor.setflags(write=False)
+        return valor
+    if isinstance(valor, (tuple, list)):
+        return tuple(congelar(v) for v in valor)
+    if isinstance(valor, dict):
+        return MappingProxyType({k: congelar(v) for k, v in valor.items()})
+    return valor
+
+
+class Memo:
+    """Cache LRU com validade de uma função; normaliza os argumentos e conta acertos/falhas."""
+
+    def __init__(self, funcao, casas, max_entradas=MAX_ENTRADAS, ttl=TTL):
+        self.funcao = funcao
+        self.nome = f"{funcao.__module__}.{funcao.__qualname__}"
+        self.assinatura = inspect.signature(funcao)
+        self.casas = casas
+        self.max_entradas = max_entradas
+        self.ttl = ttl
+        self._entradas = OrderedDict()       # chave -> (instante, resultado)
+        self._lock = threading.Lock()
+        self.acertos = 0
+        self.falhas = 0
+        self.expirados = 0
+
+    def normalizar(self, args, kwargs):
+        """Argumentos por nome, arredondados às casas decimais do respetivo widget."""
+        ligados = self.assinatura.bind(*args, **kwargs)
+        ligados.apply_defaults()
+        normalizados = {}
+        for nome, valor in ligados.arguments.items():
+            if nome in self.casas:
+                valor = round(float(valor), self.casas[nome]) + 0.0   # + 0.0 junta -0.0 e 0.0
+            elif isinstance(valor, list):
+                valor = tuple(valor)
+            normalizados[nome] = valor
+        return normalizados
+
+    def __call__(self, *args, **kwargs):
+        argumentos = self.normalizar(args, kwargs)
+        chave = tuple(argumentos.values())
+        agora = time.monotonic()
+        with self._lock:
+            entrada = self._entradas.get(chave)
+            if entrada is not None:
+                if agora - entrada[0] <= self.ttl:
+                    self._entradas.move_to_end(chave)
+                    self.acertos += 1
+                    return entrada[1]
+                del self._entradas[chave]
+                self.expirados += 1
+            self.falhas += 1
+
+        resultado = congelar(self.funcao(**argumentos))
+        with self._lock:
+            self._entradas[chave] = (agora, resultado)
+            self._entradas.move_to_end(chave)
+            while len(self._entradas) > self.max_entradas:
+                self._entradas.popitem(last=False)
+        return resultado
+
+    def limpar(self):
+        with self._lock:
+            self._entradas.clear()
+
+    def estatisticas(self):
+        total = self.acertos + self.falhas
+        return {
+            "Função": self.nome,
+            "Entradas": len(self._entradas),
+            "Acertos": self.acertos,
+            "Falhas": self.falhas,
+            "Expirados": self.expirados,
+            "Taxa de acerto (%)": 100 * self.acertos / total if total else 0.0,
+        }
+
+
+def memorizar(casas=None, max_entradas=MAX_ENTRADAS, ttl=TTL):
+    """Decorador: @memorizar(casas={"rendimento_anual": 1, "valor_inicial": 2})."""
+    def decorador(funcao):
+        memo = Memo(funcao, casas or {}, max_entradas, ttl)
+        MEMOS[memo.nome] = memo
+        return functools.wraps(funcao)(memo)
+    return decorador
+
+
+def estatisticas():
+    """Acertos, falhas e tamanho de cada cache, para a página de administração."""
+    return [memo.estatisticas() for memo in MEMOS.values()]
@@ -0,0 +1,154 @@
+"""Simulação de Monte Carlo do crescimento de um investimento com risco.
+
+Os retornos são lognormais: em cada passo o log do crescimento é normal, com
+a média ajustada para que o crescimento médio anual seja 1 + retorno_anual e
+o desvio dado pela volatilidade anual. Todos os caminhos são sorteados numa
+só chamada ao gerador do NumPy, numa matriz (passos, caminhos) em que cada
+linha é um instante, e somados ao longo do tempo com um cumsum.
+
+Um passo pode juntar vários meses: como os log-retornos se somam, um passo
+de 12 meses tem exatamente a distribuição da soma de 12 sorteios mensais.
+Os percentis só precisam do log do crescimento (a exponencial não muda a
+ordem), por isso a exponencial é aplicada apenas aos percentis.
+
+Os caminhos são simulados em blocos de tamanho fixo (cerca de um milhão de
+valores) e cada bloco é resumido num histograma por passo
+(finance_core/quantiles.py) antes de ser deitado fora: a memória não depende
+do número de caminhos. Cada bloco tem a sua semente, filha de
+SeedSequence(semente), por isso o resultado só depende da semente e não de
+quem simula cada bloco.
+
+Nas simulações grandes, os blocos são repartidos pelos processos do pool
+partilhado (finance_core/pool.py). Cada processo devolve o seu histograma e
+as contagens são somadas: o resultado é o mesmo, bit a bit, com qualquer
+número de processos.
+"""
+from functools import partial
+
+import numpy as np
+
+from finance_core.pool import PROCESSOS, mapear
+from finance_core.quantiles import HistogramaQuantis
+
+PERCENTIS = (5, 25, 50, 75, 95)
+ELEMENTOS_POR_BLOCO = 1 << 20
+CAMINHOS_PILOTO = 2048
+BLOCOS_POR_PROCESSO = 2     # abaixo disto não compensa enviar trabalho para outro processo
+
+
+def parametros_lognormais(retorno_anual, volatilidade_anual, meses=1):
+    """Média e desvio do log-retorno de um passo de `meses` meses (taxas decimais)."""
+    anos = meses / 12
+    media = (np.log1p(retorno_anual) - volatilidade_anual ** 2 / 2) * anos
+    return media, volatilidade_anual * np.sqrt(anos)
+
+
+def simular_log_crescimento(retorno_anual, volatilidade_anual, passos, caminhos, meses_por_passo=1, semente=0):
+    """Log do crescimento acumulado de cada caminho, matriz (passos + 1, caminhos) a começar em 0."""
+    media, desvio = parametros_lognormais(retorno_anual, volatilidade_anual, meses_por_passo)
+    log = np.empty((passos + 1, caminhos))
+    log[0] = 0.0
+    np.random.default_rng(semente).standard_normal(out=log[1:])
+    log[1:] *= desvio
+    log[1:] += media
+    np.cumsum(log, axis=0, out=log)
+    return log
+
+
+def percentis_por_passo(matriz, percentis=PERCENTIS):
+    """Percentis de cada linha (um por coluna do resultado), como np.percentile mas por partição parcial.
+
+    Só as posições pedidas ficam no sítio certo, sem ordenar todos os caminhos.
+    """
+    posicoes = np.asarray(percentis) / 100 * (matriz.shape[1] - 1)
+    abaixo = np.floor(posicoes).astype(int)
+    acima = np.ceil(posicoes).astype(int)
+    parcial = np.partition(matriz, np.union1d(abaixo, acima), axis=1)
+    baixo, alto = parcial[:, abaixo], parcial[:, acima]
+    return (baixo + (alto - baixo) * (posicoes - abaixo)).T
+
+
+def tamanhos_dos_blocos(caminhos, valores_por_caminho):
+    """Número de caminhos de cada bloco, para que um bloco tenha cerca de ELEMENTOS_POR_BLOCO valores."""
+    por_bloco = max(1, ELEMENTOS_POR_BLOCO // valores_por_caminho)
+    cheios, resto = divmod(caminhos, por_bloco)
+    return [por_bloco] * cheios + ([resto] if resto else [])
+
+
+def sementes_dos_blocos(semente, blocos):
+    """Semente do piloto e de cada bloco: filhas 0, 1, 2... de SeedSequence(semente)."""
+    return np.random.SeedSequence(semente).spawn(blocos + 1)
+
+
+def blocos_de_caminhos(simular, caminhos, valores_por_caminho, semente=0):
+    """(tamanho, semente) de cada bloco e a amostra piloto (com a semente 0 da sequência).
+
+    `simular(caminhos, semente=...)` devolve o log do crescimento, matriz (passos + 1, caminhos).
+    """
+    tamanhos = tamanhos_dos_blocos(caminhos, valores_por_caminho)
+    piloto, *sementes = sementes_dos_blocos(semente, len(tamanhos))
+    return list(zip(tamanhos, sementes)), simular(CAMINHOS_PILOTO, semente=piloto)
+
+
+def simular_blocos(simular, limites, blocos):
+    """Simula uma lista de blocos (num processo do pool ou aqui) e devolve o histograma e as perdas."""
+    esboco = HistogramaQuantis(*limites)
+    perdas = 0
+    for tamanho, semente in blocos:
+        log = simular(tamanho, semente=semente)
+        esboco.acrescentar(log)
+        perdas += int(np.count_nonzero(log[-1] < 0))
+    return esboco, perdas
+
+
+def repartir_blocos(blocos, processos=None):
+    """Blocos seguidos agrupados por processo, com pelo menos BLOCOS_POR_PROCESSO em cada grupo."""
+    grupos = max(1, min(processos or PROCESSOS, len(blocos) // BLOCOS_POR_PROCESSO))
+    fronteiras = np.linspace(0, len(blocos), grupos + 1).astype(int)
+    return [blocos[a:b] for a, b in zip(fronteiras[:-1], fronteiras[1:])]
+
+
+def _resultado(valor_inicial, log_percentis, perdas, caminhos):
+    return {
+        "percentis": dict(zip(PERCENTIS, valor_inicial * np.exp(log_percentis))),
+        "prob_perda": perdas / caminhos,
+    }
+
+
+def leque_simulado(valor_inicial, simular, caminhos, valores_por_caminho, semente=0, processos=None):
+    """Leque de qualquer simulador de caminhos (um ativo, uma carteira...), em blocos e em fluxo.
+
+    `simular` tem de poder ser enviado para outro processo (função do módulo
+    ou functools.partial de uma). Os blocos são repartidos por `processos`
+    processos (por omissão, os do pool); o resultado não depende deste número.
+    """
+    blocos, amostra = blocos_de_caminhos(simular, caminhos, valores_por_caminho, semente)
+    limites = HistogramaQuantis.limites_da_amostra(amostra)
+    tarefas = [(simular, limites, grupo) for grupo in repartir_blocos(blocos, processos)]
+    (esboco, perdas), *outros = mapear(simular_blocos, tarefas)
+    for outro, outras_perdas in outros:
+        esboco.juntar(outro)
+        perdas += outras_perdas
+    return _resultado(valor_inicial, esboco.percentis(PERCENTIS), perdas, caminhos)
+
+
+def leque_simulado_exato(valor_inicial, simular, caminhos, valores_por_caminho, semente=0):
+    """Como leque_simulado, com os mesmos caminhos, mas todos em memória e com percentis exatos (para comparar)."""
+    blocos, _ = blocos_de_caminhos(simular, caminhos, valores_por_caminho, semente)
+    log = np.concatenate([simular(tamanho, semente=s) for tamanho, s in blocos], axis=1)
+    return _resultado(valor_inicial, percentis_por_passo(log), int(np.count_nonzero(log[-1] < 0)), caminhos)
+
+
+def leque(valor_inicial, retorno_anual, volatilidade_anual, meses, caminhos, meses_por_passo=1, semente=0,
+          processos=None):
+    """Percentis do valor em cada passo (um array por percentil) e probabilidade de acabar a perder dinheiro."""
+    passos = meses // meses_por_passo
+    simular = partial(simular_log_crescimento, retorno_anual, volatilidade_anual, passos, meses_por_passo=meses_por_passo)
+    return leque_simulado(valor_inicial, simular, caminhos, passos + 1, semente, processos)
+
+
+def leque_exato(valor_inicial, retorno_anual, volatilidade_anual, meses, caminhos, meses_por_passo=1, semente=0):
+    """Como leque, com os mesmos caminhos, mas com todos em memória e percentis exatos (para comparar)."""
+    passos = meses // meses_por_passo
+    simular = partial(simular_log_crescimento, retorno_anual, volatilidade_anual, passos, meses_por_passo=meses_por_passo)
+    return leque_simulado_exato(valor_inicial, simular, caminhos, passos + 1, semente)
@@ -0,0 +1,92 @@
+"""Pool de processos partilhado pelas simulações grandes (um por servidor).
+
+O pool é criado na primeira simulação que o usa e fica vivo para todas as
+sessões: um rerun nunca arranca processos novos. Usa o arranque "spawn",
+porque o servidor do Streamlit tem threads e fazer fork de um processo com
+threads pode bloquear. Se um processo do pool morrer, o pool é descartado e
+o trabalho é feito no próprio processo.
+
+Com "spawn", cada processo novo volta a importar o ficheiro do __main__, e no
+`streamlit run` esse ficheiro é o main.py: cada processo arrancaria a
+aplicação inteira (Streamlit, pré-aquecimento, base de dados das medições).
+Por isso os processos são arrancados com um __main__ vazio e só importam o
+finance_core.montecarlo.
+"""
+import multiprocessing
+import os
+import sys
+import threading
+import types
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager
+
+PROCESSOS = int(os.environ.get("APP_MC_WORKERS", os.cpu_count() or 1))
+MODULOS_INICIAIS = ("finance_core.montecarlo",)
+
+_pool = None
+_lock = threading.Lock()
+_lock_arranque = threading.Lock()
+
+
+def _importar(nomes):
+    """Arranque de cada processo do pool: importa só os módulos das simulações."""
+    for nome in nomes:
+        __import__(nome)
+
+
+def pool():
+    """O pool partilhado, criado na primeira utilização."""
+    global _pool
+    if _pool is None:
+        with _lock:
+            if _pool is None:
+                _pool = ProcessPoolExecutor(
+                    max_workers=PROCESSOS, mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_importar, initargs=(MODULOS_INICIAIS,)
+                )
+    return _pool
+
+
+@contextmanager
+def _sem_script_principal():
+    """Troca o __main__ por um módulo vazio enquanto se arrancam processos.
+
+    O "spawn" só reimporta o __main__ se ele tiver __file__ ou __spec__. O
+    ProcessPoolExecutor arranca os processos à medida que recebe tarefas, por
+    isso a troca é feita à volta dos submit(). O Streamlit instala um __main__
+    novo em cada execução do script: se isso acontecer entretanto, fica o dele.
+    """
+    vazio = types.ModuleType("__main__")
+    with _lock_arranque:
+        principal = sys.modules.get("__main__")
+        sys.modules["__main__"] = vazio
+        try:
+            yield
+        finally:
+            if sys.modules.get("__main__") is vazio:
+                sys.modules["__main__"] = principal
+
+
+def _descartar():
+    global _pool
+    with _lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+            _pool = None
+
+
+def mapear(funcao, tarefas):
+    """Resultados de funcao(*tarefa) para cada tarefa, pela ordem, corridos nos processos do pool.
+
+    Com uma só tarefa (ou um só processo) corre aqui mesmo, sem passar pelo pool.
+    """
+    if len(tarefas) <= 1 or PROCESSOS <= 1:
+        return [funcao(*tarefa) for tarefa in tarefas]
+    try:
+        with _sem_script_principal():
+            futuros = [pool().submit(funcao, *tarefa) for tarefa in tarefas]
+        return [futuro.result() for futuro in futuros]
+    except BrokenProcessPool:
+        _descartar()
+        return [funcao(*tarefa) for tarefa in tarefas]
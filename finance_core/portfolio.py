@@ -0,0 +1,133 @@
+"""Carteira de vários ativos com retornos correlacionados (Monte Carlo).
+
+Os log-retornos dos ativos num passo são normais com a covariância dada pelas
+volatilidades e pela matriz de correlação. O fator de Cholesky L (com
+L @ L.T = covariância) é calculado uma vez por carteira e memorizado; os
+retornos correlacionados de todos os caminhos e passos saem de uma só
+multiplicação L @ Z, com Z o array (ativos, passos × caminhos) de normais.
+
+Com rebalanceamento a cada R passos, os passos são agrupados em períodos de
+R: dentro de um período cada ativo cresce por si (os pesos derivam) e no fim
+a carteira volta aos pesos iniciais, por isso o crescimento de cada período é
+Σ pesos × crescimento de cada ativo e os períodos multiplicam-se. Sem
+rebalanceamento há um só período. Como os log-retornos se somam, um passo de
+vários meses tem exatamente a distribuição da soma dos meses, e basta que o
+passo divida o período de rebalanceamento.
+"""
+from functools import partial
+
+import numpy as np
+
+from finance_core.memo import memorizar
+from finance_core.montecarlo import leque_simulado, parametros_lognormais
+
+CORRELACAO_MINIMA = 1e-6     # menor valor próprio aceite numa matriz de correlação ajustada
+
+
+def ajustar_correlacao(correlacao):
+    """Matriz de correlação válida mais próxima e se foi preciso mudá-la.
+
+    Simetriza, corta os valores a [−1, 1], põe 1 na diagonal e, se não for
+    definida positiva, sobe os valores próprios negativos e volta a normalizar.
+    """
+    original = np.asarray(correlacao, dtype=float)
+    matriz = np.clip((original + original.T) / 2, -1.0, 1.0)
+    np.fill_diagonal(matriz, 1.0)
+    valores, vetores = np.linalg.eigh(matriz)
+    if valores.min() < CORRELACAO_MINIMA:
+        matriz = (vetores * np.maximum(valores, CORRELACAO_MINIMA)) @ vetores.T
+        escala = np.sqrt(np.diag(matriz))
+        matriz = matriz / np.outer(escala, escala)
+        np.fill_diagonal(matriz, 1.0)
+    return matriz, not np.allclose(matriz, original)
+
+
+def espelhar_edicoes(original, editada):
+    """Matriz editada em que cada célula mudada só de um lado do par é copiada para a simétrica.
+
+    Editar a correlação entre A e B muda também a de B com A. As células
+    apagadas (None ou NaN) voltam ao valor original. Se as duas células de um
+    par foram mudadas para valores diferentes, ficam como estão (e
+    ajustar_correlacao usa a média).
+    """
+    original = np.asarray(original, dtype=float)
+    editada = np.array(editada, dtype=float)
+    editada = np.where(np.isnan(editada), original, editada)
+    mudadas = editada != original
+    so_de_um_lado = mudadas & ~mudadas.T
+    return np.where(so_de_um_lado.T, editada.T, editada)
+
+
+def preparar_correlacao(original, editada, casas=4):
+    """Matriz de correlação a simular a partir da tabela editada: (tuplo de tuplos, se foi ajustada).
+
+    Os valores são arredondados antes de ajustar a matriz (e não depois), para
+    que a matriz usada seja sempre definida positiva. Só conta como ajuste o
+    que mudar depois de espelhar as edições.
+    """
+    pedida = np.round(espelhar_edicoes(original, editada), casas)
+    matriz, ajustada = ajustar_correlacao(pedida)
+    return tuple(map(tuple, matriz.tolist())), ajustada
+
+
+@memorizar()
+def fator_cholesky(volatilidades, correlacao, meses=1):
+    """Fator L (triangular inferior) da covariância dos log-retornos de um passo de `meses` meses."""
+    desvios = np.asarray(volatilidades, dtype=float) * np.sqrt(meses / 12)
+    return desvios[:, None] * np.linalg.cholesky(np.asarray(correlacao, dtype=float))
+
+
+def volatilidade_carteira(pesos, volatilidades, correlacao):
+    """Volatilidade anual da carteira, √(pᵀ Σ p), com os pesos em frações."""
+    pesos = np.asarray(pesos, dtype=float)
+    desvios = np.asarray(volatilidades, dtype=float)
+    covariancia = np.asarray(correlacao, dtype=float) * np.outer(desvios, desvios)
+    return float(np.sqrt(pesos @ covariancia @ pesos))
+
+
+def simular_log_carteira(medias, fator, pesos, passos, por_periodo, caminhos, semente=0):
+    """Log do crescimento da carteira em cada passo, matriz (passos + 1, caminhos) a começar em 0.
+
+    `por_periodo` é o número de passos entre rebalanceamentos (passos, se nunca).
+    """
+    periodos = -(-passos // por_periodo)
+    ativos = len(pesos)
+    # Ativos na primeira dimensão: a multiplicação é uma só (ativos, ativos) @ (ativos, passos × caminhos)
+    normais = np.random.default_rng(semente).standard_normal((ativos, periodos * por_periodo * caminhos))
+    retornos = fator @ normais
+    del normais
+    retornos += np.asarray(medias)[:, None]
+    retornos = retornos.reshape(ativos, periodos, por_periodo, caminhos)
+    np.cumsum(retornos, axis=2, out=retornos)
+    np.exp(retornos, out=retornos)
+    dentro = np.log(pesos @ retornos.reshape(ativos, -1)).reshape(periodos, por_periodo, caminhos)
+    dentro[1:] += np.cumsum(dentro[:-1, -1], axis=0)[:, None]   # crescimento dos períodos anteriores
+    log = np.empty((passos + 1, caminhos))
+    log[0] = 0.0
+    log[1:] = dentro.reshape(-1, caminhos)[:passos]
+    return log
+
+
+def leque_carteira(valor_inicial, pesos, retornos_anuais, volatilidades_anuais, correlacao, meses, caminhos,
+                   meses_por_passo=1, rebalancear=0, semente=0, processos=None):
+    """Percentis do valor da carteira em cada passo e probabilidade de acabar a perder dinheiro.
+
+    `pesos` não precisam de somar 1 (são normalizados); `rebalancear` é o
+    número de meses entre rebalanceamentos (0 = nunca) e tem de ser múltiplo
+    de `meses_por_passo`.
+    """
+    if rebalancear % meses_por_passo:
+        raise ValueError("O período de rebalanceamento tem de ser múltiplo do passo da simulação.")
+    passos = meses // meses_por_passo
+    pesos = np.asarray(pesos, dtype=float)
+    # Os ativos sem peso não entram: menos normais a sortear, com a mesma distribuição para os restantes
+    usados = np.flatnonzero(pesos)
+    pesos = pesos[usados] / pesos.sum()
+    volatilidades = np.asarray(volatilidades_anuais, dtype=float)[usados]
+    correlacao = np.asarray(correlacao, dtype=float)[np.ix_(usados, usados)]
+    fator = fator_cholesky(tuple(volatilidades.tolist()), tuple(map(tuple, correlacao.tolist())), meses_por_passo)
+    medias, _ = parametros_lognormais(np.asarray(retornos_anuais, dtype=float)[usados], volatilidades,
+                                      meses_por_passo)
+    por_periodo = rebalancear // meses_por_passo if rebalancear else max(passos, 1)
+    simular = partial(simular_log_carteira, medias, fator, pesos, passos, por_periodo)
+    return leque_simulado(valor_inicial, simular, caminhos, (passos + 1) * len(pesos), semente, processos)
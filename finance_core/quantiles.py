@@ -0,0 +1,70 @@
+"""Percentis em fluxo: histogramas de bins fixos, um por instante da simulação.
+
+Cada bloco de caminhos é somado às contagens e pode ser deitado fora, por
+isso a memória não depende do número de caminhos. As contagens são inteiras:
+juntar esboços (de blocos ou de processos diferentes) é somá-las, e o
+resultado não depende da ordem. Os percentis são lidos das contagens
+acumuladas, interpolando dentro de cada bin.
+
+Os limites dos bins de cada instante são fixados no início a partir de uma
+amostra piloto (o mínimo e o máximo, alargados de cada lado). Valores fora
+dos limites contam no primeiro ou no último bin, o que só afeta as caudas
+extremas.
+"""
+import numpy as np
+
+BINS = 2048
+MARGEM = 0.1          # fração da amplitude da amostra piloto acrescentada de cada lado
+
+
+class HistogramaQuantis:
+    """Contagens (passos, bins) com limites próprios para cada passo."""
+
+    __slots__ = ("inferior", "largura", "contagens")
+
+    def __init__(self, inferior, superior, bins=BINS):
+        self.inferior = np.asarray(inferior, dtype=float)
+        self.largura = (np.asarray(superior, dtype=float) - self.inferior) / bins
+        self.contagens = np.zeros((len(self.inferior), bins), dtype=np.int64)
+
+    @staticmethod
+    def limites_da_amostra(amostra, margem=MARGEM):
+        """Limites (inferior, superior) de cada passo tirados de uma amostra piloto (passos, caminhos).
+
+        Todos os esboços criados com os mesmos limites podem ser juntados.
+        """
+        minimo, maximo = amostra.min(axis=1), amostra.max(axis=1)
+        # Passos sem dispersão (o início, ou um ativo sem risco) ficam com bins minúsculos à volta do valor
+        amplitude = np.maximum(maximo - minimo, 1e-9 * (1 + np.abs(minimo)))
+        return minimo - margem * amplitude, minimo + (1 + margem) * amplitude
+
+    @property
+    def total(self):
+        return int(self.contagens[0].sum())
+
+    def acrescentar(self, bloco):
+        """Soma às contagens um bloco (passos, caminhos), com um só bincount para todos os passos."""
+        passos, bins = self.contagens.shape
+        indices = (bloco - self.inferior[:, None]) / self.largura[:, None]
+        np.clip(indices, 0, bins - 1, out=indices)
+        planos = indices.astype(np.intp)
+        planos += np.arange(passos)[:, None] * bins
+        self.contagens += np.bincount(planos.ravel(), minlength=passos * bins).reshape(passos, bins)
+
+    def juntar(self, outro):
+        """Acrescenta as contagens de outro esboço com os mesmos limites."""
+        self.contagens += outro.contagens
+
+    def percentis(self, percentis):
+        """Percentis de cada passo (uma linha por percentil), com a mesma convenção de np.percentile."""
+        acumuladas = np.cumsum(self.contagens, axis=1)
+        total = acumuladas[:, -1]
+        linhas = []
+        for p in percentis:
+            posicao = p / 100 * (total - 1) + 0.5       # posição no meio da "caixa" de cada caminho
+            bin_ = np.minimum((acumuladas < posicao[:, None]).sum(axis=1), self.contagens.shape[1] - 1)
+            contagem = np.take_along_axis(self.contagens, bin_[:, None], axis=1)[:, 0]
+            antes = np.take_along_axis(acumuladas, bin_[:, None], axis=1)[:, 0] - contagem
+            fracao = (posicao - antes) / np.maximum(contagem, 1)
+            linhas.append(self.inferior + (bin_ + fracao) * self.largura)
+        return np.array(linhas)
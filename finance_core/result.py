@@ -0,0 +1,51 @@
+"""Resultado compacto de uma simulação: arrays NumPy com nomes, sem pandas.
+
+Um Resultado guarda o índice (mês, período, ano...) num array int32 e todas
+as colunas numa única matriz float64 contígua (uma linha por coluna), só de
+leitura. `resultado["Valor (€)"]` devolve uma vista dessa linha; o DataFrame
+só é criado quando alguém o pede com `.to_frame()` (por exemplo, para uma
+tabela).
+"""
+import numpy as np
+
+from help_core.lazy_imports import lazy_import
+
+pd = lazy_import("pandas")
+
+
+class Resultado:
+    """Índice e colunas de uma simulação, com acesso por nome às vistas de cada coluna."""
+
+    __slots__ = ("nome_indice", "indice", "colunas", "valores")
+
+    def __init__(self, nome_indice, indice, colunas):
+        self.nome_indice = nome_indice
+        self.indice = np.asarray(indice, dtype=np.int32)
+        self.colunas = tuple(colunas)
+        self.valores = np.empty((len(self.colunas), len(self.indice)))
+        for linha, serie in zip(self.valores, colunas.values()):
+            linha[:] = serie
+        self.indice.setflags(write=False)
+        self.valores.setflags(write=False)
+
+    def __getitem__(self, nome):
+        if nome == self.nome_indice:
+            return self.indice
+        return self.valores[self.colunas.index(nome)]
+
+    def __len__(self):
+        return len(self.indice)
+
+    def __repr__(self):
+        return f"<Resultado {self.nome_indice}={len(self)} colunas={list(self.colunas)}>"
+
+    def __setstate__(self, estado):
+        # Vindo do st.cache_data (pickle): os arrays voltam a ficar só de leitura
+        for nome, valor in estado[1].items():
+            object.__setattr__(self, nome, valor)
+        self.indice.setflags(write=False)
+        self.valores.setflags(write=False)
+
+    def to_frame(self):
+        """DataFrame com o índice e todas as colunas (cópia, criado só quando é pedido)."""
+        return pd.DataFrame({self.nome_indice: self.indice, **{nome: self[nome] for nome in self.colunas}})
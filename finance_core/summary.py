@@ -0,0 +1,23 @@
+"""Resumos em fórmula fechada: os números das mensagens sem construir séries.
+
+Usam as mesmas convenções de finance_core.kernels (taxas decimais por período,
+aporte no fim de cada período) e dão o último valor das séries correspondentes.
+"""
+
+
+def valor_futuro(valor_inicial, aporte, taxa, n):
+    """Saldo ao fim de n períodos: V0·(1+r)^n + P·((1+r)^n − 1)/r."""
+    if taxa == 0:
+        return valor_inicial + aporte * n
+    fator = (1 + taxa) ** n
+    return valor_inicial * fator + aporte * (fator - 1) / taxa
+
+
+def total_aportado(valor_inicial, aporte, n):
+    """Dinheiro que saiu do bolso: valor inicial mais os n aportes."""
+    return valor_inicial + aporte * n
+
+
+def juros_totais(valor_inicial, aporte, taxa, n):
+    """Parte do saldo final que veio dos juros."""
+    return valor_futuro(valor_inicial, aporte, taxa, n) - total_aportado(valor_inicial, aporte, n)
@@ -0,0 +1,107 @@
+"""Tabelas de fatores de crescimento pré-calculadas para a grelha dos sliders.
+
+Os sliders das aulas só produzem taxas anuais de 0% a 15% em passos de 0,1%
+e prazos até 70 anos (mais 5 no cenário "começar mais cedo"). Para cada
+periodicidade (anual, mensal, semanal) calcula-se uma vez por processo, com
+NumPy, a tabela de fatores acumulados (1+r)^k e de fatores de anuidade
+((1+r)^k − 1)/r, para todas as taxas e períodos da grelha. As tabelas são só
+de leitura e partilhadas por todas as sessões. Cada simulação passa a ser uma
+consulta à tabela e uma multiplicação. Valores fora da grelha (por exemplo,
+escritos à mão num number_input) são calculados diretamente com
+finance_core.kernels.
+"""
+import threading
+from types import MappingProxyType
+
+import numpy as np
+
+from finance_core.kernels import taxa_periodica, fatores_crescimento, crescimento_com_aportes
+from finance_core.summary import valor_futuro
+
+# --- Grelha ---
+PASSO_TAXA = 0.001          # 0,1%
+TAXA_MAXIMA = 0.15          # 15%
+ANOS_MAXIMOS = 75           # 70 anos do slider + 5 anos "mais cedo"
+PERIODICIDADES = (1, 12, 52)
+
+_tabelas = {}
+_lock = threading.Lock()
+
+
+def construir_tabela(periodos_ano, anos=ANOS_MAXIMOS):
+    """Calcula as tabelas de uma periodicidade: linhas = taxas da grelha, colunas = períodos 0..n."""
+    taxas_anuais = np.arange(round(TAXA_MAXIMA / PASSO_TAXA) + 1) * PASSO_TAXA
+    taxas = taxa_periodica(taxas_anuais, periodos_ano)
+    k = np.arange(anos * periodos_ano + 1)
+    acumulado = np.power.outer(1 + taxas, k)
+    anuidade = np.empty_like(acumulado)
+    anuidade[0] = k                                   # taxa 0: a anuidade é só contar os aportes
+    anuidade[1:] = (acumulado[1:] - 1) / taxas[1:, None]
+    for tabela in (taxas, acumulado, anuidade):
+        tabela.setflags(write=False)
+    return MappingProxyType({"taxa": taxas, "acumulado": acumulado, "anuidade": anuidade})
+
+
+def tabela(periodos_ano):
+    """Tabela de uma periodicidade, construída na primeira utilização e partilhada pelo processo."""
+    if periodos_ano not in _tabelas:
+        with _lock:
+            if periodos_ano not in _tabelas:
+                _tabelas[periodos_ano] = construir_tabela(periodos_ano)
+    return _tabelas[periodos_ano]
+
+
+def indice_taxa(taxa_anual):
+    """Linha da tabela para uma taxa anual, ou None se a taxa não estiver na grelha."""
+    i = round(taxa_anual / PASSO_TAXA)
+    if 0 <= i * PASSO_TAXA <= TAXA_MAXIMA and abs(i * PASSO_TAXA - taxa_anual) < 1e-9:
+        return i
+    return None
+
+
+def _na_grelha(taxa_anual, periodos_ano, n):
+    """Índice da taxa se (taxa, periodicidade, n) couber na tabela; senão None."""
+    if periodos_ano not in PERIODICIDADES or n > ANOS_MAXIMOS * periodos_ano:
+        return None
+    return indice_taxa(taxa_anual)
+
+
+# --- Consultas ---
+def fatores_tabelados(taxa_anual, periodos_ano, n, inicio=1):
+    """(1+r)^k para k = inicio..inicio+n−1, com r a taxa por período (vista só de leitura)."""
+    i = _na_grelha(taxa_anual, periodos_ano, inicio + n - 1)
+    if i is None:
+        return fatores_crescimento(taxa_periodica(taxa_anual, periodos_ano), n, inicio)
+    return tabela(periodos_ano)["acumulado"][i, inicio:inicio + n]
+
+
+def serie_tabelada(valor_inicial, aporte, taxa_anual, periodos_ano, n):
+    """Saldo em cada um dos n períodos, com aporte no fim de cada período."""
+    i = _na_grelha(taxa_anual, periodos_ano, n)
+    if i is None:
+        return crescimento_com_aportes(valor_inicial, aporte, taxa_periodica(taxa_anual, periodos_ano), n)
+    t = tabela(periodos_ano)
+    return valor_inicial * t["acumulado"][i, 1:n + 1] + aporte * t["anuidade"][i, 1:n + 1]
+
+
+def series_por_horizonte(valor_inicial, aporte, taxa_anual, periodos_ano, horizontes):
+    """Uma série por horizonte, a partir de uma só série calculada para o mais longo.
+
+    Cenários que partem do mesmo ponto e só diferem no prazo são o início da
+    série mais longa: cada um é devolvido como vista (fatia) dela, sem copiar.
+    """
+    serie = serie_tabelada(valor_inicial, aporte, taxa_anual, periodos_ano, max(horizontes))
+    return [serie[:n] for n in horizontes]
+
+
+def valor_futuro_tabelado(valor_inicial, aporte, taxa_anual, periodos_ano, n):
+    """Saldo ao fim de n períodos: duas consultas e uma multiplicação.
+
+    Para um único valor, a fórmula fechada (summary.valor_futuro) continua a ser
+    mais barata em Python; a tabela compensa nas séries (benchmarks.growth_tables).
+    """
+    i = _na_grelha(taxa_anual, periodos_ano, n)
+    if i is None:
+        return valor_futuro(valor_inicial, aporte, taxa_periodica(taxa_anual, periodos_ano), n)
+    t = tabela(periodos_ano)
+    return float(valor_inicial * t["acumulado"][i, n] + aporte * t["anuidade"][i, n])
@@ -0,0 +1,73 @@
+import hmac
+import os
+
+import streamlit as st
+
+from help_core.instrumentation import RETENCAO_HORAS, percentis
+from help_core.session_memory import TEMPO_INATIVIDADE, resumo_memoria
+from finance_core.memo import MAX_ENTRADAS, TTL, estatisticas
+
+# --- Página escondida (?pagina=admin&token=...); sem ADMIN_TOKEN definido, fica desligada ---
+ADMIN_TOKEN = os.environ.get("ADMIN_TOKEN")
+
+
+def autorizado():
+    token = st.query_params.get("token") or ""
+    return bool(ADMIN_TOKEN) and hmac.compare_digest(token.encode(), ADMIN_TOKEN.encode())
+
+
+def memoria_sessoes():
+    """Pegada do st.session_state: total, por aula e expulsões por inatividade."""
+    st.subheader("🧠 Memória das sessões")
+    resumo = resumo_memoria()
+    col1, col2, col3 = st.columns(3)
+    col1.metric("Sessões ativas", resumo["sessoes"])
+    col2.metric("Estado total", f"{resumo['bytes_total'] / 1024:,.1f} KB")
+    col3.metric("Aulas expulsas", resumo["expulsoes"], help=f"{resumo['bytes_libertados'] / 1024:,.1f} KB libertados")
+    if resumo["bytes_por_aula"]:
+        st.dataframe(
+            [{"Aula": aula, "Estado (KB)": n / 1024} for aula, n in sorted(resumo["bytes_por_aula"].items())],
+            hide_index=True
+        )
+    st.caption(f"O estado de uma aula é apagado após {TEMPO_INATIVIDADE / 60:.0f} minutos sem uso (APP_SESSION_IDLE_MINUTES).")
+
+
+def cache_simulacoes():
+    """Acertos e falhas da memorização partilhada das funções de simulação."""
+    st.subheader("🗃️ Cache das simulações")
+    linhas = estatisticas()
+    if not linhas:
+        st.info("Ainda nenhuma aula com simulações memorizadas foi carregada.")
+        return
+    st.dataframe(
+        linhas,
+        hide_index=True,
+        column_config={"Taxa de acerto (%)": st.column_config.NumberColumn(format="%.1f")}
+    )
+    st.caption(f"Até {MAX_ENTRADAS} resultados por função, esquecidos ao fim de {TTL / 60:.0f} minutos.")
+
+
+def run():
+    if not autorizado():
+        st.error("🔒 Acesso reservado.")
+        return
+
+    st.title("🛠️ Desempenho das aulas")
+
+    memoria_sessoes()
+    cache_simulacoes()
+
+    st.subheader("⏱️ Tempos por fase")
+    horas = st.slider("Últimas N horas", min_value=1, max_value=RETENCAO_HORAS, value=24)
+    resumo = percentis(horas)
+    if not resumo:
+        st.info("Ainda não há medições neste intervalo.")
+        return
+
+    resumo.sort(key=lambda r: r["p95 (ms)"], reverse=True)
+    st.dataframe(
+        resumo,
+        hide_index=True,
+        column_config={c: st.column_config.NumberColumn(format="%.1f") for c in ("p50 (ms)", "p95 (ms)", "p99 (ms)")}
+    )
+    st.caption("Fases: importacao, calculo, grafico, render e run (execução completa da aula).")
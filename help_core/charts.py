@@ -0,0 +1,66 @@
+import numpy as np
+
+from help_core.lazy_imports import lazy_import
+
+go = lazy_import("plotly.graph_objects")
+
+
+def grafico_linhas(series, titulo, eixo_x, eixo_y, legenda="Cenário", x=None, marcadores=False):
+    """Gráfico de linhas a partir de arrays (um por cenário), sem montar DataFrames.
+
+    `series` é um dicionário {nome do cenário: valores}; sem `x`, o eixo x é
+    1..len(valores). As séries podem ser vistas de um mesmo array (ou colunas
+    de um finance_core.result.Resultado): o plotly lê-as diretamente.
+    """
+    fig = go.Figure()
+    modo = "lines+markers" if marcadores else "lines"
+    for nome, valores in series.items():
+        eixo = x if x is not None else np.arange(1, len(valores) + 1)
+        fig.add_trace(go.Scatter(x=eixo, y=valores, mode=modo, name=nome))
+    fig.update_layout(
+        title=titulo, xaxis_title=eixo_x, yaxis_title=eixo_y,
+        legend_title_text=legenda, showlegend=len(series) > 1,
+    )
+    return fig
+
+
+def grafico_leque(x, percentis, titulo, eixo_x, eixo_y):
+    """Gráfico em leque: faixas P5–P95 e P25–P75 à volta da mediana.
+
+    `percentis` é um dicionário {percentil: valores}, com as chaves 5, 25, 50, 75 e 95.
+    """
+    fig = go.Figure()
+    for baixo, alto, cor, nome in ((5, 95, "rgba(31,119,180,0.15)", "90% dos casos (P5–P95)"),
+                                   (25, 75, "rgba(31,119,180,0.35)", "50% dos casos (P25–P75)")):
+        fig.add_trace(go.Scatter(x=x, y=percentis[baixo], mode="lines", line=dict(width=0),
+                                 showlegend=False, hoverinfo="skip"))
+        fig.add_trace(go.Scatter(x=x, y=percentis[alto], mode="lines", line=dict(width=0),
+                                 fill="tonexty", fillcolor=cor, name=nome, hoverinfo="skip"))
+    fig.add_trace(go.Scatter(x=x, y=percentis[50], mode="lines", name="Mediana (P50)",
+                             line=dict(color="rgb(31,119,180)", width=3)))
+    fig.update_layout(title=titulo, xaxis_title=eixo_x, yaxis_title=eixo_y)
+    return fig
+
+
+def grafico_fronteira(nuvem, fronteira, ativos, titulo, eixo_x, eixo_y):
+    """Nuvem de carteiras, fronteira eficiente e ativos isolados, com pontos clicáveis.
+
+    `nuvem` e `fronteira` são pares (risco, retorno) de arrays e `ativos` é
+    {nome: (risco, retorno)}. Os traços ficam sempre pela ordem nuvem,
+    fronteira, ativos: o curve_number e o point_index de um evento de seleção
+    dizem qual foi a carteira clicada.
+    """
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(x=nuvem[0], y=nuvem[1], mode="markers", name="Carteiras possíveis",
+                             marker=dict(size=4, color="rgba(150,150,150,0.35)"),
+                             hovertemplate="Risco %{x:.1f}%<br>Retorno %{y:.2f}%<extra></extra>"))
+    fig.add_trace(go.Scatter(x=fronteira[0], y=fronteira[1], mode="lines+markers", name="Fronteira eficiente",
+                             line=dict(color="rgb(31,119,180)", width=3), marker=dict(size=7),
+                             hovertemplate="Risco %{x:.1f}%<br>Retorno %{y:.2f}%<extra></extra>"))
+    nomes = list(ativos)
+    fig.add_trace(go.Scatter(x=[ativos[n][0] for n in nomes], y=[ativos[n][1] for n in nomes],
+                             mode="markers+text", name="Um só ativo", text=nomes, textposition="top center",
+                             marker=dict(size=11, color="rgb(214,39,40)"),
+                             hovertemplate="%{text}<br>Risco %{x:.1f}%<br>Retorno %{y:.2f}%<extra></extra>"))
+    fig.update_layout(title=titulo, xaxis_title=eixo_x, yaxis_title=eixo_y, clickmode="event+select")
+    return fig
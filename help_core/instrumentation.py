@@ -0,0 +1,122 @@
+import logging
+import os
+import queue
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+
+import numpy as np
+
+# --- Onde guardar as medições (pode ser alterado com a variável de ambiente APP_METRICS_DB) ---
+DB_PATH = os.environ.get(
+    "APP_METRICS_DB",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "metrics.sqlite3")
+)
+LOTE_MAXIMO = 500          # registos escritos de uma só vez
+INTERVALO_ESCRITA = 2.0    # segundos entre escritas
+RETENCAO_HORAS = 168       # medições mais antigas são apagadas (a maior janela da página de administração)
+INTERVALO_LIMPEZA = 3600.0  # segundos entre limpezas das medições antigas
+
+logger = logging.getLogger(__name__)
+
+_fila = queue.Queue()
+_escritor = None
+_lock = threading.Lock()
+
+
+# --- Escrita em lote numa thread de fundo ---
+def _ligar(caminho=DB_PATH):
+    con = sqlite3.connect(caminho, timeout=10)
+    con.execute("CREATE TABLE IF NOT EXISTS timings (ts REAL, aula TEXT, fase TEXT, ms REAL)")
+    con.execute("CREATE INDEX IF NOT EXISTS idx_timings_ts ON timings (ts)")
+    return con
+
+
+def _apagar_antigas(con, agora=None):
+    """Apaga as medições com mais de RETENCAO_HORAS horas."""
+    with con:
+        con.execute("DELETE FROM timings WHERE ts < ?", ((agora or time.time()) - RETENCAO_HORAS * 3600,))
+
+
+def _escrever_lotes():
+    con = _ligar()
+    limpeza = 0.0
+    while True:
+        lote = [_fila.get()]
+        prazo = time.monotonic() + INTERVALO_ESCRITA
+        while len(lote) < LOTE_MAXIMO:
+            restante = prazo - time.monotonic()
+            if restante <= 0:
+                break
+            try:
+                lote.append(_fila.get(timeout=restante))
+            except queue.Empty:
+                break
+        try:
+            with con:
+                con.executemany("INSERT INTO timings VALUES (?, ?, ?, ?)", lote)
+            if time.monotonic() - limpeza >= INTERVALO_LIMPEZA:
+                _apagar_antigas(con)
+                limpeza = time.monotonic()
+        except sqlite3.Error as e:
+            logger.warning("Falha ao gravar %d medições: %s", len(lote), e)
+
+
+def _iniciar_escritor():
+    global _escritor
+    with _lock:
+        if _escritor is None:
+            _escritor = threading.Thread(target=_escrever_lotes, name="metrics-writer", daemon=True)
+            _escritor.start()
+
+
+def registar(aula, fase, ms):
+    """Põe uma medição na fila; a thread de fundo grava-a no SQLite."""
+    if _escritor is None:
+        _iniciar_escritor()
+    _fila.put((time.time(), aula, fase, ms))
+
+
+@contextmanager
+def medir(aula, fase):
+    """Mede o tempo de um bloco: `with medir("cap3/app3", "calculo"): ...`."""
+    inicio = time.perf_counter()
+    try:
+        yield
+    finally:
+        registar(aula, fase, (time.perf_counter() - inicio) * 1000)
+
+
+def medidor(nome_modulo):
+    """Devolve um `medir` já ligado a uma aula; ex.: fase = medidor(__name__)."""
+    aula = nome_modulo.rsplit(".app", 1)[0].replace(".", "/")
+    return lambda fase: medir(aula, fase)
+
+
+# --- Leitura para a página de administração ---
+def percentis(horas=24, caminho=DB_PATH):
+    """p50/p95/p99 (ms) por aula e fase nas últimas `horas`."""
+    if not os.path.exists(caminho):
+        return []
+    con = _ligar(caminho)
+    try:
+        linhas = con.execute(
+            "SELECT aula, fase, ms FROM timings WHERE ts >= ? ORDER BY aula, fase",
+            (time.time() - horas * 3600,)
+        ).fetchall()
+    finally:
+        con.close()
+
+    grupos = {}
+    for aula, fase, ms in linhas:
+        grupos.setdefault((aula, fase), []).append(ms)
+
+    resumo = []
+    for (aula, fase), valores in grupos.items():
+        p50, p95, p99 = np.percentile(valores, [50, 95, 99])
+        resumo.append({
+            "Aula": aula, "Fase": fase, "N": len(valores),
+            "p50 (ms)": p50, "p95 (ms)": p95, "p99 (ms)": p99
+        })
+    return resumo
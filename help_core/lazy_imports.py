@@ -0,0 +1,40 @@
+import importlib
+import sys
+import time
+
+# --- Tempo de importação (ms) de cada biblioteca carregada de forma preguiçosa ---
+TEMPOS_IMPORTACAO = {}
+
+
+class LazyModule:
+    """Substituto de um módulo que só é importado no primeiro acesso a um atributo."""
+
+    def __init__(self, nome):
+        self._nome = nome
+        self._modulo = None
+
+    def _carregar(self):
+        if self._modulo is None:
+            ja_carregado = self._nome in sys.modules
+            inicio = time.perf_counter()
+            self._modulo = importlib.import_module(self._nome)
+            if not ja_carregado:
+                TEMPOS_IMPORTACAO[self._nome] = (time.perf_counter() - inicio) * 1000
+        return self._modulo
+
+    def __getattr__(self, atributo):
+        return getattr(self._carregar(), atributo)
+
+    def __repr__(self):
+        estado = "carregado" if self._modulo is not None else "por carregar"
+        return f"<LazyModule {self._nome} ({estado})>"
+
+
+def lazy_import(nome):
+    """Devolve um LazyModule; ex.: pd = lazy_import("pandas")."""
+    return LazyModule(nome)
+
+
+def relatorio_importacoes():
+    """Lista (módulo, ms) das bibliotecas já carregadas, da mais lenta para a mais rápida."""
+    return sorted(TEMPOS_IMPORTACAO.items(), key=lambda item: item[1], reverse=True)
@@ -0,0 +1,201 @@
+import ast
+import importlib
+import json
+import os
+import pkgutil
+import threading
+import time
+from types import MappingProxyType
+
+# --- Localização do projeto e do manifesto ---
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MANIFEST_PATH = os.path.join(RAIZ, "lessons_manifest.json")
+INTERVALO_VERIFICACAO = 2.0  # segundos entre verificações das datas de modificação
+
+
+def listar_capitulos(raiz=RAIZ):
+    """Devolve as pastas capN ordenadas numericamente (cap1, cap2, cap10)."""
+    return sorted(
+        [d for d in os.listdir(raiz)
+         if d.startswith("cap") and d[3:].isdigit() and os.path.isdir(os.path.join(raiz, d))],
+        key=lambda x: int(x.replace("cap", ""))
+    )
+
+
+def ler_literal(ficheiro, nome):
+    """Extrai um dicionário literal (ex.: APP_INFO) do código-fonte sem importar o módulo."""
+    with open(ficheiro, encoding="utf-8") as f:
+        arvore = ast.parse(f.read(), filename=ficheiro)
+    for node in arvore.body:
+        if isinstance(node, ast.Assign) and any(
+            isinstance(t, ast.Name) and t.id == nome for t in node.targets
+        ):
+            return ast.literal_eval(node.value)
+    raise LookupError(f"{nome} não encontrado em {ficheiro}")
+
+
+def ler_info(ficheiro, modulo, nome):
+    """Lê o dicionário estaticamente; só importa o módulo se não for um literal."""
+    try:
+        return ler_literal(ficheiro, nome)
+    except (ValueError, LookupError):
+        return getattr(importlib.import_module(modulo), nome)
+
+
+def ler_assinatura(raiz=RAIZ):
+    """Lista (ficheiro, data de modificação) de cada chapter_info.py e app.py, pela ordem do índice."""
+    assinatura = []
+    for d in listar_capitulos(raiz):
+        ficheiros = [f"{d}/chapter_info.py"]
+        ficheiros += [
+            f"{d}/{name}/app.py"
+            for finder, name, ispkg in pkgutil.iter_modules([os.path.join(raiz, d)]) if ispkg
+        ]
+        for rel in ficheiros:
+            try:
+                mtime = os.stat(os.path.join(raiz, rel)).st_mtime_ns
+            except OSError:
+                mtime = None
+            assinatura.append((rel, mtime))
+    return tuple(assinatura)
+
+
+def ler_entrada(rel, raiz=RAIZ):
+    """Lê o CHAPTER_INFO ou APP_INFO de um ficheiro; devolve (registo, erro)."""
+    partes = rel.split("/")
+    modulo = rel[:-3].replace("/", ".")
+    try:
+        if len(partes) == 2:
+            info = ler_info(os.path.join(raiz, rel), modulo, "CHAPTER_INFO")
+            return {"title": info["title"], "description": info["description"], "path": partes[0]}, None
+        info = ler_info(os.path.join(raiz, rel), modulo, "APP_INFO")
+        return MappingProxyType({
+            "title": info["title"],
+            "description": info["description"],
+            "video": info.get("video"),
+            "module": modulo,
+            "path": f"{partes[0]}/{partes[1]}"
+        }), None
+    except Exception as e:
+        if len(partes) == 2:
+            return None, f"⚠️ Falha ao carregar {partes[0]}: {e}"
+        return None, f"⚠️ Erro ao carregar {modulo}: {e}"
+
+
+def montar_registo(assinatura, entradas):
+    """Junta as entradas lidas num índice imutável (MappingProxyType e tuplos)."""
+    capitulos = []
+    erros = []
+    atual = None
+    for rel, mtime in assinatura:
+        registo, erro = entradas[rel]
+        if rel.endswith("chapter_info.py"):
+            atual = None
+            if erro:
+                erros.append(erro)
+            else:
+                atual = dict(registo, simulations=[], errors=[])
+                capitulos.append(atual)
+        elif atual is not None:
+            if erro:
+                atual["errors"].append(erro)
+            else:
+                atual["simulations"].append(registo)
+    capitulos = tuple(
+        MappingProxyType(dict(c, simulations=tuple(c["simulations"]), errors=tuple(c["errors"])))
+        for c in capitulos
+    )
+    return MappingProxyType({"chapters": capitulos, "errors": tuple(erros)})
+
+
+def construir_registo(raiz=RAIZ):
+    """Percorre todos os capítulos e constrói o índice completo das aulas."""
+    assinatura = ler_assinatura(raiz)
+    entradas = {rel: ler_entrada(rel, raiz) for rel, mtime in assinatura}
+    return montar_registo(assinatura, entradas)
+
+
+class RegistoIncremental:
+    """Índice das aulas que se reconstrói sozinho quando um chapter_info.py ou app.py muda.
+
+    As datas de modificação são verificadas no máximo a cada INTERVALO_VERIFICACAO
+    segundos e só os ficheiros alterados voltam a ser lidos. Se o manifesto
+    existir e corresponder aos ficheiros atuais, é usado no arranque.
+    """
+
+    def __init__(self, raiz=RAIZ, manifesto=MANIFEST_PATH):
+        self._raiz = raiz
+        self._lock = threading.Lock()
+        self._entradas = {}      # ficheiro -> (mtime, (registo, erro))
+        self._assinatura = None
+        self._registo = None
+        self._verificado = 0.0
+        self._carregar_manifesto(manifesto)
+
+    def _carregar_manifesto(self, manifesto):
+        if not os.path.exists(manifesto):
+            return
+        with open(manifesto, encoding="utf-8") as f:
+            dados = json.load(f)
+        assinatura = ler_assinatura(self._raiz)
+        if dados.get("mtimes") == {rel: mtime for rel, mtime in assinatura}:
+            self._assinatura = assinatura
+            self._registo = congelar(dados)
+            self._verificado = time.monotonic()
+
+    def obter(self):
+        """Devolve o índice atual, reconstruindo apenas as entradas que mudaram."""
+        if self._registo is not None and time.monotonic() - self._verificado < INTERVALO_VERIFICACAO:
+            return self._registo
+        with self._lock:
+            assinatura = ler_assinatura(self._raiz)
+            if assinatura != self._assinatura:
+                for rel, mtime in assinatura:
+                    guardado = self._entradas.get(rel)
+                    if guardado is None or guardado[0] != mtime:
+                        self._entradas[rel] = (mtime, ler_entrada(rel, self._raiz))
+                self._entradas = {rel: self._entradas[rel] for rel, mtime in assinatura}
+                self._registo = montar_registo(
+                    assinatura, {rel: entrada for rel, (mtime, entrada) in self._entradas.items()}
+                )
+                self._assinatura = assinatura
+            self._verificado = time.monotonic()
+            return self._registo
+
+
+def congelar(dados):
+    """Converte o JSON do manifesto num índice imutável."""
+    return MappingProxyType({
+        "chapters": tuple(
+            MappingProxyType(dict(
+                c,
+                simulations=tuple(MappingProxyType(s) for s in c["simulations"]),
+                errors=tuple(c["errors"])
+            ))
+            for c in dados["chapters"]
+        ),
+        "errors": tuple(dados["errors"])
+    })
+
+
+def escrever_manifesto(caminho=MANIFEST_PATH, raiz=RAIZ):
+    """Gera o manifesto JSON com o índice das aulas (passo de build)."""
+    assinatura = ler_assinatura(raiz)
+    registo = montar_registo(assinatura, {rel: ler_entrada(rel, raiz) for rel, mtime in assinatura})
+    with open(caminho, "w", encoding="utf-8") as f:
+        json.dump(
+            dict(registo, mtimes={rel: mtime for rel, mtime in assinatura}),
+            f, ensure_ascii=False, indent=2, default=dict
+        )
+    return registo
+
+
+def carregar_registo(caminho=MANIFEST_PATH, raiz=RAIZ):
+    """Índice atual das aulas (usa o manifesto se ainda corresponder aos ficheiros)."""
+    return RegistoIncremental(raiz, caminho).obter()
+
+
+if __name__ == "__main__":
+    registo = escrever_manifesto()
+    total = sum(len(c["simulations"]) for c in registo["chapters"])
+    print(f"Manifesto escrito em {MANIFEST_PATH}: {len(registo['chapters'])} capítulos, {total} simulações.")
@@ -0,0 +1,71 @@
+import importlib
+import logging
+import threading
+import time
+
+from help_core.lesson_registry import carregar_registo
+
+logger = logging.getLogger(__name__)
+
+# --- Bibliotecas pesadas importadas antes da thread (nunca por duas threads ao mesmo tempo) ---
+BIBLIOTECAS = ("pandas", "pyarrow", "plotly.express", "plotly.graph_objects")
+
+# --- Um só lock para importar aulas, partilhado pela thread de pré-aquecimento e pelo main.py ---
+_lock_importacao = threading.Lock()
+
+
+def importar_aula(nome):
+    """Importa uma aula sem se cruzar com outra thread a importar aulas.
+
+    Se duas threads importarem as mesmas dependências ao mesmo tempo, o Python
+    pode entregar a uma delas um módulo a meio da inicialização. Passa sempre
+    pelo lock, mesmo que a aula já esteja em sys.modules: enquanto a outra
+    thread a importa, ela já lá está, mas ainda sem run() nem aquecer().
+    """
+    with _lock_importacao:
+        return importlib.import_module(nome)
+
+
+def importar_bibliotecas(nomes=BIBLIOTECAS):
+    """Importa, na thread atual e por ordem, as bibliotecas que as aulas carregam de forma preguiçosa."""
+    with _lock_importacao:
+        for nome in nomes:
+            try:
+                importlib.import_module(nome)
+            except ImportError as e:
+                logger.warning("Biblioteca %s indisponível para o pré-aquecimento: %s", nome, e)
+
+
+def aquecer_aulas(registo=None):
+    """Importa todas as aulas registadas e corre o aquecer() das que o têm.
+
+    Cada aquecer() calcula os resultados e gráficos com os valores por omissão
+    dos widgets, guardando-os na cache partilhada (st.cache_data). Devolve o
+    tempo gasto (ms) por aula.
+    """
+    registo = registo or carregar_registo()
+    tempos = {}
+    for capitulo in registo["chapters"]:
+        for sim in capitulo["simulations"]:
+            inicio = time.perf_counter()
+            try:
+                modulo = importar_aula(sim["module"])
+                if hasattr(modulo, "aquecer"):
+                    modulo.aquecer()
+            except Exception:
+                logger.exception("Falha no pré-aquecimento de %s", sim["module"])
+                continue
+            tempos[sim["module"]] = (time.perf_counter() - inicio) * 1000
+    return tempos
+
+
+def iniciar_aquecimento(registo=None):
+    """Lança o pré-aquecimento numa thread, para não atrasar a primeira página.
+
+    O pandas, o pyarrow e o plotly são importados antes, nesta thread: assim a
+    thread de fundo e a página nunca os importam ao mesmo tempo.
+    """
+    importar_bibliotecas()
+    thread = threading.Thread(target=aquecer_aulas, args=(registo,), name="prewarm", daemon=True)
+    thread.start()
+    return thread
@@ -0,0 +1,159 @@
+import os
+import pickle
+import sys
+import threading
+import time
+
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+# --- Configuração ---
+TEMPO_INATIVIDADE = float(os.environ.get("APP_SESSION_IDLE_MINUTES", 20)) * 60  # segundos
+INTERVALO_LIMPEZA = 60.0  # segundos entre varrimentos do registo de sessões
+INTERVALO_MEDICAO = 60.0  # segundos entre medições da pegada de uma sessão
+
+# --- Registo partilhado por todas as sessões do processo (só leitura fora da própria sessão) ---
+_sessoes = {}   # session_id -> {"aulas": {...}, "tocadas": {...}, "visto": ts, "pegada": {...}, "medido": {...}}
+_lock = threading.Lock()
+_estatisticas = {"expulsoes": 0, "bytes_libertados": 0}
+_ultima_limpeza = 0.0
+
+
+class EstadoAula(dict):
+    """Estado de uma aula numa sessão: `estado.index` ou `estado["index"]`."""
+
+    def __getattr__(self, nome):
+        try:
+            return self[nome]
+        except KeyError:
+            raise AttributeError(nome) from None
+
+    def __setattr__(self, nome, valor):
+        self[nome] = valor
+
+    def __delattr__(self, nome):
+        del self[nome]
+
+
+def _id_sessao():
+    ctx = get_script_run_ctx()
+    return ctx.session_id if ctx else "local"
+
+
+def _sessao():
+    """Dicionários desta sessão, guardados em st.session_state e no registo partilhado."""
+    if "_aulas" not in st.session_state:
+        st.session_state["_aulas"] = {}
+        st.session_state["_aulas_tocadas"] = {}
+    entrada = {
+        "aulas": st.session_state["_aulas"],
+        "tocadas": st.session_state["_aulas_tocadas"],
+        "visto": time.time(),
+    }
+    with _lock:
+        anterior = _sessoes.get(_id_sessao())
+        entrada["pegada"] = anterior["pegada"] if anterior else {}
+        entrada["medido"] = anterior["medido"] if anterior else {}
+        _sessoes[_id_sessao()] = entrada
+    return entrada
+
+
+def estado_aula(nome_modulo):
+    """Estado isolado da aula (ex.: estado = estado_aula(__name__)); marca a aula como usada agora."""
+    aula = nome_modulo.rsplit(".app", 1)[0].replace(".", "/")
+    sessao = _sessao()
+    sessao["tocadas"][aula] = time.time()
+    return sessao["aulas"].setdefault(aula, EstadoAula())
+
+
+def tamanho(valor):
+    """Tamanho aproximado (bytes) de um valor guardado no estado.
+
+    Os dicionários são medidos valor a valor, para que um valor que não se
+    consegue serializar não esconda o tamanho dos restantes.
+    """
+    if isinstance(valor, dict):
+        return sys.getsizeof(valor) + sum(tamanho(v) for v in list(valor.values()))
+    try:
+        return len(pickle.dumps(valor, protocol=pickle.HIGHEST_PROTOCOL))
+    except Exception:
+        return sys.getsizeof(valor)
+
+
+def medir_sessao(agora=None):
+    """Atualiza a pegada de memória desta sessão (total e por aula) e devolve-a.
+
+    Mede no máximo uma vez a cada INTERVALO_MEDICAO segundos, e só volta a
+    medir as aulas usadas desde a última medição.
+    """
+    agora = agora or time.time()
+    sessao = _sessao()
+    medido = sessao["medido"]
+    if sessao["pegada"] and agora - medido.get("_sessao", 0.0) < INTERVALO_MEDICAO:
+        return sessao["pegada"]
+    anteriores = sessao["pegada"].get("aulas", {})
+    por_aula = {}
+    for aula, estado in list(sessao["aulas"].items()):
+        if aula in anteriores and sessao["tocadas"].get(aula, agora) <= medido.get(aula, 0.0):
+            por_aula[aula] = anteriores[aula]
+        else:
+            por_aula[aula] = tamanho(estado)
+            medido[aula] = agora
+    total = sum(tamanho(v) for k, v in st.session_state.to_dict().items() if k != "_aulas") + sum(por_aula.values())
+    medido["_sessao"] = agora
+    sessao["pegada"] = {"total": total, "aulas": por_aula}
+    return sessao["pegada"]
+
+
+def expulsar_inativas(atual=None, limite=TEMPO_INATIVIDADE, agora=None):
+    """Apaga o estado das aulas desta sessão sem uso há mais de `limite` segundos.
+
+    Corre na execução da própria sessão: o st.session_state de uma sessão só é
+    alterado pela thread do seu script. A aula `atual` (ex.: "cap1/app1", a da
+    página aberta) nunca é apagada: o aluno pode ficar nela mais do que o
+    limite e o clique seguinte ainda precisa do estado. As sessões que
+    deixaram de correr saem do registo partilhado (o Streamlit liberta o resto).
+    """
+    global _ultima_limpeza
+    agora = agora or time.time()
+    sessao = _sessao()
+    inativas = [aula for aula, tocada in sessao["tocadas"].items() if agora - tocada > limite and aula != atual]
+    if inativas:
+        # A pegada é substituída (não alterada) porque resumo_memoria a lê noutra thread
+        pegada = sessao["pegada"].get("aulas", {})
+        for aula in inativas:
+            estado = sessao["aulas"].pop(aula, None)
+            sessao["tocadas"].pop(aula, None)
+            sessao["medido"].pop(aula, None)
+            if estado is not None:
+                with _lock:
+                    _estatisticas["expulsoes"] += 1
+                    _estatisticas["bytes_libertados"] += pegada.get(aula) or tamanho(estado)
+        if pegada:
+            restantes = {aula: n for aula, n in pegada.items() if aula not in inativas}
+            libertados = sum(pegada.values()) - sum(restantes.values())
+            sessao["pegada"] = {"total": sessao["pegada"]["total"] - libertados, "aulas": restantes}
+
+    if agora - _ultima_limpeza < INTERVALO_LIMPEZA:
+        return
+    _ultima_limpeza = agora
+    with _lock:
+        for session_id, outra in list(_sessoes.items()):
+            if agora - outra["visto"] > 2 * limite:
+                del _sessoes[session_id]
+
+
+def resumo_memoria():
+    """Totais para a página de administração."""
+    with _lock:
+        pegadas = [s["pegada"] for s in _sessoes.values() if s["pegada"]]
+        por_aula = {}
+        for pegada in pegadas:
+            for aula, n in pegada["aulas"].items():
+                por_aula[aula] = por_aula.get(aula, 0) + n
+        return {
+            "sessoes": len(_sessoes),
+            "bytes_total": sum(p["total"] for p in pegadas),
+            "bytes_por_aula": por_aula,
+            **_estatisticas,
+        }
@@ -1,38 +1,63 @@
 import streamlit as st
 import importlib
-import os
-import pkgutil
+import sys
 from videos_link import MAIN_VIDEO_URL
+from help_core.lesson_registry import RegistoIncremental
+from help_core.prewarm import iniciar_aquecimento, importar_aula
+from help_core.instrumentation import medir
+from help_core.session_memory import expulsar_inativas, medir_sessao
 
 st.set_page_config(page_title="Aprender a Gerir o Meu Dinheiro", page_icon="💸", layout="centered")
 
 
-# --- Encontrar capítulos disponíveis ---
+# --- Índice das aulas (um por processo; só relê os ficheiros que mudaram) ---
 @st.cache_resource
-def load_chapters():
-    chapters = []
-    chapter_dirs = sorted(
-        [d for d in os.listdir() if d.startswith("cap") and os.path.isdir(d)],
-        key=lambda x: int(x.replace("cap", ""))  # Ordena cap1, cap2, cap10 corretamente
-    )
-    for d in chapter_dirs:
-        try:
-            info_module = importlib.import_module(f"{d}.chapter_info")
-            chapter_info = info_module.CHAPTER_INFO
-            chapter_info["path"] = d
-            chapters.append(chapter_info)
-        except Exception as e:
-            st.warning(f"⚠️ Falha ao carregar {d}: {e}")
-    return chapters
-
-chapters = load_chapters()
-
-
-# --- Estado da app ---
-if "selected_chapter" not in st.session_state:
-    st.session_state.selected_chapter = None
-if "selected_simulation" not in st.session_state:
-    st.session_state.selected_simulation = None
+def load_registry():
+    return RegistoIncremental()
+
+
+# --- Pré-aquecimento: importa as aulas e calcula os valores por omissão (uma vez por processo) ---
+@st.cache_resource
+def prewarm(_registry):
+    return iniciar_aquecimento(_registry)
+
+registry = load_registry().obter()
+prewarm(registry)
+chapters = registry["chapters"]
+for erro in registry["errors"]:
+    st.warning(erro)
+
+
+# --- Libertar o estado das aulas sem uso nesta sessão (menos o da página aberta) ---
+expulsar_inativas(st.query_params.get("pagina"))
+
+
+# --- Rotas: ?pagina=cap3 (capítulo) ou ?pagina=cap3/app4 (simulação) ---
+chapters_by_path = {c["path"]: c for c in chapters}
+simulations_by_path = {s["path"]: (c, s) for c in chapters for s in c["simulations"]}
+
+
+def ir_para(pagina=None):
+    """Muda a página no URL; corre antes do script, por isso basta uma execução."""
+    if pagina:
+        st.query_params["pagina"] = pagina
+    else:
+        st.query_params.clear()
+
+
+pagina = st.query_params.get("pagina")
+selected_chapter = None
+selected_simulation = None
+if pagina == "admin":
+    # Página escondida: não aparece no menu
+    importlib.import_module("help_core.admin_page").run()
+    st.stop()
+elif pagina in simulations_by_path:
+    selected_chapter, selected_simulation = simulations_by_path[pagina]
+elif pagina in chapters_by_path:
+    selected_chapter = chapters_by_path[pagina]
+elif pagina:
+    st.warning(f"⚠️ A página '{pagina}' não existe. Escolhe um tema no menu.")
 
 # ========================================================
 # 🧭 SIDEBAR – ÍNDICE AUTOMÁTICO
@@ -40,35 +65,15 @@ if "selected_simulation" not in st.session_state:
 st.sidebar.header("📚 Temas a Aprender")
 
 for c in chapters:
-    with st.sidebar.expander(c["title"], expanded=False):
-        # Detetar simulações do capítulo
-        sims = []
-        for finder, name, ispkg in pkgutil.iter_modules([c["path"]]):
-            if ispkg:
-                app_path = f"{c['path']}.{name}.app"
-                try:
-                    app_module = importlib.import_module(app_path)
-                    sims.append({
-                        "title": app_module.APP_INFO["title"],
-                        "module": app_path
-                    })
-                except Exception:
-                    pass
-
+    with st.sidebar.expander(c["title"], expanded=c is selected_chapter):
         # Mostrar botões das simulações
-        for s in sims:
-            if st.button(f"▶️ {s['title']}", key=f"{c['path']}_{s['title']}"):
-                st.session_state.selected_chapter = c
-                st.session_state.selected_simulation = s
-                st.rerun()
+        for s in c["simulations"]:
+            st.button(f"▶️ {s['title']}", key=f"{c['path']}_{s['title']}", on_click=ir_para, args=(s["path"],))
 
 # Botão para voltar
-if st.session_state.selected_chapter or st.session_state.selected_simulation:
+if selected_chapter or selected_simulation:
     st.sidebar.divider()
-    if st.sidebar.button("⬅️ Voltar ao início"):
-        st.session_state.selected_chapter = None
-        st.session_state.selected_simulation = None
-        st.rerun()
+    st.sidebar.button("⬅️ Voltar ao início", on_click=ir_para)
 
 # Créditos
 st.sidebar.divider()
@@ -79,60 +84,48 @@ st.sidebar.markdown("Desenvolvido por **Pedro Maltez**")
 # ========================================================
 
 # Caso 1 — Simulação ativa
-if st.session_state.selected_simulation:
-    sim = st.session_state.selected_simulation
-    chapter = st.session_state.selected_chapter
-    app_module = importlib.import_module(sim["module"])
+if selected_simulation:
+    sim = selected_simulation
+    chapter = selected_chapter
+    if sim["module"] in sys.modules:
+        app_module = importar_aula(sim["module"])
+    else:
+        with medir(sim["path"], "importacao"):
+            app_module = importar_aula(sim["module"])
 
     st.markdown(f"### {chapter['title']}")
-    app_module.run()
+    with medir(sim["path"], "run"):
+        app_module.run()
+    medir_sessao()
 
     # Botão voltar no fim da simulação
     st.divider()
-    if st.button("⬅️ Voltar ao início"):
-        st.session_state.selected_chapter = None
-        st.session_state.selected_simulation = None
-        st.rerun()
+    st.button("⬅️ Voltar ao início", on_click=ir_para)
 
 # Caso 2 — Capítulo selecionado, mas sem simulação
-elif st.session_state.selected_chapter:
+elif selected_chapter:
 
-    chapter = st.session_state.selected_chapter
+    chapter = selected_chapter
     st.header(f"📘 {chapter['title']}")
     st.markdown(chapter["description"])
     st.divider()
 
-    sims = []
-    for finder, name, ispkg in pkgutil.iter_modules([chapter["path"]]):
-        if ispkg:
-            app_path = f"{chapter['path']}.{name}.app"
-            try:
-                app_module = importlib.import_module(app_path)
-                sims.append({
-                    "title": app_module.APP_INFO["title"],
-                    "description": app_module.APP_INFO["description"],
-                    "module": app_path
-                })
-            except Exception as e:
-                st.warning(f"⚠️ Erro ao carregar {app_path}: {e}")
+    sims = chapter["simulations"]
+    for erro in chapter["errors"]:
+        st.warning(erro)
 
     if sims:
         for s in sims:
             with st.container(border=True):
                 st.markdown(f"#### {s['title']}")
                 st.markdown(s["description"])
-                if st.button(f"▶️ Iniciar {s['title']}", key=s["module"]):
-                    st.session_state.selected_simulation = s
-                    st.rerun()
+                st.button(f"▶️ Iniciar {s['title']}", key=s["module"], on_click=ir_para, args=(s["path"],))
     else:
         st.info("🚧 Ainda não há simulações neste capítulo.")
 
     # Botão voltar no fim da simulação
     st.divider()
-    if st.button("⬅️ Voltar ao início"):
-        st.session_state.selected_chapter = None
-        st.session_state.selected_simulation = None
-        st.rerun()
+    st.button("⬅️ Voltar ao início", on_click=ir_para)
 
 # Caso 3 — Página inicial (nenhum capítulo nem simulação)
 else:
@@ -156,6 +149,4 @@ else:
         with st.container(border=True):
             st.markdown(f"### {c['title']}")
             st.success(c["description"])
-            if st.button(f"➡️ Abrir {c['title']}", key=c["path"]):
-                st.session_state.selected_chapter = c
-                st.rerun()
+            st.button(f"➡️ Abrir {c['title']}", key=c["path"], on_click=ir_para, args=(c["path"],))
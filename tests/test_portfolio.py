@@ -0,0 +1,51 @@
+import itertools
+
+import numpy as np
+import pytest
+
+from cap3.app2.app import CORRELACOES, INVESTIMENTOS
+from finance_core.portfolio import espelhar_edicoes, fator_cholesky, preparar_correlacao
+
+ATIVOS = len(CORRELACOES)
+FORA_DA_DIAGONAL = [(i, j) for i, j in itertools.product(range(ATIVOS), repeat=2) if i != j]
+
+
+def editar(i, j, valor):
+    tabela = [list(linha) for linha in CORRELACOES]
+    tabela[i][j] = valor
+    return tabela
+
+
+@pytest.mark.parametrize("valor", [-1.0, 1.0])
+@pytest.mark.parametrize("i, j", FORA_DA_DIAGONAL)
+def test_correlacao_extrema_numa_celula_tem_fator_de_cholesky(i, j, valor):
+    correlacao, _ = preparar_correlacao(CORRELACOES, editar(i, j, valor))
+    fator = fator_cholesky(tuple(v / 100 for v in INVESTIMENTOS["Volatilidade anual (%)"]), correlacao, 12)
+    assert np.isfinite(fator).all()
+
+
+@pytest.mark.parametrize("valor", np.round(np.arange(-1, 1.0001, 0.05), 2))
+def test_qualquer_edicao_de_uma_celula_e_definida_positiva(valor):
+    for i, j in FORA_DA_DIAGONAL:
+        correlacao, _ = preparar_correlacao(CORRELACOES, editar(i, j, valor))
+        np.linalg.cholesky(np.array(correlacao))
+
+
+def test_edicao_de_um_lado_e_espelhada_sem_aviso():
+    correlacao, ajustada = preparar_correlacao(CORRELACOES, editar(1, 3, 0.3))
+    assert correlacao[1][3] == correlacao[3][1] == 0.3
+    assert not ajustada
+
+
+def test_celula_apagada_volta_ao_valor_original():
+    espelhada = espelhar_edicoes(CORRELACOES, editar(2, 3, None))
+    assert espelhada[2][3] == espelhada[3][2] == CORRELACOES[2][3]
+
+
+def test_correlacoes_impossiveis_sao_ajustadas_com_aviso():
+    # Fundos Mistos e Ações sobem juntos, mas Obrigações opostas a um e iguais ao outro
+    tabela = editar(1, 2, 1.0)
+    tabela[1][3] = -1.0
+    correlacao, ajustada = preparar_correlacao(CORRELACOES, tabela)
+    assert ajustada
+    np.linalg.cholesky(np.array(correlacao))
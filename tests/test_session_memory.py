@@ -0,0 +1,47 @@
+import time
+
+from streamlit.testing.v1 import AppTest
+
+from help_core.session_memory import TEMPO_INATIVIDADE
+
+
+def aula_com_estado():
+    import streamlit as st
+
+    from help_core.session_memory import estado_aula, expulsar_inativas
+
+    # Como no main.py: a expulsão corre antes de a aula tocar no seu estado
+    expulsar_inativas(st.query_params.get("pagina"), agora=st.session_state.get("agora"))
+    if st.query_params.get("pagina") == "cap1/app1":
+        estado = estado_aula("cap1.app1.app")
+        if "pergunta" not in estado:
+            # Cada estado novo tem uma pergunta diferente, como os quizzes baralhados
+            st.session_state["perguntas"] = st.session_state.get("perguntas", 6) + 1
+            estado.pergunta = st.session_state["perguntas"]
+        st.text(str(estado.pergunta))
+    st.text(str(sorted(st.session_state["_aulas"])))
+
+
+def test_aula_aberta_nao_perde_o_estado_depois_do_limite():
+    app = AppTest.from_function(aula_com_estado)
+    app.query_params["pagina"] = "cap1/app1"
+    app.run()
+    assert app.text[0].value == "7"
+
+    # O aluno ficou na mesma aula mais do que o limite e volta a clicar
+    app.session_state["agora"] = time.time() + TEMPO_INATIVIDADE + 60
+    app.run()
+    assert not app.exception
+    assert app.text[0].value == "7"
+
+
+def test_aula_inativa_noutra_pagina_e_apagada():
+    app = AppTest.from_function(aula_com_estado)
+    app.query_params["pagina"] = "cap1/app1"
+    app.run()
+
+    app.query_params["pagina"] = "cap1"
+    app.session_state["agora"] = time.time() + TEMPO_INATIVIDADE + 60
+    app.run()
+    assert not app.exception
+    assert app.text[-1].value == "[]"